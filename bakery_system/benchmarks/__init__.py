@@ -0,0 +1,15 @@
+"""
+Benchmarks for the bakery system
+
+Run from the bakery_system folder as modules, e.g.
+    python -m benchmarks.synthetic bench_data/1k --employees 1000 --weeks 52
+    python -m benchmarks.suite bench_data/1k --output results.json --baseline baseline.json
+    python -m benchmarks.bench_grid_format 10000
+"""
+import sys
+from pathlib import Path
+
+# The application modules are flat files in src/, imported by bare name
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
@@ -0,0 +1,76 @@
+"""
+Time the grid TXT renderer against tabulate
+
+Usage: python -m benchmarks.bench_grid_format [rows ...]
+Defaults to 10k, 100k and 1M wage report rows.
+"""
+import io
+import random
+import sys
+import time
+
+from . import SRC_DIR  # noqa: F401  (puts src/ on the path)
+from tabulate import tabulate
+from grid_format import write_grid
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+POSITIONS = ["Baker", "Cashier", "Manager", "Pastry Chef", "Cleaner"]
+
+
+def wage_rows(count: int):
+    """Rows shaped like generate_wage_report output"""
+    rng = random.Random(count)
+    rows = []
+    for i in range(count):
+        base_rate = rng.choice([11.44, 12.0, 13.5, 15.25])
+        weekend_rate = round(base_rate * 1.5, 2)
+        regular = float(rng.randint(0, 40))
+        weekend = float(rng.randint(0, 16))
+        rows.append({
+            'Employee ID': f"E{i + 1:05d}",
+            'Name': f"Staff {i}",
+            'Position': rng.choice(POSITIONS),
+            'Base Rate': base_rate,
+            'Weekend Rate': weekend_rate,
+            'Regular Hours': regular,
+            'Weekend Hours': weekend,
+            'Total Hours': regular + weekend,
+            'Regular Pay': regular * base_rate,
+            'Weekend Pay': weekend * weekend_rate,
+            'Total Pay': round(regular * base_rate + weekend * weekend_rate, 2)
+        })
+    return rows
+
+
+def time_tabulate(headers, rows):
+    out = io.StringIO()
+    start = time.perf_counter()
+    out.write(tabulate(rows, headers=headers, tablefmt="grid"))
+    out.write('\n')
+    return time.perf_counter() - start, out.getvalue()
+
+
+def time_write_grid(headers, rows):
+    out = io.StringIO()
+    start = time.perf_counter()
+    write_grid(out, headers, rows)
+    return time.perf_counter() - start, out.getvalue()
+
+
+def main(sizes) -> None:
+    print(f"{'rows':>10} {'tabulate (s)':>14} {'write_grid (s)':>16} {'speedup':>9}")
+    for size in sizes:
+        data = wage_rows(size)
+        headers = list(data[0].keys())
+        rows = [row.values() for row in data]
+
+        slow, expected = time_tabulate(headers, rows)
+        fast, actual = time_write_grid(headers, rows)
+        if actual != expected:
+            raise SystemExit(f"Output differs from tabulate at {size} rows")
+
+        print(f"{size:>10} {slow:>14.2f} {fast:>16.2f} {slow / fast:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
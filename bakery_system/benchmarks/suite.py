@@ -0,0 +1,253 @@
+"""
+Time the main DataManager and Reports operations against a data folder
+
+Usage: python -m benchmarks.suite FOLDER [--backend csv|sqlite] [--repeat N] [--calls N]
+           [--output results.json] [--baseline baseline.json] [--save-baseline] [--tolerance 0.2]
+
+Make the folder with benchmarks.synthetic first. Schedules saved while timing
+are deleted again, so the folder can be reused between runs. Results are
+written as JSON; given a baseline file, each operation's fastest warm call is
+compared with the baseline's (the minimum is far steadier than the median
+over a handful of calls) and the exit status is 1 if any got slower than the
+tolerance allows.
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import SRC_DIR  # noqa: F401  (puts src/ on the path)
+from data_manager import DataManager
+from dates import date_ordinal, format_ordinal
+from reports import Reports
+from storage import STORAGE_BACKENDS
+
+# Weeks covered by the ranged schedule query and wage report
+REPORT_WEEKS = 4
+
+
+def _checked(result: Tuple) -> Any:
+    """Return the value after the success flag of a (success, ..., message) result, raising if it failed"""
+    if not result[0]:
+        raise RuntimeError(result[-1])
+    return result[1]
+
+
+def time_operation(operation: Callable[[int], Any], calls: int) -> Dict[str, float]:
+    """
+    Time calls of an operation, keeping the first (cold cache) call apart
+
+    Args:
+        operation (Callable[[int], Any]): Called with the call number
+        calls (int): Number of calls, including the cold one
+
+    Returns:
+        Dict[str, float]: Call count, the cold call and min/median/mean/max of the rest, in ms
+    """
+    times = []
+    for i in range(calls):
+        start = time.perf_counter()
+        operation(i)
+        times.append((time.perf_counter() - start) * 1000)
+
+    warm = times[1:] or times
+    return {
+        'calls': calls,
+        'cold_ms': round(times[0], 3),
+        'min_ms': round(min(warm), 3),
+        'median_ms': round(statistics.median(warm), 3),
+        'mean_ms': round(statistics.fmean(warm), 3),
+        'max_ms': round(max(warm), 3),
+    }
+
+
+def run_suite(folder: Path, backend: str = "csv", repeat: int = 5, calls: int = 200,
+              seed: int = 0) -> Dict[str, Any]:
+    """
+    Run every timed operation against a data folder
+
+    Args:
+        folder (Path): Data folder made by benchmarks.synthetic
+        backend (str): Storage backend the folder was written with
+        repeat (int): Calls of whole-dataset operations (reads, reports, exports)
+        calls (int): Calls of single-record operations (lookups, saves, deletes)
+        seed (int): Random seed for picking employees
+
+    Returns:
+        Dict[str, Any]: {"meta": {...}, "results": {operation: timings}}
+    """
+    folder = Path(folder)
+    manager = DataManager(str(folder), backend)
+    _checked(manager.setup_data_folder())
+    reports = Reports(manager)
+    reports.reports_folder = folder / "reports"
+    reports.setup_reports_folder()
+    rng = random.Random(seed)
+
+    try:
+        # Find the data's size and date range with one untimed read
+        employees = _checked(manager.get_all_employees())
+        schedules = _checked(manager.get_schedules())
+        if not employees or not schedules:
+            raise RuntimeError(f"No employees or schedules in {folder}")
+        employee_ids = [emp.staff_id for emp in employees]
+        weeks = sorted({date_ordinal(s.week_start_date) for s in schedules} - {None})
+        range_start = format_ordinal(weeks[0])
+        range_end = format_ordinal(weeks[min(len(weeks), REPORT_WEEKS) - 1])
+        meta = {
+            'folder': str(folder),
+            'backend': backend,
+            'employees': len(employees),
+            'schedules': len(schedules),
+            'weeks': len(weeks),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+        }
+        del employees, schedules
+
+        # Fresh managers so the first timed call of each read is cold
+        manager.storage.close()
+        manager = DataManager(str(folder), backend)
+        reports.data_manager = manager
+
+        results = {}
+        picks = [rng.choice(employee_ids) for _ in range(calls)]
+        results['get_employee'] = time_operation(
+            lambda i: _checked(manager.get_employee(picks[i])), calls)
+        results['get_schedules'] = time_operation(
+            lambda i: _checked(manager.get_schedules()), repeat)
+        results['get_schedules_employee'] = time_operation(
+            lambda i: _checked(manager.get_schedules(employee_id=picks[i % calls])), calls)
+        results['get_schedules_range'] = time_operation(
+            lambda i: _checked(manager.get_schedules(start_date=range_start, end_date=range_end)), repeat)
+
+        # Save schedules, then delete the same ones so the folder ends as it started
+        saved = []
+
+        def save(i: int) -> None:
+            schedule_id = manager.generate_schedule_id()
+            _checked(manager.save_schedule({
+                'schedule_id': schedule_id, 'employee_id': picks[i], 'week_start': range_start,
+                'mon': 8, 'tue': 8, 'wed': 8, 'thu': 8, 'fri': 4, 'sat': 4, 'sun': 0,
+            }))
+            saved.append(schedule_id)
+
+        results['save_schedule'] = time_operation(save, calls)
+        results['delete_schedule'] = time_operation(
+            lambda i: _checked(manager.delete_schedule(saved[i])), len(saved))
+
+        wage_report = []
+
+        def generate_wage_report(i: int) -> None:
+            wage_report[:] = _checked(reports.generate_wage_report(range_start, range_end))
+
+        results['generate_wage_report'] = time_operation(generate_wage_report, repeat)
+        results['create_staff_list'] = time_operation(
+            lambda i: _checked(reports.create_staff_list()), repeat)
+
+        # Export the wage report, removing each file as it is written
+        def export(exporter: Callable) -> Callable[[int], None]:
+            def run(i: int) -> None:
+                path = _checked(exporter(wage_report, "benchmark_wage_report"))
+                Path(path).unlink()
+            return run
+
+        results['export_to_csv'] = time_operation(export(reports.export_to_csv), repeat)
+        results['export_to_txt'] = time_operation(export(reports.export_to_txt), repeat)
+        meta['wage_report_rows'] = len(wage_report)
+    finally:
+        manager.storage.close()
+
+    return {'meta': meta, 'results': results}
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """
+    Compare each operation's fastest warm call against a baseline run
+
+    Returns:
+        List[Dict[str, Any]]: One row per operation in either run, with the ratio of
+        the minimums and whether it regressed by more than the tolerance
+    """
+    rows = []
+    current, previous = results['results'], baseline.get('results', {})
+    for operation in list(current) + [op for op in previous if op not in current]:
+        now = current.get(operation, {}).get('min_ms')
+        before = previous.get(operation, {}).get('min_ms')
+        ratio = now / before if now is not None and before else None
+        rows.append({
+            'operation': operation,
+            'baseline_ms': before,
+            'current_ms': now,
+            'ratio': round(ratio, 3) if ratio is not None else None,
+            'regressed': ratio is not None and ratio > 1 + tolerance,
+        })
+    return rows
+
+
+def print_results(results: Dict[str, Any], comparison: Optional[List[Dict[str, Any]]] = None) -> None:
+    meta = results['meta']
+    print(f"{meta['employees']} employees, {meta['schedules']} schedules over {meta['weeks']} weeks "
+          f"({meta['backend']}, Python {meta['python']})")
+
+    ratios = {row['operation']: row for row in comparison or []}
+    print(f"{'operation':<24} {'calls':>6} {'cold ms':>10} {'min ms':>10} {'median ms':>10}"
+          + (f" {'base min':>10} {'ratio':>7}" if comparison else ""))
+    for operation, timing in results['results'].items():
+        line = (f"{operation:<24} {timing['calls']:>6} {timing['cold_ms']:>10.3f} "
+                f"{timing['min_ms']:>10.3f} {timing['median_ms']:>10.3f}")
+        row = ratios.get(operation)
+        if row is not None and row['ratio'] is not None:
+            line += f" {row['baseline_ms']:>10.3f} {row['ratio']:>6.2f}x" + ("  SLOWER" if row['regressed'] else "")
+        print(line)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Time bakery operations against a data folder")
+    parser.add_argument("folder", help="Data folder made by benchmarks.synthetic")
+    parser.add_argument("--backend", choices=sorted(STORAGE_BACKENDS), default="csv",
+                        help="Storage backend (default: csv)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Calls of whole-dataset operations (default: 5)")
+    parser.add_argument("--calls", type=int, default=200,
+                        help="Calls of single-record operations (default: 200)")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="Compare against the results in this JSON file")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Write the results to the --baseline file instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed slowdown over the baseline minimum (default: 0.2 = 20%%)")
+    args = parser.parse_args()
+
+    if args.save_baseline and not args.baseline:
+        parser.error("--save-baseline needs --baseline")
+
+    results = run_suite(Path(args.folder), args.backend, max(args.repeat, 2), max(args.calls, 2))
+
+    comparison = None
+    if args.baseline and args.save_baseline:
+        Path(args.baseline).write_text(json.dumps(results, indent=2))
+    elif args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        comparison = results['comparison'] = compare(results, baseline, args.tolerance)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+
+    print_results(results, comparison)
+    if comparison and any(row['regressed'] for row in comparison):
+        print(f"\nSlower than the baseline by more than {args.tolerance:.0%}: "
+              + ", ".join(row['operation'] for row in comparison if row['regressed']))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
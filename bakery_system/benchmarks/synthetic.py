@@ -0,0 +1,157 @@
+"""
+Generate synthetic bakery data folders for benchmarking
+
+Usage: python -m benchmarks.synthetic FOLDER [--size 1k|10k|100k]
+           [--employees N] [--weeks N] [--positions N] [--backend csv|sqlite] [--seed N]
+
+Every employee gets one schedule per week, so a folder holds employees * weeks
+schedules: 1k employees over 52 weeks is 52,000 rows, 100k over 520 weeks is
+52 million. The data is written through the storage backends, so it is in
+exactly the layout the application reads.
+"""
+import argparse
+import random
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from . import SRC_DIR  # noqa: F401  (puts src/ on the path)
+from employee import Employee
+from schedule import DAYS, Schedule
+from storage import STORAGE_BACKENDS, create_storage
+
+# Named sizes as (employees, weeks of schedules)
+SIZES: Dict[str, Tuple[int, int]] = {
+    '1k': (1_000, 52),
+    '10k': (10_000, 104),
+    '100k': (100_000, 520),
+}
+
+FIRST_NAMES = ["aoife", "barry", "ciara", "declan", "eimear", "fionn", "grainne", "hugh",
+               "isolde", "jack", "kate", "liam", "maeve", "niall", "orla", "padraig",
+               "roisin", "sean", "tadhg", "una"]
+LAST_NAMES = ["byrne", "doyle", "keane", "kelly", "lyons", "murphy", "nolan", "obrien",
+              "quinn", "ryan", "smith", "walsh"]
+BASE_POSITIONS = ["Head Baker", "Baker", "Pastry Chef", "Counter Staff", "Kitchen Assistant"]
+
+# Weekly rotas the schedules are drawn from, as hours for Monday to Sunday
+SHIFT_PATTERNS = [
+    (8.0, 8.0, 8.0, 8.0, 8.0, 0.0, 0.0),
+    (0.0, 0.0, 8.0, 8.0, 8.0, 8.0, 8.0),
+    (4.0, 4.0, 4.0, 4.0, 4.0, 0.0, 0.0),
+    (0.0, 0.0, 0.0, 0.0, 6.0, 8.0, 8.0),
+    (6.0, 6.0, 0.0, 6.0, 6.0, 4.0, 0.0),
+    (10.0, 10.0, 10.0, 10.0, 0.0, 0.0, 0.0),
+]
+
+
+def make_positions(count: int, rng: random.Random) -> Dict[str, Dict[str, float]]:
+    """Wage rates for count positions: the usual bakery roles, then numbered variants"""
+    rates = {}
+    for i in range(count):
+        name = BASE_POSITIONS[i % len(BASE_POSITIONS)]
+        if i >= len(BASE_POSITIONS):
+            name = f"{name} {i // len(BASE_POSITIONS) + 1}"
+        base_rate = round(rng.uniform(12.0, 20.0), 2)
+        rates[name] = {'base_rate': base_rate, 'weekend_rate': round(base_rate * 1.25, 2)}
+    return rates
+
+
+def make_employees(count: int, positions: List[str], rng: random.Random) -> List[Employee]:
+    """count employees numbered from E001, zero-padded to the width of the largest ID"""
+    width = max(3, len(str(count)))
+    employees = []
+    for i in range(1, count + 1):
+        start = date(2000, 1, 1) + timedelta(days=rng.randrange(9000))
+        employees.append(Employee(
+            f"E{i:0{width}d}", rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES),
+            rng.choice(positions), start.strftime('%d-%m-%Y')
+        ))
+    return employees
+
+
+def make_schedules(employees: List[Employee], weeks: int, rates: Dict[str, Dict[str, float]],
+                   rng: random.Random, first_week: date = date(2020, 1, 6)) -> Iterator[Schedule]:
+    """One priced schedule per employee per week, generated lazily in week order"""
+    width = max(3, len(str(len(employees) * weeks)))
+    number = 0
+    for week in range(weeks):
+        week_start = (first_week + timedelta(weeks=week)).strftime('%d-%m-%Y')
+        for employee in employees:
+            number += 1
+            hours = rng.choice(SHIFT_PATTERNS)
+            schedule = Schedule(f"S{number:0{width}d}", employee.staff_id, week_start, dict(zip(DAYS, hours)))
+            schedule.total_hours = sum(hours)
+            rate = rates[employee.job]
+            schedule.total_pay = round(sum(hours[:5]) * rate['base_rate'] + sum(hours[5:]) * rate['weekend_rate'], 2)
+            yield schedule
+
+
+def generate_data_folder(folder: Path, employees: int, weeks: int, positions: int = 12,
+                         backend: str = "csv", seed: int = 0) -> Tuple[int, int]:
+    """
+    Write a synthetic data folder
+
+    Args:
+        folder (Path): Folder to create; existing data files in it are replaced
+        employees (int): Number of employees
+        weeks (int): Weeks of schedules, one per employee per week
+        positions (int): Number of positions with wage rates
+        backend (str): Storage backend to write ("csv" or "sqlite")
+        seed (int): Random seed, so the same arguments give the same data
+
+    Returns:
+        Tuple[int, int]: (Employees written, Schedules written)
+    """
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    (folder / "reports").mkdir(exist_ok=True)
+    rng = random.Random(seed)
+
+    storage = create_storage(backend, folder)
+    try:
+        storage.setup()
+        rates = make_positions(positions, rng)
+        storage.save_wage_rates(rates)
+
+        staff = make_employees(employees, list(rates), rng)
+        storage.save_employees(staff)
+
+        # Schedules are generated as the backend writes them rather than held in memory
+        storage.save_schedules(make_schedules(staff, weeks, rates, rng))
+    finally:
+        storage.close()
+
+    # Leave no derived files behind from an earlier folder at this path
+    for stale in ("id_sequences.json", "schedule_totals.json", "schedule_totals_log.jsonl"):
+        if (folder / stale).exists():
+            (folder / stale).unlink()
+
+    return employees, employees * weeks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic bakery data folder")
+    parser.add_argument("folder", help="Folder to write the data to")
+    parser.add_argument("--size", choices=sorted(SIZES), default="1k",
+                        help="Named size, overridden by --employees and --weeks (default: 1k)")
+    parser.add_argument("--employees", type=int, help="Number of employees")
+    parser.add_argument("--weeks", type=int, help="Weeks of schedules per employee")
+    parser.add_argument("--positions", type=int, default=12, help="Number of positions (default: 12)")
+    parser.add_argument("--backend", choices=sorted(STORAGE_BACKENDS), default="csv",
+                        help="Storage backend (default: csv)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    args = parser.parse_args()
+
+    employees, weeks = SIZES[args.size]
+    employees = args.employees or employees
+    weeks = args.weeks or weeks
+
+    employees, schedules = generate_data_folder(
+        Path(args.folder), employees, weeks, args.positions, args.backend, args.seed
+    )
+    print(f"Wrote {employees} employees and {schedules} schedules to {args.folder}")
+
+
+if __name__ == "__main__":
+    main()
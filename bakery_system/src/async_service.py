@@ -0,0 +1,249 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, Optional, Set, Tuple
+from data_manager import DataManager
+from reports import Reports
+
+
+class _ReadWriteGate:
+    """
+    Lets any number of reads run together, or one write on its own
+
+    A waiting write holds back reads that arrive after it, so a steady
+    stream of reports can't keep a save waiting forever.
+    """
+
+    def __init__(self):
+        self._readers = 0
+        self._writing = False
+        self._writers_waiting = 0
+        self._condition: Optional[asyncio.Condition] = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        # Made on first use so it belongs to the running event loop
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    @asynccontextmanager
+    async def reading(self) -> AsyncIterator[None]:
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: not self._writing and not self._writers_waiting)
+            self._readers += 1
+        try:
+            yield
+        finally:
+            async with condition:
+                self._readers -= 1
+                condition.notify_all()
+
+    @asynccontextmanager
+    async def writing(self) -> AsyncIterator[None]:
+        condition = self._get_condition()
+        async with condition:
+            self._writers_waiting += 1
+            try:
+                await condition.wait_for(lambda: not self._writing and not self._readers)
+            finally:
+                self._writers_waiting -= 1
+            self._writing = True
+        try:
+            yield
+        finally:
+            async with condition:
+                self._writing = False
+                condition.notify_all()
+
+
+class AsyncService:
+    """
+    Runs blocking DataManager and Reports calls in a bounded thread pool
+
+    Reads share the pool and run side by side; writes wait for running
+    reads and then run alone. Identical reads asked for while one is still
+    running share its result instead of reading again, so callers get the
+    same object back and should treat it as read-only. A write drops that
+    sharing, so reads asked for after a write always see it.
+
+    Calls run to completion even if the coroutine awaiting them is
+    cancelled, so a cancelled save is still either fully made or not made.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bakery")
+        self._gate = _ReadWriteGate()
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        # Every call not yet finished, including ones whose callers were cancelled
+        self._running: Set[asyncio.Future] = set()
+
+    def _start(self, gate: Callable, func: Callable, args: Tuple, kwargs: Dict[str, Any]) -> asyncio.Future:
+        task = asyncio.ensure_future(self._run(gate, func, args, kwargs))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+        return task
+
+    async def _run(self, gate: Callable, func: Callable, args: Tuple, kwargs: Dict[str, Any]) -> Any:
+        async with gate():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    @staticmethod
+    def _read_key(target: Any, name: str, args: Tuple, kwargs: Dict[str, Any]) -> Optional[Hashable]:
+        """Key identical calls share, or None if the arguments can't be compared"""
+        key = (id(target), name, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+    async def read(self, target: Any, name: str, args: Tuple = (), kwargs: Dict[str, Any] = None,
+                   share: bool = True) -> Any:
+        """
+        Call target.name(*args, **kwargs) alongside other reads
+
+        Args:
+            target (Any): The DataManager or Reports to call
+            name (str): Method name
+            args (Tuple): Positional arguments
+            kwargs (Dict[str, Any]): Keyword arguments
+            share (bool): Join an identical call that is already running (default: True)
+
+        Returns:
+            Any: Whatever the method returns
+        """
+        kwargs = kwargs or {}
+        key = self._read_key(target, name, args, kwargs) if share else None
+        task = self._in_flight.get(key) if key is not None else None
+        if task is None:
+            task = self._start(self._gate.reading, getattr(target, name), args, kwargs)
+            if key is not None:
+                self._in_flight[key] = task
+                task.add_done_callback(functools.partial(self._forget, key))
+        return await asyncio.shield(task)
+
+    async def write(self, target: Any, name: str, args: Tuple = (), kwargs: Dict[str, Any] = None) -> Any:
+        """Call target.name(*args, **kwargs) once no reads or other writes are running"""
+        # Reads asked for from now on mustn't share a result read before this write
+        self._in_flight.clear()
+        task = self._start(self._gate.writing, getattr(target, name), args, kwargs or {})
+        return await asyncio.shield(task)
+
+    async def close(self) -> None:
+        """Wait for running calls to finish and shut the thread pool down"""
+        # Calls still waiting at the gate haven't reached the pool yet
+        while self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+        await asyncio.to_thread(self._executor.shutdown)
+
+    async def __aenter__(self) -> 'AsyncService':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+def _reader(cls: type, name: str, share: bool = True) -> Callable:
+    """An async method running cls.name as a read through the service"""
+    @functools.wraps(getattr(cls, name))
+    async def method(self, *args, **kwargs):
+        return await self.service.read(self.target, name, args, kwargs, share)
+    return method
+
+
+def _writer(cls: type, name: str) -> Callable:
+    """An async method running cls.name as a write through the service"""
+    @functools.wraps(getattr(cls, name))
+    async def method(self, *args, **kwargs):
+        return await self.service.write(self.target, name, args, kwargs)
+    return method
+
+
+class AsyncDataManager:
+    """
+    DataManager operations as coroutines
+
+    Each method takes the same arguments and returns the same result tuple
+    as its DataManager counterpart. The streaming iter_schedules isn't
+    offered, since consuming it would read files on the event loop; use
+    get_schedules instead.
+
+    Example:
+        async with AsyncService() as service:
+            manager = AsyncDataManager(DataManager("data"), service)
+            success, employee, error = await manager.get_employee("E001")
+    """
+
+    def __init__(self, data_manager: DataManager, service: AsyncService):
+        self.target = data_manager
+        self.service = service
+
+    # Reads
+    get_wage_rate = _reader(DataManager, 'get_wage_rate')
+    get_wage_rates = _reader(DataManager, 'get_wage_rates')
+    get_rate_table = _reader(DataManager, 'get_rate_table')
+    get_employee = _reader(DataManager, 'get_employee')
+    get_all_employees = _reader(DataManager, 'get_all_employees')
+    get_sorted_employees = _reader(DataManager, 'get_sorted_employees')
+    get_schedules = _reader(DataManager, 'get_schedules')
+    load_schedules_by_employee_id = _reader(DataManager, 'load_schedules_by_employee_id')
+    load_data = _reader(DataManager, 'load_data')
+    validate_record = _reader(DataManager, 'validate_record')
+    check_duplicate_id = _reader(DataManager, 'check_duplicate_id')
+
+    # Writes, including ID allocation, which updates the ID counter file
+    setup_data_folder = _writer(DataManager, 'setup_data_folder')
+    add_wage_rate = _writer(DataManager, 'add_wage_rate')
+    update_wage_rate = _writer(DataManager, 'update_wage_rate')
+    reprice_schedules = _writer(DataManager, 'reprice_schedules')
+    reserve_employee_ids = _writer(DataManager, 'reserve_employee_ids')
+    reserve_schedule_ids = _writer(DataManager, 'reserve_schedule_ids')
+    generate_employee_id = _writer(DataManager, 'generate_employee_id')
+    generate_schedule_id = _writer(DataManager, 'generate_schedule_id')
+    add_employee = _writer(DataManager, 'add_employee')
+    add_employees_bulk = _writer(DataManager, 'add_employees_bulk')
+    update_employee = _writer(DataManager, 'update_employee')
+    delete_employee = _writer(DataManager, 'delete_employee')
+    save_employees = _writer(DataManager, 'save_employees')
+    migrate_legacy_dates = _writer(DataManager, 'migrate_legacy_dates')
+    compact_schedules = _writer(DataManager, 'compact_schedules')
+    save_schedule = _writer(DataManager, 'save_schedule')
+    update_schedule = _writer(DataManager, 'update_schedule')
+    delete_schedule = _writer(DataManager, 'delete_schedule')
+    save_data = _writer(DataManager, 'save_data')
+    add_record = _writer(DataManager, 'add_record')
+    update_record = _writer(DataManager, 'update_record')
+    delete_record = _writer(DataManager, 'delete_record')
+
+
+class AsyncReports:
+    """
+    Reports operations as coroutines
+
+    Reports only read bakery data, so they all run side by side. Exports
+    write a new file each time and are never shared between callers. The
+    streaming iter_wage_report isn't offered; use generate_wage_report.
+    """
+
+    def __init__(self, reports: Reports, service: AsyncService):
+        self.target = reports
+        self.service = service
+
+    generate_employee_report = _reader(Reports, 'generate_employee_report')
+    generate_wage_report = _reader(Reports, 'generate_wage_report')
+    generate_wage_reports = _reader(Reports, 'generate_wage_reports')
+    generate_binary_wage_report = _reader(Reports, 'generate_binary_wage_report')
+    create_staff_list = _reader(Reports, 'create_staff_list')
+    generate_employee_schedule = _reader(Reports, 'generate_employee_schedule')
+
+    export_to_csv = _reader(Reports, 'export_to_csv', share=False)
+    export_to_txt = _reader(Reports, 'export_to_txt', share=False)
+    save_csv_report = _reader(Reports, 'save_csv_report', share=False)
+    save_text_report = _reader(Reports, 'save_text_report', share=False)
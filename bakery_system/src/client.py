@@ -0,0 +1,122 @@
+import http.client
+import json
+import select
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode
+from server import DEFAULT_HOST, DEFAULT_PORT
+
+# Methods that can safely reach the server twice
+IDEMPOTENT_METHODS = {'GET', 'HEAD'}
+
+
+class BakeryClient:
+    """
+    Thin client for a running bakery server
+
+    One HTTP/1.1 connection is kept open and reused for every request, so
+    each call costs a round trip on localhost rather than a new connection.
+    If the server drops that connection, a request is only sent again when
+    it can't have been carried out already, or when it is a GET or HEAD.
+
+    Example:
+        with BakeryClient() as client:
+            status, response = client.request("GET", "/employees/E001")
+            results = client.batch([("GET", "/employees/E001"), ("GET", "/wage-rates")])
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, timeout: float = 60.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._conn: Optional[http.client.HTTPConnection] = None
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self._conn is not None and self._conn.sock is not None:
+            # Between requests the socket only turns readable when the server has closed it
+            readable, _, _ = select.select([self._conn.sock], [], [], 0)
+            if readable:
+                self.close()
+        if self._conn is None:
+            self._conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        return self._conn
+
+    def request(self, method: str, path: str, body: Any = None,
+                query: Optional[Dict[str, Any]] = None) -> Tuple[int, Dict[str, Any]]:
+        """
+        Send one request and return the decoded response
+
+        Args:
+            method (str): HTTP method, e.g. "GET" or "POST"
+            path (str): Endpoint path, e.g. "/schedules"
+            body (Any): Value sent as the JSON body, if any
+            query (Optional[Dict[str, Any]]): Query parameters; None values are left out
+
+        Returns:
+            Tuple[int, Dict[str, Any]]: (HTTP status, {"ok", "data" or "message", "error"})
+        """
+        if query:
+            path = f"{path}?{urlencode({k: v for k, v in query.items() if v is not None})}"
+        data = json.dumps(body).encode('utf-8') if body is not None else None
+        headers = {'Content-Type': 'application/json'} if data is not None else {}
+
+        conn = self._connection()
+        # A new connection has no socket until its first request
+        reused = conn.sock is not None
+        try:
+            conn.request(method, path, body=data, headers=headers)
+        except (ConnectionResetError, BrokenPipeError):
+            self.close()
+            if not reused:
+                raise
+            # The server closed an idle kept-alive connection before taking the
+            # request, so it is safe to send again on a new one
+            conn = self._connection()
+            conn.request(method, path, body=data, headers=headers)
+
+        try:
+            return self._read_response(conn)
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            self.close()
+            # The request may already have been carried out, so only repeat it if that's harmless
+            if not reused or method.upper() not in IDEMPOTENT_METHODS:
+                raise
+            conn = self._connection()
+            conn.request(method, path, body=data, headers=headers)
+            return self._read_response(conn)
+
+    def _read_response(self, conn: http.client.HTTPConnection) -> Tuple[int, Dict[str, Any]]:
+        response = conn.getresponse()
+        payload = response.read()
+        if response.will_close:
+            self.close()
+        return response.status, json.loads(payload) if payload else {}
+
+    def batch(self, requests: Iterable[Tuple]) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Run several requests in order in a single round trip
+
+        Args:
+            requests (Iterable[Tuple]): (method, path) or (method, path, body) tuples
+
+        Returns:
+            List[Tuple[int, Dict[str, Any]]]: (HTTP status, response) per request
+        """
+        items = []
+        for request in requests:
+            method, path, *rest = request
+            items.append({'method': method, 'path': path, 'body': rest[0] if rest else None})
+        status, response = self.request('POST', '/batch', {'requests': items})
+        if status != 200:
+            raise RuntimeError(response.get('error', f"Batch failed with status {status}"))
+        return [(item['status'], item['body']) for item in response['data']]
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> 'BakeryClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
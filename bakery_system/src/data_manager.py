@@ -1,661 +1,917 @@
-from pathlib import Path
-import json
-import csv
-from typing import Tuple, List, Dict, Any, Optional
-from datetime import datetime
-from employee import Employee
-from wage_data import WageManager
-
-class DataManager:
-    def __init__(self, data_folder: str = "data"):
-        self.data_folder = Path(data_folder)
-        self.pay_rates_file = self.data_folder / "wage_rates.json"
-        self.schedules_file = self.data_folder / "schedules.csv"
-        self.staff_file = self.data_folder / "employees.csv"
-        self.reports_folder = self.data_folder / "reports"
-        self.wage_manager = WageManager()
-
-    def setup_data_folder(self) -> Tuple[bool, str]:
-        """Initialize all necessary data directories and files"""
-        try:
-            # Create main data folder and reports subfolder
-            self.data_folder.mkdir(exist_ok=True)
-            self.reports_folder.mkdir(exist_ok=True)
-
-            # Initialize files if they don't exist
-            if not self.pay_rates_file.exists():
-                self._create_pay_rates()
-            if not self.schedules_file.exists():
-                self._create_schedules_file()
-            if not self.staff_file.exists():
-                self._create_staff_file()
-
-            return True, ""
-        except Exception as e:
-            return False, f"Couldn't set up data folder: {str(e)}"
-
-    def _create_staff_file(self) -> None:
-        """Create initial staff CSV file with headers"""
-        headers = ['staff_id', 'fname', 'lname', 'job', 'start']
-        with self.staff_file.open('w', newline='', encoding='utf-8-sig') as f:
-            writer = csv.writer(f)
-            writer.writerow(headers)
-
-    def _create_pay_rates(self) -> None:
-        """Create initial wage rates file"""
-        default_rates = {
-            "Head Baker": {"base_rate": 18.50, "weekend_rate": 22.00},
-            "Baker": {"base_rate": 16.00, "weekend_rate": 19.00},
-            "Pastry Chef": {"base_rate": 16.50, "weekend_rate": 19.50},
-            "Counter Staff": {"base_rate": 14.00, "weekend_rate": 16.50},
-            "Kitchen Assistant": {"base_rate": 13.50, "weekend_rate": 16.00}
-        }
-        with self.pay_rates_file.open('w') as f:
-            json.dump(default_rates, f, indent=4)
-
-    # Wage rate operations
-    def get_wage_rate(self, position: str, is_weekend: bool = False) -> Optional[float]:
-        """Get wage rate for a position"""
-        try:
-            with self.pay_rates_file.open('r') as f:
-                rates = json.load(f)
-                for stored_title, rate_info in rates.items():
-                    if stored_title.lower() == position.lower():
-                        return rate_info['weekend_rate'] if is_weekend else rate_info['base_rate']
-            return None
-        except Exception:
-            return None
-
-    def add_wage_rate(self, position: str, base_rate: float, weekend_rate: float) -> Tuple[bool, str]:
-        """Add new wage rate"""
-        try:
-            # Validate rates
-            valid, msg = self.wage_manager.validate_rate(base_rate, "base rate")
-            if not valid:
-                return False, msg
-
-            valid, msg = self.wage_manager.validate_rate(weekend_rate, "weekend rate")
-            if not valid:
-                return False, msg
-
-            with self.pay_rates_file.open('r') as f:
-                rates = json.load(f)
-
-            if position.lower() in [k.lower() for k in rates.keys()]:
-                return False, f"Position '{position}' already exists"
-
-            rates[position] = {'base_rate': base_rate, 'weekend_rate': weekend_rate}
-
-            with self.pay_rates_file.open('w') as f:
-                json.dump(rates, f, indent=4)
-
-            return True, "Wage rate added successfully"
-        except Exception as e:
-            return False, str(e)
-
-    def get_wage_rates(self) -> Tuple[bool, Dict[str, Dict[str, float]], str]:
-        """Get all wage rates"""
-        try:
-            if not self.pay_rates_file.exists():
-                return False, {}, "Wage rates file does not exist"
-
-            with self.pay_rates_file.open('r') as f:
-                rates = json.load(f)
-
-            return True, rates, ""
-        except Exception as e:
-            return False, {}, f"Error loading wage rates: {str(e)}"
-
-    def update_wage_rate(self, position: str, base_rate: float, weekend_rate: float) -> Tuple[bool, str]:
-        """Update existing wage rate"""
-        try:
-            # Validate rates
-            valid, msg = self.wage_manager.validate_rate(base_rate, "base rate")
-            if not valid:
-                return False, msg
-
-            valid, msg = self.wage_manager.validate_rate(weekend_rate, "weekend rate")
-            if not valid:
-                return False, msg
-
-            with self.pay_rates_file.open('r') as f:
-                rates = json.load(f)
-
-            found = False
-            for stored_title in list(rates.keys()):
-                if stored_title.lower() == position.lower():
-                    rates[stored_title] = {
-                        'base_rate': base_rate,
-                        'weekend_rate': weekend_rate
-                    }
-                    found = True
-                    break
-
-            if not found:
-                return False, f"Position '{position}' not found"
-
-            with self.pay_rates_file.open('w') as f:
-                json.dump(rates, f, indent=4)
-
-            return True, "Wage rate updated successfully"
-        except Exception as e:
-            return False, str(e)
-
-    # Employee operations
-    def generate_employee_id(self) -> str:
-        """Generate a unique employee ID"""
-        try:
-            if not self.staff_file.exists():
-                return "E001"
-
-            with self.staff_file.open(mode='r', newline='', encoding='utf-8-sig') as file:
-                reader = csv.reader(file)
-                next(reader)  # skip header
-                staff_ids = [row[0] for row in reader if row]
-
-            if not staff_ids:
-                return "E001"
-
-            # Find the highest ID number by checking all IDs
-            highest_num = 0
-            for staff_id in staff_ids:
-                if staff_id.startswith('E'):
-                    try:
-                        id_num = int(staff_id[1:])
-                        highest_num = max(highest_num, id_num)
-                    except ValueError:
-                        # Skip IDs that don't follow the expected format
-                        continue
-
-            return f"E{highest_num + 1:03d}"
-        except Exception as e:
-            print(f"Problem making ID: {e}")
-            return "E001"
-
-    def add_employee(self, fname: str, lname: str, job: str, start_date: str) -> Tuple[bool, str]:
-        """Add new employee"""
-        try:
-            # Create employee object
-            employee = Employee(None, fname, lname, job, start_date)
-
-            # Validate employee data
-            valid, msg = employee.validate()
-            if not valid:
-                return False, msg
-
-            # Generate ID
-            employee.staff_id = self.generate_employee_id()
-
-            # Save to file
-            with self.staff_file.open('a', newline='', encoding='utf-8-sig') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    employee.staff_id,
-                    employee.fname,
-                    employee.lname,
-                    employee.job,
-                    employee.start_date
-                ])
-
-            return True, f"Employee added successfully with ID: {employee.staff_id}"
-        except Exception as e:
-            return False, f"Error adding employee: {str(e)}"
-
-    def get_employee(self, employee_id: str) -> Tuple[bool, Optional[Dict[str, str]], str]:
-        """Get employee by ID"""
-        try:
-            if not self.staff_file.exists():
-                return False, None, "Employee file does not exist"
-
-            with self.staff_file.open(mode='r', newline='', encoding='utf-8-sig') as file:
-                reader = csv.DictReader(file)
-                for employee in reader:
-                    if employee['staff_id'] == employee_id:
-                        return True, employee, ""
-            return False, None, "Employee not found"
-        except Exception as e:
-            return False, None, f"Error finding employee: {str(e)}"
-
-    def update_employee(self, employee_id: str, new_fname: str = None, new_lname: str = None, new_job: str = None) -> Tuple[bool, str]:
-        """Update employee information"""
-        try:
-            # Get the employee
-            success, employee_data, error = self.get_employee(employee_id)
-            if not success:
-                return False, error
-
-            # Create employee object
-            employee = Employee.from_dict(employee_data)
-
-            # Update fields
-            if new_fname or new_lname:
-                success, msg = employee.update_name(new_fname, new_lname)
-                if not success:
-                    return False, msg
-
-            if new_job:
-                success, msg = employee.update_position(new_job)
-                if not success:
-                    return False, msg
-
-            # Save all employees
-            success, employees, error = self.get_all_employees()
-            if not success:
-                return False, error
-
-            # Replace the updated employee
-            for i, emp in enumerate(employees):
-                if emp['staff_id'] == employee_id:
-                    employees[i] = employee.to_dict()
-                    break
-
-            # Write back to file
-            return self.save_employees(employees)
-        except Exception as e:
-            return False, f"Error updating employee: {str(e)}"
-
-    def delete_employee(self, employee_id: str) -> Tuple[bool, str]:
-        """Delete employee by ID"""
-        try:
-            # Get all employees
-            success, employees, error = self.get_all_employees()
-            if not success:
-                return False, error
-
-            # Filter out the employee to delete
-            original_count = len(employees)
-            employees = [emp for emp in employees if emp['staff_id'] != employee_id]
-
-            if len(employees) == original_count:
-                return False, f"Employee with ID {employee_id} not found"
-
-            # Write back to file
-            return self.save_employees(employees)
-        except Exception as e:
-            return False, f"Error deleting employee: {str(e)}"
-
-    def get_all_employees(self) -> Tuple[bool, List[Dict[str, str]], str]:
-        """Get all employees"""
-        try:
-            if not self.staff_file.exists():
-                return True, [], ""
-
-            employees = []
-            with self.staff_file.open(mode='r', newline='', encoding='utf-8-sig') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    employees.append(row)
-            return True, employees, ""
-        except Exception as e:
-            return False, [], f"Error getting employees: {str(e)}"
-
-    def save_employees(self, employees: List[Dict[str, str]]) -> Tuple[bool, str]:
-        """Save employees to file"""
-        try:
-            headers = ['staff_id', 'fname', 'lname', 'job', 'start']
-            with self.staff_file.open('w', newline='', encoding='utf-8-sig') as f:
-                writer = csv.DictWriter(f, fieldnames=headers)
-                writer.writeheader()
-                writer.writerows(employees)
-            return True, "Employees saved successfully"
-        except Exception as e:
-            return False, f"Error saving employees: {str(e)}"
-
-    def _create_schedules_file(self) -> None:
-        """Create initial schedules CSV file with headers"""
-        headers = [
-            'schedule_id', 'employee_id', 'week_start',
-            'mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun',
-            'total_hours', 'total_pay'
-        ]
-        with self.schedules_file.open('w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(headers)
-
-    def save_schedule(self, schedule_data: Dict[str, Any]) -> Tuple[bool, str]:
-        """Save schedule to CSV file"""
-        try:
-            # Ensure week_start is in DD-MM-YYYY format
-            try:
-                date = datetime.strptime(schedule_data['week_start'], '%Y-%m-%d')
-                schedule_data['week_start'] = date.strftime('%d-%m-%Y')
-            except ValueError:
-                # If already in DD-MM-YYYY format, validate it
-                datetime.strptime(schedule_data['week_start'], '%d-%m-%Y')
-
-            # Calculate total hours and pay
-            hours = {
-                'mon': float(schedule_data.get('mon', 0)),
-                'tue': float(schedule_data.get('tue', 0)),
-                'wed': float(schedule_data.get('wed', 0)),
-                'thu': float(schedule_data.get('thu', 0)),
-                'fri': float(schedule_data.get('fri', 0)),
-                'sat': float(schedule_data.get('sat', 0)),
-                'sun': float(schedule_data.get('sun', 0))
-            }
-
-            total_hours = sum(hours.values())
-            schedule_data['total_hours'] = total_hours
-
-            # Get employee position for wage calculation
-            success, employee, error = self.get_employee(schedule_data['employee_id'])
-            if not success:
-                return False, f"Failed to get employee details: {error}"
-
-            # Calculate total pay
-            success, wage_rates, error = self.get_wage_rates()
-            if not success:
-                return False, f"Failed to get wage rates: {error}"
-
-            success, total_pay, error = self.wage_manager.calculate_pay(
-                employee['job'], hours, wage_rates
-            )
-            if not success:
-                return False, error
-
-            schedule_data['total_pay'] = total_pay
-
-            # Save to CSV
-            with self.schedules_file.open('a', newline='', encoding='utf-8-sig') as f:
-                writer = csv.DictWriter(f, fieldnames=self.schedule_fields)
-                writer.writerow(schedule_data)
-
-            return True, "Schedule saved successfully"
-        except Exception as e:
-            return False, str(e)
-
-    def get_schedules(self, employee_id: str = None, start_date: str = None, end_date: str = None) -> Tuple[bool, List[Dict[str, Any]], str]:
-        """Get schedules with optional filtering"""
-        try:
-            schedules = []
-            with self.schedules_file.open('r', newline='', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    # Filter by employee if specified
-                    if employee_id and row['employee_id'] != employee_id:
-                        continue
-
-                    if start_date or end_date:
-                        try:
-                            # Convert schedule date to datetime object
-                            schedule_date = datetime.strptime(row['week_start'], '%d-%m-%Y')
-
-                            if start_date:
-                                start = datetime.strptime(start_date, '%d-%m-%Y')
-                                if schedule_date < start:
-                                    continue
-
-                            if end_date:
-                                end = datetime.strptime(end_date, '%d-%m-%Y')
-                                if schedule_date > end:
-                                    continue
-                        except ValueError:
-                            # Skip rows with invalid dates
-                            continue
-
-                    schedules.append(row)
-
-            return True, schedules, ""
-        except Exception as e:
-            return False, [], f"Failed to retrieve schedules: {str(e)}"
-
-
-    def load_schedules_by_employee_id(self, employee_id: str) -> Tuple[bool, List[Dict[str, Any]], str]:
-        """Load all schedules for a specific employee"""
-        return self.get_schedules(employee_id=employee_id)
-
-    def delete_schedule(self, schedule_id: str) -> Tuple[bool, str]:
-        """Delete a schedule by ID"""
-        try:
-            if not self.schedules_file.exists():
-                return False, "No schedules file exists"
-
-            # Read all schedules
-            schedules = []
-            found = False
-
-            with self.schedules_file.open('r', newline='', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                headers = reader.fieldnames
-
-                for row in reader:
-                    if row['schedule_id'] != schedule_id:
-                        schedules.append(row)
-                    else:
-                        found = True
-
-            if not found:
-                return False, f"Schedule with ID {schedule_id} not found"
-
-            # Write back all schedules except the deleted one
-            with self.schedules_file.open('w', newline='', encoding='utf-8-sig') as f:
-                writer = csv.DictWriter(f, fieldnames=headers)
-                writer.writeheader()
-                writer.writerows(schedules)
-
-            return True, "Schedule deleted successfully"
-        except Exception as e:
-            return False, f"Failed to delete schedule: {str(e)}"
-
-    def load_data(self, file_type: str) -> Tuple[bool, List[Dict[str, Any]], str]:
-        """Load data from specified file type"""
-        try:
-            if file_type == "employees":
-                file_path = self.staff_file
-                if not file_path.exists():
-                    return True, [], ""
-                with file_path.open('r', newline='', encoding='utf-8-sig') as f:
-                    return True, list(csv.DictReader(f)), ""
-
-            elif file_type == "schedules":
-                if not self.schedules_file.exists():
-                    return True, [], ""
-                with self.schedules_file.open('r', newline='', encoding='utf-8-sig') as f:
-                    return True, list(csv.DictReader(f)), ""
-
-            elif file_type == "wage_rates":
-                if not self.pay_rates_file.exists():
-                    return True, [], ""
-                with self.pay_rates_file.open('r') as f:
-                    rates = json.load(f)
-                    return True, [{"position": k, **v} for k, v in rates.items()], ""
-
-            return False, [], f"Invalid file type: {file_type}"
-
-        except Exception as e:
-            return False, [], f"Error loading {file_type}: {str(e)}"
-
-    def save_data(self, file_type: str, data: List[Dict[str, Any]]) -> Tuple[bool, str]:
-        """Save data to specified file type"""
-        try:
-            if file_type == "employees":
-                if not data:
-                    return True, "No data to save"
-                headers = ['staff_id', 'fname', 'lname', 'job', 'start']
-                with self.staff_file.open('w', newline='', encoding='utf-8-sig') as f:
-                    writer = csv.DictWriter(f, fieldnames=headers)
-                    writer.writeheader()
-                    writer.writerows(data)
-
-            elif file_type == "schedules":
-                if not data:
-                    return True, "No data to save"
-                headers = [
-                    'schedule_id', 'employee_id', 'week_start',
-                    'mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun',
-                    'total_hours', 'total_pay'
-                ]
-                with self.schedules_file.open('w', newline='', encoding='utf-8-sig') as f:
-                    writer = csv.DictWriter(f, fieldnames=headers)
-                    writer.writeheader()
-                    writer.writerows(data)
-
-            elif file_type == "wage_rates":
-                rates_dict = {item['position']: {
-                    'base_rate': item['base_rate'],
-                    'weekend_rate': item['weekend_rate']
-                } for item in data}
-                with self.pay_rates_file.open('w') as f:
-                    json.dump(rates_dict, f, indent=4)
-            else:
-                return False, f"Invalid file type: {file_type}"
-
-            return True, f"{file_type} saved successfully"
-
-        except Exception as e:
-            return False, f"Error saving {file_type}: {str(e)}"
-
-    def add_record(self, file_type: str, record: Dict[str, Any]) -> Tuple[bool, str]:
-        """Add new record after checking for duplicate IDs"""
-        try:
-            # Get ID field name based on file type
-            id_field = {
-                "employees": "staff_id",
-                "schedules": "schedule_id",
-                "wage_rates": "position"
-            }.get(file_type)
-
-            if not id_field:
-                return False, f"Invalid file type: {file_type}"
-
-            # Check for duplicate ID
-            if self.check_duplicate_id(file_type, record[id_field]):
-                return False, f"Duplicate {id_field} found"
-
-            # Validate record
-            valid, msg = self.validate_record(file_type, record)
-            if not valid:
-                return False, msg
-
-            # Load existing data
-            success, data, error = self.load_data(file_type)
-            if not success:
-                return False, error
-
-            # Add new record and save
-            data.append(record)
-            return self.save_data(file_type, data)
-
-        except Exception as e:
-            return False, f"Error adding record: {str(e)}"
-
-    def update_record(self, file_type: str, record_id: str, **kwargs) -> Tuple[bool, str]:
-        """Update existing record with new values"""
-        try:
-            success, data, error = self.load_data(file_type)
-            if not success:
-                return False, error
-
-            id_field = {
-                "employees": "staff_id",
-                "schedules": "schedule_id",
-                "wage_rates": "position"
-            }.get(file_type)
-
-            if not id_field:
-                return False, f"Invalid file type: {file_type}"
-
-            # Find and update record
-            found = False
-            for record in data:
-                if record[id_field] == record_id:
-                    record.update(kwargs)
-                    found = True
-                    break
-
-            if not found:
-                return False, f"Record with {id_field}={record_id} not found"
-
-            return self.save_data(file_type, data)
-
-        except Exception as e:
-            return False, f"Error updating record: {str(e)}"
-
-    def delete_record(self, file_type: str, record_id: str) -> Tuple[bool, str]:
-        """Delete record by ID"""
-        try:
-            success, data, error = self.load_data(file_type)
-            if not success:
-                return False, error
-
-            id_field = {
-                "employees": "staff_id",
-                "schedules": "schedule_id",
-                "wage_rates": "position"
-            }.get(file_type)
-
-            if not id_field:
-                return False, f"Invalid file type: {file_type}"
-
-            # Filter out the record to delete
-            original_length = len(data)
-            data = [record for record in data if record[id_field] != record_id]
-
-            if len(data) == original_length:
-                return False, f"Record with {id_field}={record_id} not found"
-
-            return self.save_data(file_type, data)
-
-        except Exception as e:
-            return False, f"Error deleting record: {str(e)}"
-
-    def validate_record(self, file_type: str, data: Dict[str, Any]) -> Tuple[bool, str]:
-        """Validate record based on file type"""
-        try:
-            if file_type == "employees":
-                required = ['staff_id', 'fname', 'lname', 'job', 'start']
-                for field in required:
-                    if field not in data:
-                        return False, f"Missing required field: {field}"
-                # Validate date format
-                try:
-                    datetime.strptime(data['start'], '%d-%m-%Y')
-                except ValueError:
-                    return False, "Invalid date format. Use DD-MM-YYYY"
-
-            elif file_type == "schedules":
-                required = ['schedule_id', 'employee_id', 'week_start',
-                          'mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']
-                for field in required:
-                    if field not in data:
-                        return False, f"Missing required field: {field}"
-                # Validate hours
-                for day in ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']:
-                    try:
-                        hours = float(data[day])
-                        if hours < 0 or hours > 12:
-                            return False, f"Invalid hours for {day}: must be between 0 and 12"
-                    except ValueError:
-                        return False, f"Invalid hours format for {day}"
-
-            elif file_type == "wage_rates":
-                required = ['position', 'base_rate', 'weekend_rate']
-                for field in required:
-                    if field not in data:
-                        return False, f"Missing required field: {field}"
-                # Validate rates
-                try:
-                    if float(data['base_rate']) <= 0 or float(data['weekend_rate']) <= 0:
-                        return False, "Rates must be greater than zero"
-                except ValueError:
-                    return False, "Invalid rate format"
-
-            return True, ""
-
-        except Exception as e:
-            return False, f"Validation error: {str(e)}"
-
-    def check_duplicate_id(self, file_type: str, new_id: str) -> bool:
-        """Check if ID already exists in file"""
-        success, data, _ = self.load_data(file_type)
-        if not success or not data:
-            return False
-
-        id_field = {
-            "employees": "staff_id",
-            "schedules": "schedule_id",
-            "wage_rates": "position"
-        }.get(file_type)
-
-        return any(record[id_field] == new_id for record in data)
-
+from pathlib import Path
+from contextlib import contextmanager
+import threading
+from typing import Tuple, List, Dict, Any, Iterable, Iterator, Optional
+from employee import Employee
+from schedule import Schedule
+from wage_data import WageManager
+from id_allocator import IdAllocator
+from diagnostics import instrumented
+from payroll_totals import PayrollTotals
+from staff_views import STAFF_ORDERS
+from dates import date_ordinal, normalise_date
+from storage import StorageBackend, TransactionStorage, create_storage, SCHEDULE_FIELDS, UPGRADE_HINT
+
+@instrumented
+class DataManager:
+    def __init__(self, data_folder: str = "data", backend: str = "csv"):
+        self.data_folder = Path(data_folder)
+        self.pay_rates_file = self.data_folder / "wage_rates.json"
+        self.schedules_file = self.data_folder / "schedules.csv"
+        self.staff_file = self.data_folder / "employees.csv"
+        self.reports_folder = self.data_folder / "reports"
+        self.wage_manager = WageManager()
+        self.schedule_fields = list(SCHEDULE_FIELDS)
+
+        # Where employees, schedules and wage rates are persisted ("csv" or "sqlite")
+        self.storage: StorageBackend = create_storage(backend, self.data_folder)
+
+        # Persistent ID sequences, seeded from the stored IDs on first use
+        self.id_allocator = IdAllocator(self.data_folder / "id_sequences.json")
+
+        # Per-employee weekly hours and pay, kept up to date as schedules change
+        self.payroll_totals = PayrollTotals(self.data_folder / "schedule_totals.json")
+        # Reads running side by side (see async_service) may both find the totals stale
+        self._payroll_lock = threading.Lock()
+
+    def setup_data_folder(self) -> Tuple[bool, str]:
+        """Initialize all necessary data directories and files"""
+        try:
+            # Create main data folder and reports subfolder
+            self.data_folder.mkdir(exist_ok=True)
+            self.reports_folder.mkdir(exist_ok=True)
+
+            # Initialize files if they don't exist
+            self.storage.setup()
+
+            return True, ""
+        except Exception as e:
+            return False, f"Couldn't set up data folder: {str(e)}"
+
+    def check_data_layout(self) -> Tuple[bool, str]:
+        """Check the stored data can be used as it is, reading only file headers"""
+        try:
+            if self.storage.schedules_need_upgrade():
+                return False, f"{self.schedules_file} has no schedule_id column; {UPGRADE_HINT}"
+            return True, ""
+        except Exception as e:
+            return False, f"Couldn't check data folder: {str(e)}"
+
+    @contextmanager
+    def transaction(self) -> Iterator[TransactionStorage]:
+        """
+        Group several operations into one unit of work
+
+        Inside the block reads come from an in-memory working set and writes
+        are buffered. On a clean exit each touched file is written once; if
+        the block raises or calls rollback() on the yielded transaction,
+        nothing is written. Nested blocks join the outer transaction.
+
+        Example:
+            with data_manager.transaction() as txn:
+                success, msg = data_manager.update_employee("E001", new_job="Baker")
+                if not success:
+                    txn.rollback()
+        """
+        if isinstance(self.storage, TransactionStorage):
+            yield self.storage
+            return
+
+        backing = self.storage
+        txn = TransactionStorage(backing)
+        self.storage = txn
+        try:
+            yield txn
+        finally:
+            self.storage = backing
+
+        if not txn.rolled_back:
+            txn.commit()
+
+    # Wage rate operations
+    def get_wage_rate(self, position: str, is_weekend: bool = False) -> Optional[float]:
+        """Get wage rate for a position"""
+        try:
+            rate_info = self.storage.load_rate_table().get(position.casefold())
+            if rate_info is None:
+                return None
+            return rate_info['weekend_rate'] if is_weekend else rate_info['base_rate']
+        except Exception:
+            return None
+
+    def add_wage_rate(self, position: str, base_rate: float, weekend_rate: float) -> Tuple[bool, str]:
+        """Add new wage rate"""
+        try:
+            # Another process mustn't change the rates between reading and saving them
+            with self.storage.exclusive():
+                # Validate rates
+                valid, msg = self.wage_manager.validate_rate(base_rate, "base rate")
+                if not valid:
+                    return False, msg
+
+                valid, msg = self.wage_manager.validate_rate(weekend_rate, "weekend rate")
+                if not valid:
+                    return False, msg
+
+                if position.casefold() in self.storage.load_rate_table():
+                    return False, f"Position '{position}' already exists"
+
+                rates = self.storage.load_wage_rates() or {}
+
+                rates[position] = {'base_rate': base_rate, 'weekend_rate': weekend_rate}
+
+                self.storage.save_wage_rates(rates)
+
+                return True, "Wage rate added successfully"
+        except Exception as e:
+            return False, str(e)
+
+    def get_wage_rates(self) -> Tuple[bool, Dict[str, Dict[str, float]], str]:
+        """Get all wage rates"""
+        try:
+            rates = self.storage.load_wage_rates()
+            if rates is None:
+                return False, {}, "Wage rates file does not exist"
+
+            return True, rates, ""
+        except Exception as e:
+            return False, {}, f"Error loading wage rates: {str(e)}"
+
+    def get_rate_table(self) -> Tuple[bool, Dict[str, Dict[str, float]], str]:
+        """Get wage rates keyed by case-folded position for direct lookups"""
+        try:
+            return True, self.storage.load_rate_table(), ""
+        except Exception as e:
+            return False, {}, f"Error loading wage rates: {str(e)}"
+
+    def update_wage_rate(self, position: str, base_rate: float, weekend_rate: float,
+                         effective_date: str = None) -> Tuple[bool, str]:
+        """Update existing wage rate and reprice schedules worked in that position"""
+        try:
+            # Another process mustn't change the rates between reading and saving them
+            with self.storage.exclusive():
+                if effective_date and date_ordinal(effective_date) is None:
+                    return False, "Invalid date format. Use DD-MM-YYYY"
+
+                # Validate rates
+                valid, msg = self.wage_manager.validate_rate(base_rate, "base rate")
+                if not valid:
+                    return False, msg
+
+                valid, msg = self.wage_manager.validate_rate(weekend_rate, "weekend rate")
+                if not valid:
+                    return False, msg
+
+                if position.casefold() not in self.storage.load_rate_table():
+                    return False, f"Position '{position}' not found"
+
+                rates = self.storage.load_wage_rates() or {}
+
+                found = False
+                for stored_title in list(rates.keys()):
+                    if stored_title.casefold() == position.casefold():
+                        rates[stored_title] = {
+                            'base_rate': base_rate,
+                            'weekend_rate': weekend_rate
+                        }
+                        found = True
+                        break
+
+                if not found:
+                    return False, f"Position '{position}' not found"
+
+                self.storage.save_wage_rates(rates)
+
+                success, repriced, error = self.reprice_schedules(position, effective_date)
+                if not success:
+                    return False, f"Wage rate updated, but schedules weren't repriced: {error}"
+
+                if error:
+                    return True, f"Wage rate updated successfully ({repriced} schedules repriced; {error})"
+                return True, f"Wage rate updated successfully ({repriced} schedules repriced)"
+        except Exception as e:
+            return False, str(e)
+
+    def reprice_schedules(self, position: str, effective_date: str = None) -> Tuple[bool, int, str]:
+        """
+        Recalculate total_pay at the current rates for schedules worked in a position
+
+        Only employees in the position are looked at, and only their schedules
+        from effective_date on, through the per-employee schedule index.
+        Schedules whose pay changes are written back in a single batch.
+        Rows without a schedule ID or a readable week start are left as they
+        are, since they can't be written back by ID or dated against the rates.
+
+        Args:
+            position (str): Position whose rates changed (any case)
+            effective_date (str): Only reprice weeks starting on or after this DD-MM-YYYY date
+
+        Returns:
+            Tuple[bool, int, str]: (Success status, Number of schedules repriced, Error message,
+            or on success a note of any schedules skipped)
+        """
+        try:
+            start = None
+            if effective_date:
+                start = date_ordinal(effective_date)
+                if start is None:
+                    return False, 0, "Invalid date format. Use DD-MM-YYYY"
+
+            position_rates = self.storage.load_rate_table().get(position.casefold())
+            if position_rates is None:
+                return False, 0, f"Position '{position}' not found"
+
+            # Other processes mustn't change these schedules between reading and rewriting them
+            with self.storage.exclusive():
+                # Position -> employees -> schedules
+                employee_ids = [
+                    emp.staff_id for emp in self.storage.get_all_employees()
+                    if emp.job.casefold() == position.casefold()
+                ]
+
+                removed = []
+                repriced = {}
+                skipped = 0
+                for employee_id in employee_ids:
+                    for schedule in self.storage.query_schedules(employee_id, start):
+                        if not schedule.schedule_id or date_ordinal(schedule.week_start_date) is None:
+                            skipped += 1
+                            continue
+                        success, total_pay, error = self.wage_manager.calculate_pay_at_rates(position_rates, schedule.hours)
+                        if not success:
+                            return False, 0, error
+                        if total_pay == schedule.total_pay:
+                            continue
+                        removed.append(schedule.copy())
+                        schedule.total_pay = total_pay
+                        repriced[schedule.schedule_id] = schedule
+
+                if repriced:
+                    totals = self._current_payroll_totals()
+                    self.storage.replace_schedules(list(repriced.values()))
+                    self._record_payroll_change(totals, removed, list(repriced.values()))
+
+            if skipped:
+                return True, len(repriced), f"Skipped {skipped} schedules without a valid schedule ID or week start"
+            return True, len(repriced), ""
+        except Exception as e:
+            return False, 0, f"Failed to reprice schedules: {str(e)}"
+
+    # Employee operations
+    @staticmethod
+    def _highest_id_number(ids: Iterable[str], prefix: str) -> int:
+        """Find the highest number used in IDs with the given prefix"""
+        highest_num = 0
+        for record_id in ids:
+            # Rows from damaged or foreign files may have no ID at all
+            if isinstance(record_id, str) and record_id.startswith(prefix):
+                try:
+                    id_num = int(record_id[len(prefix):])
+                    highest_num = max(highest_num, id_num)
+                except ValueError:
+                    # Skip IDs that don't follow the expected format
+                    continue
+        return highest_num
+
+    def _highest_employee_number(self) -> int:
+        """Find the highest number used in a staff ID (seeds the allocator)"""
+        return self._highest_id_number((emp.staff_id for emp in self.storage.get_all_employees()), 'E')
+
+    def _highest_schedule_number(self) -> int:
+        """Find the highest number used in a schedule ID (seeds the allocator)"""
+        return self._highest_id_number((s.schedule_id for s in self.storage.iter_schedules()), 'S')
+
+    def reserve_employee_ids(self, count: int) -> List[str]:
+        """Reserve a contiguous block of employee IDs"""
+        first = self.id_allocator.reserve('E', count, self._highest_employee_number,
+                                          lambda num: self.storage.get_employee(f"E{num:03d}") is not None)
+        return [f"E{num:03d}" for num in range(first, first + count)]
+
+    def reserve_schedule_ids(self, count: int) -> List[str]:
+        """Reserve a contiguous block of schedule IDs"""
+        first = self.id_allocator.reserve('S', count, self._highest_schedule_number,
+                                          lambda num: self.storage.has_schedule(f"S{num:03d}"))
+        return [f"S{num:03d}" for num in range(first, first + count)]
+
+    def generate_employee_id(self) -> str:
+        """Generate a unique employee ID"""
+        return self.reserve_employee_ids(1)[0]
+
+    def generate_schedule_id(self) -> str:
+        """Generate a unique schedule ID"""
+        return self.reserve_schedule_ids(1)[0]
+
+    def add_employee(self, fname: str, lname: str, job: str, start_date: str) -> Tuple[bool, str]:
+        """Add new employee"""
+        try:
+            # Create employee object
+            employee = Employee(None, fname, lname, job, start_date)
+
+            # Validate employee data
+            valid, msg = employee.validate()
+            if not valid:
+                return False, msg
+
+            # Generate ID
+            employee.staff_id = self.generate_employee_id()
+
+            # Save to storage
+            self.storage.add_employee(employee.to_dict())
+
+            return True, f"Employee added successfully with ID: {employee.staff_id}"
+        except Exception as e:
+            return False, f"Error adding employee: {str(e)}"
+
+    def add_employees_bulk(self, rows: Iterable[Dict[str, str]]) -> Tuple[bool, List[Dict[str, Any]], str]:
+        """
+        Add many employees with one ID scan and one write
+
+        Args:
+            rows (Iterable[Dict[str, str]]): Rows with 'fname', 'lname', 'job' and 'start' keys
+
+        Returns:
+            Tuple[bool, List[Dict[str, Any]], str]: (Success status, Per-row results, Error message).
+            Each result has the 1-based 'row' number, the new 'staff_id' (blank if rejected)
+            and an 'error' (blank if added).
+        """
+        try:
+            # Validate everything first so accepted rows get a contiguous block of IDs
+            results = []
+            accepted = []
+            for row_num, row in enumerate(rows, start=1):
+                missing = [field for field in ('fname', 'lname', 'job', 'start') if not row.get(field)]
+                if missing:
+                    results.append({'row': row_num, 'staff_id': '', 'error': f"Missing required field: {missing[0]}"})
+                    continue
+
+                employee = Employee(None, row['fname'].strip(), row['lname'].strip(), row['job'].strip(), row['start'].strip())
+                valid, msg = employee.validate()
+                if not valid:
+                    results.append({'row': row_num, 'staff_id': '', 'error': msg})
+                    continue
+
+                result = {'row': row_num, 'staff_id': '', 'error': ''}
+                results.append(result)
+                accepted.append((result, employee))
+
+            if not accepted:
+                return True, results, ""
+
+            staff_ids = self.reserve_employee_ids(len(accepted))
+            for staff_id, (result, employee) in zip(staff_ids, accepted):
+                employee.staff_id = staff_id
+                result['staff_id'] = staff_id
+
+            self.storage.add_employees([employee.to_dict() for _, employee in accepted])
+
+            return True, results, ""
+        except Exception as e:
+            return False, [], f"Error adding employees: {str(e)}"
+
+    def get_employee(self, employee_id: str) -> Tuple[bool, Optional[Employee], str]:
+        """Get employee by ID"""
+        try:
+            employee = self.storage.get_employee(employee_id)
+            if employee is None:
+                return False, None, "Employee not found"
+            return True, employee, ""
+        except Exception as e:
+            return False, None, f"Error finding employee: {str(e)}"
+
+    def update_employee(self, employee_id: str, new_fname: str = None, new_lname: str = None, new_job: str = None) -> Tuple[bool, str]:
+        """Update employee information"""
+        try:
+            # Another process mustn't change the employee between reading and writing it
+            with self.storage.exclusive():
+                # Get the employee
+                success, employee_data, error = self.get_employee(employee_id)
+                if not success:
+                    return False, error
+
+                # Create employee object
+                employee = Employee.from_dict(employee_data)
+
+                # Update fields
+                if new_fname or new_lname:
+                    success, msg = employee.update_name(new_fname, new_lname)
+                    if not success:
+                        return False, msg
+
+                if new_job:
+                    success, msg = employee.update_position(new_job)
+                    if not success:
+                        return False, msg
+
+                # Replace the stored row in place
+                if not self.storage.update_employee(employee):
+                    return False, "Employee not found"
+
+                return True, "Employee updated successfully"
+        except Exception as e:
+            return False, f"Error updating employee: {str(e)}"
+
+    def delete_employee(self, employee_id: str) -> Tuple[bool, str]:
+        """Delete employee by ID"""
+        try:
+            if not self.storage.delete_employee(employee_id):
+                return False, f"Employee with ID {employee_id} not found"
+
+            return True, "Employee deleted successfully"
+        except Exception as e:
+            return False, f"Error deleting employee: {str(e)}"
+
+    def get_all_employees(self) -> Tuple[bool, List[Employee], str]:
+        """Get all employees"""
+        try:
+            return True, self.storage.get_all_employees(), ""
+        except Exception as e:
+            return False, [], f"Error getting employees: {str(e)}"
+
+    def get_sorted_employees(self, order: str = "lname", offset: int = 0, limit: Optional[int] = None) -> Tuple[bool, List[Employee], str]:
+        """
+        Get employees in a maintained sort order, optionally one page at a time
+
+        Args:
+            order (str): "lname" (last name), "name" (last then first name) or "job"
+            offset (int): Number of employees to skip
+            limit (Optional[int]): Most employees to return (default: all)
+
+        Returns:
+            Tuple[bool, List[Employee], str]: (Success status, Employees, Error message)
+        """
+        try:
+            if order not in STAFF_ORDERS:
+                return False, [], f"Invalid sort order: {order}"
+            return True, self.storage.get_sorted_employees(order, offset, limit), ""
+        except Exception as e:
+            return False, [], f"Error getting employees: {str(e)}"
+
+    def save_employees(self, employees: List[Dict[str, str]]) -> Tuple[bool, str]:
+        """Save employees to file"""
+        try:
+            self.storage.save_employees(employees)
+            return True, "Employees saved successfully"
+        except Exception as e:
+            return False, f"Error saving employees: {str(e)}"
+
+    def migrate_legacy_dates(self) -> Tuple[bool, int, str]:
+        """
+        Rewrite employee start dates and schedule week starts stored in legacy formats
+
+        Dates like 03/01/2006 or 2006-01-03 are rewritten as DD-MM-YYYY, so
+        everything downstream can rely on the one format. Each dataset is
+        only rewritten if something in it changed, so running this again is
+        cheap and harmless. Dates that can't be parsed at all are left alone.
+        A schedules file from before schedule IDs is first rewritten in the
+        current layout, with IDs given to its rows.
+
+        Returns:
+            Tuple[bool, int, str]: (Success status, Number of dates rewritten, Error message,
+            or on success a note of any schedules given IDs)
+        """
+        try:
+            # Rows added by another process mid-migration would be lost in the rewrite
+            with self.storage.exclusive():
+                changed = 0
+                upgraded = self.storage.upgrade_schedules()
+
+                employees = self.storage.get_all_employees()
+                employees_changed = False
+                for employee in employees:
+                    if date_ordinal(employee.start_date) is None:
+                        start = normalise_date(employee.start_date)
+                        if start is not None:
+                            employee.start_date = start
+                            employees_changed = True
+                            changed += 1
+                if employees_changed:
+                    self.storage.save_employees(employees)
+
+                schedules = list(self.storage.iter_schedules())
+                schedules_changed = False
+                for schedule in schedules:
+                    if date_ordinal(schedule.week_start_date) is None:
+                        week_start = normalise_date(schedule.week_start_date)
+                        if week_start is not None:
+                            schedule.week_start_date = week_start
+                            schedules_changed = True
+                            changed += 1
+                if schedules_changed:
+                    # One rewrite keeps the rows in order; the payroll totals rebuild from the new stamp
+                    self.storage.save_schedules(schedules)
+
+                if upgraded:
+                    return True, changed, f"Gave schedule IDs to {upgraded} schedules from an older schedules file"
+                return True, changed, ""
+        except Exception as e:
+            return False, 0, f"Failed to migrate dates: {str(e)}"
+
+    # Payroll totals
+    def _current_payroll_totals(self) -> Optional[PayrollTotals]:
+        """Return totals matching the stored schedules, loading or rebuilding them if needed"""
+        stamp = self.storage.schedules_stamp()
+        if stamp is None:
+            # e.g. inside a transaction, where changes haven't been written yet
+            return None
+
+        totals = self.payroll_totals
+        if totals.stamp == stamp:
+            return totals
+        # Folder lock before thread lock, the order writes take them in
+        with self.storage.shared(), self._payroll_lock:
+            stamp = self.storage.schedules_stamp()
+            if totals.stamp == stamp:
+                return totals
+            if totals.load() and totals.stamp == stamp:
+                return totals
+
+            totals.rebuild(self.storage.iter_schedules(), stamp)
+            return totals
+
+    def _record_payroll_change(self, totals: Optional[PayrollTotals], removed: List[Schedule], added: List[Schedule]) -> None:
+        """Carry a schedule write that has already been stored into the totals"""
+        if totals is None:
+            return
+        try:
+            totals.record(removed, added, self.storage.schedules_stamp())
+        except Exception:
+            # The saved stamp no longer matches, so the next read rebuilds them
+            totals.stamp = None
+
+    def get_payroll_totals(self) -> Tuple[bool, Optional[PayrollTotals], str]:
+        """
+        Get per-employee weekly totals for answering date-range totals directly
+
+        Returns:
+            Tuple[bool, Optional[PayrollTotals], str]: (Success status, Totals or None where
+            the storage can't keep them current, Error message)
+        """
+        try:
+            return True, self._current_payroll_totals(), ""
+        except Exception as e:
+            return False, None, f"Failed to load payroll totals: {str(e)}"
+
+    def compact_schedules(self) -> Tuple[bool, str]:
+        """Fold logged schedule changes back into storage"""
+        try:
+            with self.storage.exclusive():
+                totals = self._current_payroll_totals()
+                changes = self.storage.compact_schedules()
+                # Same schedules, new files: only the stamp moves on
+                self._record_payroll_change(totals, [], [])
+            if not changes:
+                return True, "No schedule changes to compact"
+            return True, f"Compacted {changes} schedule changes"
+        except Exception as e:
+            return False, f"Failed to compact schedules: {str(e)}"
+
+    def _prepare_schedule(self, schedule_data: Dict[str, Any]) -> Tuple[bool, Optional[Schedule], str]:
+        """Build the schedule record with a normalised week start, total hours and pay"""
+        # Convert the hours once; missing days are stored as zero rather than blanks
+        schedule = Schedule.from_dict(schedule_data)
+
+        # Store week_start in DD-MM-YYYY format whatever format it came in
+        week_start = normalise_date(schedule.week_start_date)
+        if week_start is None:
+            return False, None, "Invalid date format. Use DD-MM-YYYY"
+        schedule.week_start_date = week_start
+
+        # Calculate total hours and pay
+        schedule.calculate_total_hours()
+
+        # Get employee position for wage calculation
+        success, employee, error = self.get_employee(schedule.employee_id)
+        if not success:
+            return False, None, f"Failed to get employee details: {error}"
+
+        # Calculate total pay from the cached rate table
+        success, rate_table, error = self.get_rate_table()
+        if not success:
+            return False, None, f"Failed to get wage rates: {error}"
+
+        position = employee.job
+        if not position:
+            return False, None, "Position cannot be empty"
+        position_rates = rate_table.get(position.casefold())
+        if position_rates is None:
+            return False, None, f"Position '{position}' not found"
+
+        success, total_pay, error = self.wage_manager.calculate_pay_at_rates(position_rates, schedule.hours)
+        if not success:
+            return False, None, error
+
+        schedule.total_pay = total_pay
+        return True, schedule, ""
+
+    def save_schedule(self, schedule_data: Dict[str, Any]) -> Tuple[bool, str]:
+        """Save schedule to CSV file"""
+        try:
+            if not schedule_data.get('schedule_id'):
+                schedule_data['schedule_id'] = self.generate_schedule_id()
+
+            success, schedule, error = self._prepare_schedule(schedule_data)
+            if not success:
+                return False, error
+
+            # The totals must see every schedule write, including other processes'
+            with self.storage.exclusive():
+                totals = self._current_payroll_totals()
+                self.storage.add_schedule(schedule)
+                self._record_payroll_change(totals, [], [schedule])
+
+            return True, "Schedule saved successfully"
+        except Exception as e:
+            return False, str(e)
+
+    def update_schedule(self, schedule_id: str, schedule_data: Dict[str, Any]) -> Tuple[bool, str]:
+        """Replace a schedule by ID"""
+        try:
+            with self.storage.exclusive():
+                if not self.storage.has_schedule(schedule_id):
+                    return False, f"Schedule with ID {schedule_id} not found"
+
+                schedule_data['schedule_id'] = schedule_id
+                success, schedule, error = self._prepare_schedule(schedule_data)
+                if not success:
+                    return False, error
+
+                totals = self._current_payroll_totals()
+                removed = self.storage.get_schedule_rows(schedule_id) if totals is not None else []
+                self.storage.replace_schedule(schedule)
+                self._record_payroll_change(totals, removed, [schedule])
+
+            return True, "Schedule updated successfully"
+        except Exception as e:
+            return False, f"Failed to update schedule: {str(e)}"
+
+    @staticmethod
+    def _schedule_bounds(start_date: str = None, end_date: str = None) -> Tuple[bool, Optional[int], Optional[int]]:
+        """Parse the range bounds once instead of once per row; False if a bound can't match anything"""
+        start = end = None
+        if start_date:
+            start = date_ordinal(start_date)
+            if start is None:
+                return False, None, None
+        if end_date:
+            end = date_ordinal(end_date)
+            if end is None:
+                return False, None, None
+        return True, start, end
+
+    def get_schedules(self, employee_id: str = None, start_date: str = None, end_date: str = None) -> Tuple[bool, List[Schedule], str]:
+        """Get schedules with optional filtering"""
+        try:
+            valid, start, end = self._schedule_bounds(start_date, end_date)
+            if not valid:
+                return True, [], ""
+
+            schedules = self.storage.query_schedules(employee_id, start, end)
+
+            return True, schedules, ""
+        except Exception as e:
+            return False, [], f"Failed to retrieve schedules: {str(e)}"
+
+    def iter_schedules(self, employee_id: str = None, start_date: str = None, end_date: str = None) -> Tuple[bool, Iterator[Schedule], str]:
+        """
+        Stream schedules with the same filtering as get_schedules
+
+        Rows are read as the iterator is consumed, so only one is held at a
+        time where the backend allows it. Errors while reading are raised
+        from the iterator.
+
+        Returns:
+            Tuple[bool, Iterator[Schedule], str]: (Success status, Schedules, Error message)
+        """
+        try:
+            valid, start, end = self._schedule_bounds(start_date, end_date)
+            if not valid:
+                return True, iter(()), ""
+
+            return True, self.storage.iter_schedules(employee_id, start, end), ""
+        except Exception as e:
+            return False, iter(()), f"Failed to retrieve schedules: {str(e)}"
+
+
+    def load_schedules_by_employee_id(self, employee_id: str) -> Tuple[bool, List[Schedule], str]:
+        """Load all schedules for a specific employee"""
+        return self.get_schedules(employee_id=employee_id)
+
+    def delete_schedule(self, schedule_id: str) -> Tuple[bool, str]:
+        """Delete a schedule by ID"""
+        try:
+            with self.storage.exclusive():
+                totals = self._current_payroll_totals()
+                removed = self.storage.get_schedule_rows(schedule_id) if totals is not None else []
+                if not self.storage.delete_schedule(schedule_id):
+                    return False, f"Schedule with ID {schedule_id} not found"
+                self._record_payroll_change(totals, removed, [])
+
+            return True, "Schedule deleted successfully"
+        except Exception as e:
+            return False, f"Failed to delete schedule: {str(e)}"
+
+    def load_data(self, file_type: str) -> Tuple[bool, List[Dict[str, Any]], str]:
+        """Load data from specified file type"""
+        try:
+            if file_type == "employees":
+                return True, self.storage.get_all_employees(), ""
+
+            elif file_type == "schedules":
+                return True, self.storage.load_schedules(), ""
+
+            elif file_type == "wage_rates":
+                rates = self.storage.load_wage_rates()
+                if rates is None:
+                    return True, [], ""
+                return True, [{"position": k, **v} for k, v in rates.items()], ""
+
+            return False, [], f"Invalid file type: {file_type}"
+
+        except Exception as e:
+            return False, [], f"Error loading {file_type}: {str(e)}"
+
+    def save_data(self, file_type: str, data: List[Dict[str, Any]]) -> Tuple[bool, str]:
+        """Save data to specified file type"""
+        try:
+            if file_type == "employees":
+                if not data:
+                    return True, "No data to save"
+                self.storage.save_employees(data)
+
+            elif file_type == "schedules":
+                if not data:
+                    return True, "No data to save"
+                self.storage.save_schedules(data)
+
+            elif file_type == "wage_rates":
+                rates_dict = {item['position']: {
+                    'base_rate': item['base_rate'],
+                    'weekend_rate': item['weekend_rate']
+                } for item in data}
+                self.storage.save_wage_rates(rates_dict)
+            else:
+                return False, f"Invalid file type: {file_type}"
+
+            return True, f"{file_type} saved successfully"
+
+        except Exception as e:
+            return False, f"Error saving {file_type}: {str(e)}"
+
+    def add_record(self, file_type: str, record: Dict[str, Any]) -> Tuple[bool, str]:
+        """Add new record after checking for duplicate IDs"""
+        try:
+            # Another process's rows mustn't land between loading the data and saving it
+            with self.storage.exclusive():
+                # Get ID field name based on file type
+                id_field = {
+                    "employees": "staff_id",
+                    "schedules": "schedule_id",
+                    "wage_rates": "position"
+                }.get(file_type)
+
+                if not id_field:
+                    return False, f"Invalid file type: {file_type}"
+
+                # Check for duplicate ID
+                if self.check_duplicate_id(file_type, record[id_field]):
+                    return False, f"Duplicate {id_field} found"
+
+                # Validate record
+                valid, msg = self.validate_record(file_type, record)
+                if not valid:
+                    return False, msg
+
+                # Load existing data
+                success, data, error = self.load_data(file_type)
+                if not success:
+                    return False, error
+
+                # Add new record and save
+                data.append(record)
+                return self.save_data(file_type, data)
+
+        except Exception as e:
+            return False, f"Error adding record: {str(e)}"
+
+    def update_record(self, file_type: str, record_id: str, **kwargs) -> Tuple[bool, str]:
+        """Update existing record with new values"""
+        try:
+            # Another process's rows mustn't land between loading the data and saving it
+            with self.storage.exclusive():
+                success, data, error = self.load_data(file_type)
+                if not success:
+                    return False, error
+
+                id_field = {
+                    "employees": "staff_id",
+                    "schedules": "schedule_id",
+                    "wage_rates": "position"
+                }.get(file_type)
+
+                if not id_field:
+                    return False, f"Invalid file type: {file_type}"
+
+                # Find and update record
+                found = False
+                for record in data:
+                    if record[id_field] == record_id:
+                        record.update(kwargs)
+                        found = True
+                        break
+
+                if not found:
+                    return False, f"Record with {id_field}={record_id} not found"
+
+                return self.save_data(file_type, data)
+
+        except Exception as e:
+            return False, f"Error updating record: {str(e)}"
+
+    def delete_record(self, file_type: str, record_id: str) -> Tuple[bool, str]:
+        """Delete record by ID"""
+        try:
+            # Another process's rows mustn't land between loading the data and saving it
+            with self.storage.exclusive():
+                success, data, error = self.load_data(file_type)
+                if not success:
+                    return False, error
+
+                id_field = {
+                    "employees": "staff_id",
+                    "schedules": "schedule_id",
+                    "wage_rates": "position"
+                }.get(file_type)
+
+                if not id_field:
+                    return False, f"Invalid file type: {file_type}"
+
+                # Filter out the record to delete
+                original_length = len(data)
+                data = [record for record in data if record[id_field] != record_id]
+
+                if len(data) == original_length:
+                    return False, f"Record with {id_field}={record_id} not found"
+
+                return self.save_data(file_type, data)
+
+        except Exception as e:
+            return False, f"Error deleting record: {str(e)}"
+
+    def validate_record(self, file_type: str, data: Dict[str, Any]) -> Tuple[bool, str]:
+        """Validate record based on file type"""
+        try:
+            if file_type == "employees":
+                required = ['staff_id', 'fname', 'lname', 'job', 'start']
+                for field in required:
+                    if field not in data:
+                        return False, f"Missing required field: {field}"
+                # Validate date format
+                if date_ordinal(data['start']) is None:
+                    return False, "Invalid date format. Use DD-MM-YYYY"
+
+            elif file_type == "schedules":
+                required = ['schedule_id', 'employee_id', 'week_start',
+                          'mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']
+                for field in required:
+                    if field not in data:
+                        return False, f"Missing required field: {field}"
+                # Validate hours
+                for day in ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']:
+                    try:
+                        hours = float(data[day])
+                        if hours < 0 or hours > 12:
+                            return False, f"Invalid hours for {day}: must be between 0 and 12"
+                    except ValueError:
+                        return False, f"Invalid hours format for {day}"
+
+            elif file_type == "wage_rates":
+                required = ['position', 'base_rate', 'weekend_rate']
+                for field in required:
+                    if field not in data:
+                        return False, f"Missing required field: {field}"
+                # Validate rates
+                try:
+                    if float(data['base_rate']) <= 0 or float(data['weekend_rate']) <= 0:
+                        return False, "Rates must be greater than zero"
+                except ValueError:
+                    return False, "Invalid rate format"
+
+            return True, ""
+
+        except Exception as e:
+            return False, f"Validation error: {str(e)}"
+
+    def check_duplicate_id(self, file_type: str, new_id: str) -> bool:
+        """Check if ID already exists in file"""
+        success, data, _ = self.load_data(file_type)
+        if not success or not data:
+            return False
+
+        id_field = {
+            "employees": "staff_id",
+            "schedules": "schedule_id",
+            "wage_rates": "position"
+        }.get(file_type)
+
+        return any(record[id_field] == new_id for record in data)
+
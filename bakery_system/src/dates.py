@@ -0,0 +1,63 @@
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Optional
+
+# The one date format stored in data files
+DATE_FORMAT = '%d-%m-%Y'
+
+# Formats found in older data files and accepted from users, rewritten to DATE_FORMAT
+LEGACY_DATE_FORMATS = ('%Y-%m-%d', '%d/%m/%Y')
+
+# DD-MM-YYYY, with the same one- or two-digit day and month strptime accepts
+_DATE_PATTERN = re.compile(r'(\d{1,2})-(\d{1,2})-(\d{4})', re.ASCII)
+
+
+@lru_cache(maxsize=8192)
+def date_ordinal(date_str: str) -> Optional[int]:
+    """
+    Convert a DD-MM-YYYY date to a day ordinal, or None if it can't be parsed
+
+    Parses without strptime and caches results, since the same dates (week
+    starts especially) repeat across many rows. Compare the ordinals as
+    plain integers.
+    """
+    try:
+        match = _DATE_PATTERN.fullmatch(date_str)
+        if match is None:
+            return None
+        day, month, year = match.groups()
+        return date(int(year), int(month), int(day)).toordinal()
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=8192)
+def any_date_ordinal(date_str: str) -> Optional[int]:
+    """Convert a date in DATE_FORMAT or one of LEGACY_DATE_FORMATS to a day ordinal"""
+    ordinal = date_ordinal(date_str)
+    if ordinal is not None:
+        return ordinal
+    for legacy_format in LEGACY_DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, legacy_format).toordinal()
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def format_ordinal(ordinal: int) -> str:
+    """Convert a day ordinal back to a DD-MM-YYYY date"""
+    day = date.fromordinal(ordinal)
+    return f"{day.day:02d}-{day.month:02d}-{day.year:04d}"
+
+
+def normalise_date(date_str: str) -> Optional[str]:
+    """Rewrite a date in any accepted format as DD-MM-YYYY, or None if it can't be parsed"""
+    ordinal = any_date_ordinal(date_str)
+    return format_ordinal(ordinal) if ordinal is not None else None
+
+
+def today_ordinal() -> int:
+    """Today's date as a day ordinal"""
+    return date.today().toordinal()
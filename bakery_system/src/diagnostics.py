@@ -0,0 +1,292 @@
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+# Upper bounds of the latency histogram buckets in ms; the last bucket is everything slower
+LATENCY_BUCKETS_MS = (0.1, 1.0, 10.0, 100.0, 1000.0, 10000.0)
+
+
+class OperationStats:
+    """Call count, latency histogram and I/O for one instrumented method"""
+
+    __slots__ = ('calls', 'total_ms', 'max_ms', 'histogram', 'bytes_read', 'bytes_written', 'file_opens')
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.file_opens = 0
+
+    def add(self, elapsed_ms: float, bytes_read: int, bytes_written: int, file_opens: int) -> None:
+        self.calls += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        bucket = 0
+        while bucket < len(LATENCY_BUCKETS_MS) and elapsed_ms > LATENCY_BUCKETS_MS[bucket]:
+            bucket += 1
+        self.histogram[bucket] += 1
+        self.bytes_read += bytes_read
+        self.bytes_written += bytes_written
+        self.file_opens += file_opens
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'calls': self.calls,
+            'total_ms': round(self.total_ms, 3),
+            'mean_ms': round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            'max_ms': round(self.max_ms, 3),
+            'histogram': dict(zip(histogram_labels(), self.histogram)),
+            'bytes_read': self.bytes_read,
+            'bytes_written': self.bytes_written,
+            'file_opens': self.file_opens,
+        }
+
+
+def histogram_labels() -> List[str]:
+    """Labels for the latency buckets, e.g. "<=1ms" and ">10s" """
+    def label(ms: float) -> str:
+        return f"{ms / 1000:g}s" if ms >= 1000 else f"{ms:g}ms"
+    return [f"<={label(ms)}" for ms in LATENCY_BUCKETS_MS] + [f">{label(LATENCY_BUCKETS_MS[-1])}"]
+
+
+class _ProcessIO:
+    """
+    Bytes read and written by this process, from /proc/self/io on Linux
+
+    The counters cover every read and write system call, SQLite's included.
+    Reading the counters is itself a read, so the bytes read by earlier
+    samples are taken off. Elsewhere sample() returns None and no bytes are
+    reported.
+    """
+
+    def __init__(self):
+        self._fd: Optional[int] = None
+        self._own_reads = 0
+        try:
+            self._fd = os.open('/proc/self/io', os.O_RDONLY)
+        except OSError:
+            pass
+
+    @property
+    def available(self) -> bool:
+        return self._fd is not None
+
+    def sample(self) -> Optional[Tuple[int, int]]:
+        """(Bytes read, bytes written) so far, or None without /proc"""
+        if self._fd is None:
+            return None
+        data = os.pread(self._fd, 512, 0)
+        counters = dict(line.split(b': ') for line in data.splitlines() if b': ' in line)
+        read = int(counters[b'rchar']) - self._own_reads
+        self._own_reads += len(data)
+        return read, int(counters[b'wchar'])
+
+
+class Capture:
+    """A cProfile and/or tracemalloc capture of one menu action"""
+
+    def __init__(self, action: str):
+        self.action = action
+        self.started = datetime.now().isoformat(timespec='seconds')
+        self.elapsed_ms = 0.0
+        self.profile: Optional[str] = None
+        self.memory: Optional[str] = None
+        self.peak_memory: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'action': self.action,
+            'started': self.started,
+            'elapsed_ms': round(self.elapsed_ms, 3),
+            'profile': self.profile,
+            'memory': self.memory,
+            'peak_memory': self.peak_memory,
+        }
+
+
+class Diagnostics:
+    """
+    Opt-in per-operation statistics and profiling
+
+    Methods of classes decorated with @instrumented report to the shared
+    instance below. Nothing is recorded until enable() is called; the wrapped
+    methods then cost one attribute check per call. Statistics are
+    inclusive, so a report that calls DataManager methods counts their time
+    and I/O as well. For methods that return iterators only the call itself
+    is measured, not the rows read as the iterator is consumed.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        # Profile menu actions with cProfile and/or tracemalloc
+        self.profiling = False
+        self.tracing = False
+
+        # Rows shown from each profile, and recent captures kept for viewing and dumping
+        self.profile_limit = 25
+        self.memory_limit = 10
+        self.captures: Deque[Capture] = deque(maxlen=10)
+
+        self.stats: Dict[str, OperationStats] = {}
+        self._file_opens = 0
+        self._io: Optional[_ProcessIO] = None
+
+    def enable(self) -> None:
+        """Start recording operation statistics"""
+        if self._io is None:
+            self._io = _ProcessIO()
+            # Audit hooks can't be removed, so this one stays and checks enabled
+            sys.addaudithook(self._audit)
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Forget all statistics and captures"""
+        self.stats = {}
+        self.captures.clear()
+
+    def _audit(self, event: str, args: Tuple) -> None:
+        if self.enabled and (event == 'open' or event == 'sqlite3.connect'):
+            self._file_opens += 1
+
+    def call(self, name: str, func: Callable, args: Tuple, kwargs: Dict[str, Any]) -> Any:
+        """Run func and record its latency and I/O under name"""
+        opens = self._file_opens
+        io_before = self._io.sample()
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            io_after = self._io.sample()
+            bytes_read = bytes_written = 0
+            if io_before is not None and io_after is not None:
+                bytes_read = io_after[0] - io_before[0]
+                bytes_written = io_after[1] - io_before[1]
+
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = OperationStats()
+            stats.add(elapsed_ms, bytes_read, bytes_written, self._file_opens - opens)
+
+    @contextmanager
+    def capture(self, action: str) -> Iterator[None]:
+        """
+        Profile one menu action if profiling or tracing is on
+
+        cProfile counts CPU time rather than wall time, so time spent waiting
+        at input prompts doesn't swamp the profile.
+        """
+        if not (self.profiling or self.tracing):
+            yield
+            return
+
+        capture = Capture(action)
+        profiler = cProfile.Profile(time.process_time) if self.profiling else None
+        tracing = self.tracing and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        start = time.perf_counter()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            capture.elapsed_ms = (time.perf_counter() - start) * 1000
+
+            if profiler is not None:
+                out = io.StringIO()
+                pstats.Stats(profiler, stream=out).sort_stats('cumulative').print_stats(self.profile_limit)
+                capture.profile = out.getvalue()
+            if tracing:
+                snapshot = tracemalloc.take_snapshot()
+                capture.peak_memory = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                top = snapshot.statistics('lineno')[:self.memory_limit]
+                capture.memory = '\n'.join(str(stat) for stat in top)
+            self.captures.append(capture)
+
+    def operation_rows(self) -> List[Dict[str, Any]]:
+        """Statistics per operation, slowest in total first"""
+        rows = []
+        labels = histogram_labels()
+        for name, stats in sorted(self.stats.items(), key=lambda item: -item[1].total_ms):
+            histogram = ' '.join(f"{label}:{count}" for label, count in zip(labels, stats.histogram) if count)
+            rows.append({
+                'Operation': name,
+                'Calls': stats.calls,
+                'Total ms': round(stats.total_ms, 1),
+                'Mean ms': round(stats.total_ms / stats.calls, 3),
+                'Max ms': round(stats.max_ms, 3),
+                'Read KB': round(stats.bytes_read / 1024, 1),
+                'Written KB': round(stats.bytes_written / 1024, 1),
+                'File Opens': stats.file_opens,
+                'Latency': histogram,
+            })
+        return rows
+
+    def dump(self, file_path: Path) -> Tuple[bool, str]:
+        """Write statistics and captures to a JSON file"""
+        try:
+            data = {
+                'generated': datetime.now().isoformat(timespec='seconds'),
+                'io_counters': self._io is not None and self._io.available,
+                'operations': {name: stats.to_dict() for name, stats in self.stats.items()},
+                'captures': [capture.to_dict() for capture in self.captures],
+            }
+            with Path(file_path).open('w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            return True, str(file_path)
+        except Exception as e:
+            return False, f"Failed to save diagnostics: {str(e)}"
+
+
+# Shared by every instrumented class
+diagnostics = Diagnostics()
+
+
+def _instrument(name: str, func: Callable) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not diagnostics.enabled:
+            return func(*args, **kwargs)
+        return diagnostics.call(name, func, args, kwargs)
+    return wrapper
+
+
+def instrumented(cls: type) -> type:
+    """
+    Class decorator recording each public method's calls in diagnostics
+
+    Methods already wrapped by another decorator (such as contextmanager)
+    are left alone, since timing the wrapper wouldn't time the work.
+    """
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith('_'):
+            continue
+        name = f"{cls.__name__}.{attr}"
+        if isinstance(value, (staticmethod, classmethod)):
+            if hasattr(value.__func__, '__wrapped__'):
+                continue
+            setattr(cls, attr, type(value)(_instrument(name, value.__func__)))
+        elif callable(value) and not hasattr(value, '__wrapped__'):
+            setattr(cls, attr, _instrument(name, value))
+    return cls
@@ -1,102 +1,173 @@
-from datetime import datetime
-from typing import Optional, Dict, Tuple
-
-class Employee:
-    def __init__(self, emp_id: Optional[str], first_name: str, last_name: str, position: str, start_date: str):
-        self.staff_id = emp_id
-        self.fname = first_name
-        self.lname = last_name
-        self.job = position
-        self.start_date = start_date
-
-    @classmethod
-    def validate_name(cls, name: str) -> Tuple[bool, str]:
-        """Validate employee name"""
-        if not name or not name.strip():
-            return False, "Name cannot be empty"
-        if not all(c.isalpha() or c.isspace() for c in name):
-            return False, "Name can only contain letters and spaces"
-        if len(name) > 30:
-            return False, "Name must be less than 30 characters"
-        return True, ""
-
-    @classmethod
-    def validate_date(cls, date_str: str) -> Tuple[bool, str]:
-        """Validate date format (DD-MM-YYYY)"""
-        try:
-            datetime.strptime(date_str, '%d-%m-%Y')
-            return True, ""
-        except ValueError:
-            return False, "Invalid date format. Use DD-MM-YYYY"
-
-    def validate(self) -> Tuple[bool, str]:
-        """Validate all employee data"""
-        # Validate first name
-        name_valid, name_msg = self.validate_name(self.fname)
-        if not name_valid:
-            return False, f"Invalid first name: {name_msg}"
-
-        # Validate last name
-        name_valid, name_msg = self.validate_name(self.lname)
-        if not name_valid:
-            return False, f"Invalid last name: {name_msg}"
-
-        # Validate date
-        date_valid, date_msg = self.validate_date(self.start_date)
-        if not date_valid:
-            return False, date_msg
-
-        # Validate position
-        if not self.job:
-            return False, "Position cannot be empty"
-
-        return True, ""
-
-    def to_dict(self) -> Dict[str, str]:
-        """Convert employee object to dictionary for storage"""
-        return {
-            'staff_id': self.staff_id,
-            'fname': self.fname,
-            'lname': self.lname,
-            'job': self.job,
-            'start': self.start_date
-        }
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, str]) -> 'Employee':
-        """Create employee object from dictionary data"""
-        return cls(
-            data['staff_id'],
-            data['fname'],
-            data['lname'],
-            data['job'],
-            data['start']
-        )
-
-    def calculate_tenure(self) -> int:
-        """Calculate employee tenure in days"""
-        start = datetime.strptime(self.start_date, '%d-%m-%Y')
-        return (datetime.now() - start).days
-
-    def update_name(self, new_first_name: str, new_last_name: str) -> Tuple[bool, str]:
-        """Update employee name with validation"""
-        if new_first_name:
-            valid, msg = self.validate_name(new_first_name)
-            if not valid:
-                return False, f"Invalid first name: {msg}"
-            self.fname = new_first_name
-
-        if new_last_name:
-            valid, msg = self.validate_name(new_last_name)
-            if not valid:
-                return False, f"Invalid last name: {msg}"
-            self.lname = new_last_name
-
-        return True, "Name updated successfully"
-
-    def update_position(self, new_position: str) -> Tuple[bool, str]:
-        """Update employee position with validation"""
-        if not new_position:
-            return False, "Position cannot be empty"
-        self.job = new_position
-        return True, "Position updated successfully"
+from collections.abc import MutableMapping
+from typing import Optional, Dict, Tuple, Iterator, List, Sequence
+from dates import date_ordinal, any_date_ordinal, today_ordinal
+
+EMPLOYEE_FIELDS = ['staff_id', 'fname', 'lname', 'job', 'start']
+
+# Fields no stored employee can do without
+REQUIRED_EMPLOYEE_FIELDS = ['staff_id']
+
+# Stored field name -> attribute
+_FIELD_ATTRS = {
+    'staff_id': 'staff_id',
+    'fname': 'fname',
+    'lname': 'lname',
+    'job': 'job',
+    'start': 'start_date'
+}
+
+
+class Employee(MutableMapping):
+    """
+    A member of staff
+
+    Fields live in __slots__ rather than a per-object dict. An employee can
+    also be read and written like the row it is stored as, e.g.
+    employee['job'] or dict(employee), keyed by EMPLOYEE_FIELDS.
+    """
+
+    __slots__ = ('staff_id', 'fname', 'lname', 'job', 'start_date')
+
+    def __init__(self, emp_id: Optional[str], first_name: str, last_name: str, position: str, start_date: str):
+        self.staff_id = emp_id
+        self.fname = first_name
+        self.lname = last_name
+        self.job = position
+        self.start_date = start_date
+
+    # Row access
+    def __getitem__(self, key: str) -> str:
+        try:
+            return getattr(self, _FIELD_ATTRS[key])
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: str) -> None:
+        try:
+            setattr(self, _FIELD_ATTRS[key], value)
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("Employee fields can't be removed")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(EMPLOYEE_FIELDS)
+
+    def __len__(self) -> int:
+        return len(EMPLOYEE_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"Employee({self.to_dict()!r})"
+
+    @classmethod
+    def validate_name(cls, name: str) -> Tuple[bool, str]:
+        """Validate employee name"""
+        if not name or not name.strip():
+            return False, "Name cannot be empty"
+        if not all(c.isalpha() or c.isspace() for c in name):
+            return False, "Name can only contain letters and spaces"
+        if len(name) > 30:
+            return False, "Name must be less than 30 characters"
+        return True, ""
+
+    @classmethod
+    def validate_date(cls, date_str: str) -> Tuple[bool, str]:
+        """Validate date format (DD-MM-YYYY)"""
+        if date_ordinal(date_str) is None:
+            return False, "Invalid date format. Use DD-MM-YYYY"
+        return True, ""
+
+    def validate(self) -> Tuple[bool, str]:
+        """Validate all employee data"""
+        # Validate first name
+        name_valid, name_msg = self.validate_name(self.fname)
+        if not name_valid:
+            return False, f"Invalid first name: {name_msg}"
+
+        # Validate last name
+        name_valid, name_msg = self.validate_name(self.lname)
+        if not name_valid:
+            return False, f"Invalid last name: {name_msg}"
+
+        # Validate date
+        date_valid, date_msg = self.validate_date(self.start_date)
+        if not date_valid:
+            return False, date_msg
+
+        # Validate position
+        if not self.job:
+            return False, "Position cannot be empty"
+
+        return True, ""
+
+    def to_dict(self) -> Dict[str, str]:
+        """Convert employee object to dictionary for storage"""
+        return {
+            'staff_id': self.staff_id,
+            'fname': self.fname,
+            'lname': self.lname,
+            'job': self.job,
+            'start': self.start_date
+        }
+
+    def to_values(self) -> List[str]:
+        """Field values in EMPLOYEE_FIELDS order"""
+        return [self.staff_id, self.fname, self.lname, self.job, self.start_date]
+
+    def copy(self) -> 'Employee':
+        """Return an independent copy of this employee"""
+        return Employee(self.staff_id, self.fname, self.lname, self.job, self.start_date)
+
+    @classmethod
+    def from_values(cls, values: Sequence[str]) -> 'Employee':
+        """Create employee object from stored values in EMPLOYEE_FIELDS order"""
+        return cls(*values)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, str]) -> 'Employee':
+        """Create employee object from dictionary data"""
+        if isinstance(data, Employee):
+            return data.copy()
+        return cls(
+            data['staff_id'],
+            data['fname'],
+            data['lname'],
+            data['job'],
+            data['start']
+        )
+
+    @property
+    def start_ordinal(self) -> Optional[int]:
+        """Start date as a day ordinal (legacy formats accepted), or None if it can't be parsed"""
+        return any_date_ordinal(self.start_date)
+
+    def calculate_tenure(self, today: Optional[int] = None) -> int:
+        """Calculate employee tenure in days, optionally as of a given day ordinal"""
+        start = self.start_ordinal
+        if start is None:
+            raise ValueError(f"Invalid start date for {self.staff_id}: {self.start_date}")
+        return (today if today is not None else today_ordinal()) - start
+
+    def update_name(self, new_first_name: str, new_last_name: str) -> Tuple[bool, str]:
+        """Update employee name with validation"""
+        if new_first_name:
+            valid, msg = self.validate_name(new_first_name)
+            if not valid:
+                return False, f"Invalid first name: {msg}"
+            self.fname = new_first_name
+
+        if new_last_name:
+            valid, msg = self.validate_name(new_last_name)
+            if not valid:
+                return False, f"Invalid last name: {msg}"
+            self.lname = new_last_name
+
+        return True, "Name updated successfully"
+
+    def update_position(self, new_position: str) -> Tuple[bool, str]:
+        """Update employee position with validation"""
+        if not new_position:
+            return False, "Position cannot be empty"
+        self.job = new_position
+        return True, "Position updated successfully"
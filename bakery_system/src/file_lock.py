@@ -0,0 +1,73 @@
+from pathlib import Path
+from contextlib import contextmanager
+import threading
+from typing import Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:
+    # No advisory locks on Windows, so processes sharing a data folder there go unprotected
+    fcntl = None
+
+# Lock modes held by a thread
+LOCK_SHARED = 1
+LOCK_EXCLUSIVE = 2
+
+
+class FileLock:
+    """
+    Shared/exclusive advisory lock on a lock file, for readers and writers across processes
+
+    Any number of holders of the shared lock run together, in this process
+    or others; the exclusive lock waits for them and keeps everyone else
+    out. Each acquisition opens the lock file afresh, so threads in one
+    process exclude each other the same way separate processes do.
+
+    Locks are reentrant within a thread: taking either lock while holding
+    the exclusive one, or the shared one while holding the shared one, is a
+    no-op. Asking for the exclusive lock while holding only the shared one
+    raises RuntimeError, as waiting would deadlock against other readers.
+    """
+
+    def __init__(self, lock_file: Path):
+        self.lock_file = Path(lock_file)
+        self._held = threading.local()
+
+    def _mode(self) -> Optional[int]:
+        return getattr(self._held, 'mode', None)
+
+    @contextmanager
+    def _acquire(self, mode: int) -> Iterator[None]:
+        held = self._mode()
+        if held is not None:
+            if held == LOCK_SHARED and mode == LOCK_EXCLUSIVE:
+                raise RuntimeError(f"Can't take an exclusive lock on {self.lock_file} while holding a shared one")
+            yield
+            return
+
+        try:
+            lock = self.lock_file.open('a')
+        except FileNotFoundError:
+            # No data folder yet, so nothing to protect
+            lock = None
+
+        try:
+            if lock is not None and fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX if mode == LOCK_EXCLUSIVE else fcntl.LOCK_SH)
+            self._held.mode = mode
+            try:
+                yield
+            finally:
+                self._held.mode = None
+        finally:
+            # Closing the file releases the lock
+            if lock is not None:
+                lock.close()
+
+    def shared(self):
+        """Hold the lock alongside other readers"""
+        return self._acquire(LOCK_SHARED)
+
+    def exclusive(self):
+        """Hold the lock alone"""
+        return self._acquire(LOCK_EXCLUSIVE)
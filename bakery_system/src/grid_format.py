@@ -0,0 +1,195 @@
+import math
+import re
+from typing import Any, List, Sequence, TextIO, Tuple
+from tabulate import tabulate
+
+try:
+    from wcwidth import wcswidth
+except ImportError:
+    # tabulate measures text with len() when wcwidth isn't installed
+    wcswidth = None
+
+# Column types in the order tabulate generalises them
+_NONE, _BOOL, _INT, _FLOAT, _STR = range(5)
+
+# Numbers like "1,234.5", as tabulate recognises them
+_THOUSANDS = re.compile(r"^(([+-]?[0-9]{1,3})(?:,([0-9]{3}))*)?(?(1)\.[0-9]*|\.[0-9]+)?$")
+
+
+class _Unsupported(Exception):
+    """A value the fast path can't lay out exactly like tabulate"""
+
+
+def _value_type(value: Any) -> int:
+    """The least general column type that can hold value"""
+    value_type = type(value)
+    if value_type is float:
+        return _FLOAT
+    if value_type is str:
+        if not value:
+            return _NONE
+        if value in ('True', 'False'):
+            return _BOOL
+        try:
+            int(value)
+            return _INT
+        except ValueError:
+            pass
+        if '.' not in value and _THOUSANDS.match(value):
+            return _INT
+        try:
+            number = float(value)
+        except ValueError:
+            number = None
+        if number is not None and (not (math.isinf(number) or math.isnan(number))
+                                   or value.lower() in ('inf', '-inf', 'nan')):
+            return _FLOAT
+        if _THOUSANDS.match(value):
+            return _FLOAT
+        return _STR
+    if value is None:
+        return _NONE
+    if value_type is bool:
+        return _BOOL
+    if value_type is int:
+        return _INT
+    raise _Unsupported(value_type)
+
+
+def _format_value(value: Any, column_type: int) -> str:
+    """Format a value the way tabulate does for its column type"""
+    if value is None or value == '':
+        return ''
+    if column_type == _FLOAT:
+        if type(value) is str and ',' in value:
+            value = value.replace(',', '')
+        try:
+            return format(float(value), 'g')
+        except (ValueError, TypeError):
+            return f"{value}"
+    return f"{value}"
+
+
+def _afterpoint(text: str) -> int:
+    """Characters after the decimal point (or exponent) of a formatted float, -1 if none"""
+    point = text.rfind('.')
+    if point < 0:
+        point = text.rfind('e')
+    if point < 0:
+        return -1
+    try:
+        # Values that couldn't be formatted as floats (e.g. "True") don't count
+        float(text)
+    except ValueError:
+        return -1
+    return len(text) - point - 1
+
+
+def _text_width(text: str) -> int:
+    """Width of a cell as tabulate measures it"""
+    if not text.isprintable():
+        # Multi-line cells and ANSI colour codes change tabulate's layout
+        raise _Unsupported(text)
+    if text.isascii() or wcswidth is None:
+        return len(text)
+    width = wcswidth(text)
+    if width < 0:
+        raise _Unsupported(text)
+    return width
+
+
+def _layout(headers: List[str], rows: Sequence[Sequence[Any]]) -> Tuple[List[int], List[int], List[int]]:
+    """Work out each column's type, width and decimal places"""
+    columns = len(headers)
+    types = [_BOOL] * columns
+    for row in rows:
+        if len(row) != columns:
+            raise _Unsupported(row)
+        for j, value in enumerate(row):
+            if types[j] != _STR:
+                value_type = _value_type(value)
+                if value_type > types[j]:
+                    types[j] = value_type
+
+    # Headers need two spaces more than their text, as in tabulate
+    widths = [_text_width(header) + 2 for header in headers]
+    decimals = [-1] * columns
+    whole = [0] * columns
+    for row in rows:
+        for j, value in enumerate(row):
+            text = _format_value(value, types[j])
+            if types[j] == _FLOAT:
+                places = _afterpoint(text)
+                decimals[j] = max(decimals[j], places)
+                whole[j] = max(whole[j], _text_width(text) - places)
+            elif types[j] == _INT:
+                widths[j] = max(widths[j], _text_width(text))
+            else:
+                widths[j] = max(widths[j], _text_width(text.strip()))
+
+    for j in range(columns):
+        if types[j] == _FLOAT:
+            widths[j] = max(widths[j], whole[j] + decimals[j])
+    return types, widths, decimals
+
+
+def _write_fast(f: TextIO, headers: List[str], rows: Sequence[Sequence[Any]],
+                layout: Tuple[List[int], List[int], List[int]]) -> None:
+    types, widths, decimals = layout
+    numeric = [column_type in (_INT, _FLOAT) for column_type in types]
+
+    line = '+' + '+'.join('-' * (width + 2) for width in widths) + '+\n'
+    header_cells = [
+        ' ' * (width - _text_width(header)) + header if right else header + ' ' * (width - _text_width(header))
+        for header, width, right in zip(headers, widths, numeric)
+    ]
+    f.write(line)
+    f.write('| ' + ' | '.join(header_cells) + ' |\n')
+    f.write('+' + '+'.join('=' * (width + 2) for width in widths) + '+\n')
+
+    for row in rows:
+        cells = []
+        for value, column_type, width, places in zip(row, types, widths, decimals):
+            text = _format_value(value, column_type)
+            if column_type == _FLOAT:
+                # Line up decimal points, then right-align
+                text += ' ' * (places - _afterpoint(text))
+                cells.append(' ' * (width - _text_width(text)) + text)
+            elif column_type == _INT:
+                cells.append(' ' * (width - _text_width(text)) + text)
+            else:
+                text = text.strip()
+                cells.append(text + ' ' * (width - _text_width(text)))
+        f.write('| ' + ' | '.join(cells) + ' |\n')
+        f.write(line)
+
+
+def write_grid(f: TextIO, headers: Sequence[Any], rows: Sequence[Sequence[Any]]) -> None:
+    """
+    Write a table in tabulate's "grid" format, one line at a time
+
+    The output is identical to tabulate(rows, headers, tablefmt="grid")
+    followed by a newline, but the table is never built as one string.
+    Rows are read three times (types, widths, then output), so they must
+    be a sequence rather than an iterator. Tables the fast path can't
+    reproduce exactly (multi-line cells, colour codes, unusual value types)
+    are handed to tabulate.
+
+    Args:
+        f (TextIO): File to write to
+        headers (Sequence[Any]): Column headers
+        rows (Sequence[Sequence[Any]]): Row values in header order
+    """
+    headers = [str(header) for header in headers]
+    if rows and headers:
+        try:
+            # Check the whole table before writing anything
+            layout = _layout(headers, rows)
+        except _Unsupported:
+            pass
+        else:
+            _write_fast(f, headers, rows, layout)
+            return
+
+    f.write(tabulate([list(row) for row in rows], headers=headers, tablefmt="grid"))
+    f.write('\n')
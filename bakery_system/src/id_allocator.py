@@ -0,0 +1,88 @@
+from pathlib import Path
+from contextlib import contextmanager
+import json
+from typing import Callable, Dict, Iterator, Optional, Set
+from storage import atomic_write
+
+try:
+    import fcntl
+except ImportError:
+    # No advisory locks on Windows; IDs are still unique within one process
+    fcntl = None
+
+
+class IdAllocator:
+    """
+    Sequential ID numbers kept in a small JSON counter file
+
+    Each sequence (e.g. "E" for employees, "S" for schedules) stores the last
+    number handed out. The counter file is rewritten atomically before any
+    numbers are returned, so a crash can skip numbers but never reuse them.
+    A lock file keeps separate processes from handing out the same numbers.
+
+    The counter is checked against the stored IDs the first time each
+    allocator uses a sequence, and again whenever a number it is about to
+    hand out turns out to be taken, so rows written by other tools or
+    restored from a backup don't collide with new ones.
+    """
+
+    def __init__(self, counter_file: Path):
+        self.counter_file = Path(counter_file)
+        self.lock_file = self.counter_file.with_name(self.counter_file.name + '.lock')
+        # Sequences already checked against the stored IDs by this allocator
+        self._reconciled: Set[str] = set()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold an exclusive lock on the lock file"""
+        with self.lock_file.open('a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def _read_counters(self) -> Dict[str, int]:
+        if not self.counter_file.exists():
+            return {}
+        with self.counter_file.open('r') as f:
+            return json.load(f)
+
+    def reserve(self, sequence: str, count: int, seed: Callable[[], int],
+                in_use: Optional[Callable[[int], bool]] = None) -> int:
+        """
+        Reserve a contiguous block of numbers
+
+        Args:
+            sequence (str): Name of the sequence, e.g. "E"
+            count (int): How many numbers to reserve
+            seed (Callable[[], int]): Returns the highest number already in use
+            in_use (Optional[Callable[[int], bool]]): Whether a number is already
+                taken; checked for the first and last number of each block
+
+        Returns:
+            int: The first number in the block
+        """
+        if count < 1:
+            raise ValueError("Count must be at least 1")
+
+        with self._locked():
+            counters = self._read_counters()
+            last = counters.get(sequence)
+            if last is None or sequence not in self._reconciled:
+                last = max(last or 0, seed())
+                self._reconciled.add(sequence)
+            elif in_use is not None and (in_use(last + 1) or in_use(last + count)):
+                last = max(last, seed())
+
+            counters[sequence] = last + count
+            with atomic_write(self.counter_file) as f:
+                json.dump(counters, f, indent=4)
+
+        return last + 1
+
+    def next(self, sequence: str, seed: Callable[[], int], in_use: Optional[Callable[[int], bool]] = None) -> int:
+        """Return the next number in a sequence"""
+        return self.reserve(sequence, 1, seed, in_use)
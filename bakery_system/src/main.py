@@ -1,341 +1,656 @@
-from data_manager import DataManager
-from reports import Reports
-from schedule import Schedule
-from tabulate import tabulate
-from datetime import datetime
-
-# Initialize managers
-data_manager = DataManager()
-reports = Reports(data_manager)
-
-def display_main_menu():
-    print("Welcome to Murphy's Bakery Management System:")
-    print("1. Employee Management")
-    print("2. Schedule Management")
-    print("3. Wages and Positions")
-    print("4. Reports")
-    print("5. Exit")
-
-def employee_management():
-    while True:
-        print("\n----- Employee Management -----")
-        print("1. Add New Employee")
-        print("2. View Employee Details")
-        print("3. Update Employee Record")
-        print("4. Delete Employee")
-        print("5. List All Employees")
-        print("0. Back to Main Menu")
-
-        choice = input("Choose an option: ").strip()
-
-        if choice == '0':
-            break
-        elif choice == '1':
-            fname = input("First name: ").strip()
-            lname = input("Last name: ").strip()
-            job = input("Job title: ").strip()
-            start_date = input("Start date (DD-MM-YYYY): ").strip()
-
-            success, msg = data_manager.add_employee(fname, lname, job, start_date)
-            print(msg if success else f"Error: {msg}")
-
-        elif choice == '2':
-            emp_id = input("Enter Employee ID (e.g., E001): ").strip()
-            if not emp_id.startswith('E') or not emp_id[1:].isdigit():
-                print("Error: Invalid ID format. Use E followed by numbers (e.g., E001)")
-                continue
-
-            success, employee, error = data_manager.get_employee(emp_id)
-            if success and employee:
-                print("\nEmployee Details:")
-                print(tabulate([employee], headers="keys"))
-            else:
-                print(f"Employee not found: {error}")
-
-        elif choice == '3':
-            emp_id = input("Employee ID: ").strip()
-            new_fname = input("New first name (or press Enter to skip): ").strip()
-            new_lname = input("New last name (or press Enter to skip): ").strip()
-            new_job = input("New job title (or press Enter to skip): ").strip()
-
-            # Skip empty inputs
-            new_fname = new_fname if new_fname else None
-            new_lname = new_lname if new_lname else None
-            new_job = new_job if new_job else None
-
-            success, msg = data_manager.update_employee(emp_id, new_fname, new_lname, new_job)
-            print("Updated successfully!" if success else f"Error: {msg}")
-
-        elif choice == '4':
-            emp_id = input("Employee ID to remove: ").strip()
-            confirm = input("Are you sure? (y/n): ").strip().lower()
-            if confirm == 'y':
-                success, msg = data_manager.delete_employee(emp_id)
-                print("Employee removed successfully!" if success else f"Error: {msg}")
-
-        elif choice == '5':
-            success, staff_list, error = data_manager.get_all_employees()
-            if success:
-                print("\nAll Employees:")
-                print(tabulate(staff_list, headers="keys"))
-            else:
-                print(f"Error: {error}")
-        else:
-            print("Invalid choice. Please try again.")
-
-def schedule_management():
-    while True:
-        print("\n----- Schedule Management -----")
-        print("1. Create/Update Weekly Schedule")
-        print("2. View Schedule for Employee")
-        print("3. Delete Schedule")
-        print("4. List All Schedules")
-        print("0. Back to Main Menu")
-
-        choice = input("Choose an option: ").strip()
-
-        if choice == '0':
-            break
-        elif choice == '1':
-            emp_id = input("Employee ID: ").strip()
-            week_start = input("Week start date (DD-MM-YYYY): ").strip()
-
-            # Create schedule ID using timestamp
-            schedule_id = f"SCH_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-            schedule = Schedule(schedule_id, emp_id, week_start, {})
-
-            days = ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']
-            daily_hours = {}
-
-            for day in days:
-                while True:
-                    try:
-                        hours = float(input(f"{day.capitalize()} hours: "))
-                        if 0 <= hours <= 12:
-                            daily_hours[day] = hours
-                            break
-                        print("Hours must be between 0 and 12")
-                    except ValueError:
-                        print("Please enter a valid number")
-
-            # Validate total weekly hours
-            if sum(daily_hours.values()) > 48:
-                print("Error: Total weekly hours cannot exceed 48")
-                continue
-
-            schedule.hours = daily_hours
-            success, msg = data_manager.save_schedule(schedule.__dict__)
-            print(msg if success else f"Error: {msg}")
-
-        elif choice == '2':
-            emp_id = input("Employee ID: ").strip()
-            start_date = input("Start date (DD-MM-YYYY): ").strip()
-            end_date = input("End date (DD-MM-YYYY): ").strip()
-
-            success, schedules, error = reports.generate_employee_schedule(emp_id, start_date, end_date)
-            if success:
-                print("\nEmployee Schedule:")
-                print(tabulate(schedules, headers="keys"))
-            else:
-                print(f"Error: {error}")
-
-        elif choice == '3':
-            schedule_id = input("Schedule ID: ").strip()
-            confirm = input("Are you sure? (y/n): ").strip().lower()
-            if confirm == 'y':
-                success, msg = data_manager.delete_schedule(schedule_id)
-                print("Schedule deleted!" if success else f"Error: {msg}")
-
-        elif choice == '4':
-            success, schedules, error = data_manager.get_schedules()
-            if success:
-                print("\nAll Schedules:")
-                print(tabulate(schedules, headers="keys"))
-            else:
-                print(f"Error: {error}")
-        else:
-            print("Invalid choice. Please try again.")
-
-def wage_calculations():
-    while True:
-        print("\n----- Wages and Positions -----")
-        print("1. Calculate Weekly Wage for Employee")
-        print("2. View Position Wage Rates")
-        print("3. Update Position Rates")
-        print("4. Add New Position")
-        print("0. Back to Main Menu")
-
-        choice = input("Choose an option: ").strip()
-
-        if choice == '0':
-            break
-        elif choice == '1':
-            emp_id = input("Employee ID: ").strip()
-            start_date = input("Week start date (DD-MM-YYYY): ").strip()
-
-            success, schedule_report, error = reports.generate_employee_schedule(
-                emp_id, start_date, start_date
-            )
-
-            if success and schedule_report:
-                print("\nWage Calculation:")
-                print(tabulate(schedule_report, headers="keys"))
-            else:
-                print(f"Error: {error}")
-
-        elif choice == '2':
-            success, rates, error = data_manager.get_wage_rates()
-            if success:
-                print("\nPosition Wage Rates:")
-                formatted_rates = [
-                    {"Position": pos, "Base Rate": rate["base_rate"], "Weekend Rate": rate["weekend_rate"]}
-                    for pos, rate in rates.items()
-                ]
-                print(tabulate(formatted_rates, headers="keys"))
-            else:
-                print(f"Error retrieving wage rates: {error}")
-
-        elif choice == '3':
-            # Update position rates
-            # First show current rates
-            success, rates, error = data_manager.get_wage_rates()
-            if not success:
-                print(f"Error retrieving wage rates: {error}")
-                continue
-
-            print("\nCurrent Position Wage Rates:")
-            formatted_rates = [
-                {"Position": pos, "Base Rate": rate["base_rate"], "Weekend Rate": rate["weekend_rate"]}
-                for pos, rate in rates.items()
-            ]
-            print(tabulate(formatted_rates, headers="keys"))
-
-            # Get position to update
-            position = input("\nEnter position to update: ").strip()
-
-            # Check if position exists
-            position_exists = False
-            for pos in rates.keys():
-                if pos.lower() == position.lower():
-                    position = pos  # Use the exact case from the file
-                    position_exists = True
-                    break
-
-            if not position_exists:
-                print(f"Error: Position '{position}' not found")
-                continue
-
-            # Get new rates
-            try:
-                base_rate = float(input(f"New base rate for {position} (current: {rates[position]['base_rate']}): ").strip())
-                weekend_rate = float(input(f"New weekend rate for {position} (current: {rates[position]['weekend_rate']}): ").strip())
-
-                # Update the rates
-                success, msg = data_manager.update_wage_rate(position, base_rate, weekend_rate)
-                print(msg if success else f"Error: {msg}")
-            except ValueError:
-                print("Error: Rates must be valid numbers")
-
-        elif choice == '4':
-            # Add new position
-            position = input("Enter new position name: ").strip()
-
-            # Check if position already exists
-            success, rates, error = data_manager.get_wage_rates()
-            if not success:
-                print(f"Error retrieving wage rates: {error}")
-                continue
-
-            position_exists = False
-            for pos in rates.keys():
-                if pos.lower() == position.lower():
-                    position_exists = True
-                    break
-
-            if position_exists:
-                print(f"Error: Position '{position}' already exists")
-                continue
-
-            # Get rates for new position
-            try:
-                base_rate = float(input(f"Base rate for {position}: ").strip())
-                weekend_rate = float(input(f"Weekend rate for {position}: ").strip())
-
-                # Add the new position
-                success, msg = data_manager.add_wage_rate(position, base_rate, weekend_rate)
-                print(msg if success else f"Error: {msg}")
-            except ValueError:
-                print("Error: Rates must be valid numbers")
-        else:
-            print("Invalid choice. Please try again.")
-
-def reports_menu():
-    while True:
-        print("\n----- Reports -----")
-        print("1. Generate Employee List (Sorted by Name/Position)")
-        print("2. Generate Wage Report for Period")
-        print("3. Export Employee Report to CSV")
-        print("4. Export Wage Report to TXT")
-        print("0. Back to Main Menu")
-
-        choice = input("Choose an option: ").strip()
-
-        if choice == '0':
-            break
-        elif choice == '1':
-            sort_by = input("Sort by (name/position): ").strip().lower()
-            field = "lname" if sort_by == "name" else "job"
-
-            success, staff_report, error = reports.create_staff_list(sort_by=field)
-            if success:
-                print("\nEmployee List:")
-                print(tabulate(staff_report, headers="keys"))
-            else:
-                print(f"Error: {error}")
-
-        elif choice in ['2', '3', '4']:
-            start_date = input("Start date (DD-MM-YYYY): ").strip()
-            end_date = input("End date (DD-MM-YYYY): ").strip()
-
-            success, wage_report, error = reports.generate_wage_report(start_date, end_date)
-            if not success:
-                print(f"Error: {error}")
-                continue
-
-            if choice == '2':
-                print("\nWage Report:")
-                print(tabulate(wage_report, headers="keys"))
-            elif choice == '3':
-                success, msg = reports.save_csv_report(wage_report, "wage_report")
-                print("Report saved successfully!" if success else f"Error: {msg}")
-            else:  # choice == '4'
-                success, msg = reports.save_text_report(wage_report, "wage_report")
-                print("Report saved successfully!" if success else f"Error: {msg}")
-        else:
-            print("Invalid choice. Please try again.")
-
-def main():
-    # Initialize all required files and folders
-    data_manager.setup_data_folder()
-    reports.setup_reports_folder()
-
-    while True:
-        display_main_menu()
-        choice = input("\nChoose an option (1-5): ").strip()
-
-        if choice == '1':
-            employee_management()
-        elif choice == '2':
-            schedule_management()
-        elif choice == '3':
-            wage_calculations()
-        elif choice == '4':
-            reports_menu()
-        elif choice == '5':
-            print("\nThanks for using Murphy's Bakery Management System. Goodbye!")
-            break
-        else:
-            print("Invalid choice. Please enter a number between 1 and 5.")
-
-if __name__ == "__main__":
-    main()
+import argparse
+import csv
+import json
+import sys
+from contextlib import ExitStack
+from itertools import islice
+from pathlib import Path
+from datetime import datetime
+from data_manager import DataManager
+from dates import date_ordinal, format_ordinal
+from diagnostics import diagnostics
+from server import DEFAULT_HOST, DEFAULT_PORT, serve
+from client import BakeryClient
+from reports import Reports
+from schedule import Schedule
+from schedule_store import BinaryScheduleStore, BINARY_SCHEDULES_FILE
+from storage import STORAGE_BACKENDS, create_storage, copy_storage
+from tabulate import tabulate
+
+# Initialize managers
+data_manager = DataManager()
+reports = Reports(data_manager)
+
+# Rows shown at a time when listing schedules
+SCHEDULE_PAGE_SIZE = 50
+
+def display_main_menu():
+    print("Welcome to Murphy's Bakery Management System:")
+    print("1. Employee Management")
+    print("2. Schedule Management")
+    print("3. Wages and Positions")
+    print("4. Reports")
+    print("5. Diagnostics")
+    print("6. Exit")
+
+# Capture of the submenu action now running, when diagnostics capture is on
+_action_capture = ExitStack()
+
+def choose_action(menu: str) -> str:
+    """
+    Ask for a submenu choice and profile the action it picks
+
+    The capture runs until the menu asks again, so the prompt for the
+    choice itself is never part of it.
+    """
+    _action_capture.close()
+    choice = input("Choose an option: ").strip()
+    if choice != '0':
+        _action_capture.enter_context(diagnostics.capture(f"{menu} {choice}"))
+    return choice
+
+def employee_management():
+    while True:
+        print("\n----- Employee Management -----")
+        print("1. Add New Employee")
+        print("2. View Employee Details")
+        print("3. Update Employee Record")
+        print("4. Delete Employee")
+        print("5. List All Employees")
+        print("0. Back to Main Menu")
+
+        choice = choose_action("Employee Management")
+
+        if choice == '0':
+            break
+        elif choice == '1':
+            fname = input("First name: ").strip()
+            lname = input("Last name: ").strip()
+            job = input("Job title: ").strip()
+            start_date = input("Start date (DD-MM-YYYY): ").strip()
+
+            success, msg = data_manager.add_employee(fname, lname, job, start_date)
+            print(msg if success else f"Error: {msg}")
+
+        elif choice == '2':
+            emp_id = input("Enter Employee ID (e.g., E001): ").strip()
+            if not emp_id.startswith('E') or not emp_id[1:].isdigit():
+                print("Error: Invalid ID format. Use E followed by numbers (e.g., E001)")
+                continue
+
+            success, employee, error = data_manager.get_employee(emp_id)
+            if success and employee:
+                print("\nEmployee Details:")
+                print(tabulate([employee], headers="keys"))
+            else:
+                print(f"Employee not found: {error}")
+
+        elif choice == '3':
+            emp_id = input("Employee ID: ").strip()
+            new_fname = input("New first name (or press Enter to skip): ").strip()
+            new_lname = input("New last name (or press Enter to skip): ").strip()
+            new_job = input("New job title (or press Enter to skip): ").strip()
+
+            # Skip empty inputs
+            new_fname = new_fname if new_fname else None
+            new_lname = new_lname if new_lname else None
+            new_job = new_job if new_job else None
+
+            success, msg = data_manager.update_employee(emp_id, new_fname, new_lname, new_job)
+            print("Updated successfully!" if success else f"Error: {msg}")
+
+        elif choice == '4':
+            emp_id = input("Employee ID to remove: ").strip()
+            confirm = input("Are you sure? (y/n): ").strip().lower()
+            if confirm == 'y':
+                success, msg = data_manager.delete_employee(emp_id)
+                print("Employee removed successfully!" if success else f"Error: {msg}")
+
+        elif choice == '5':
+            success, staff_list, error = data_manager.get_all_employees()
+            if success:
+                print("\nAll Employees:")
+                print(tabulate(staff_list, headers="keys"))
+            else:
+                print(f"Error: {error}")
+        else:
+            print("Invalid choice. Please try again.")
+
+def schedule_management():
+    while True:
+        print("\n----- Schedule Management -----")
+        print("1. Create/Update Weekly Schedule")
+        print("2. View Schedule for Employee")
+        print("3. Delete Schedule")
+        print("4. List All Schedules")
+        print("0. Back to Main Menu")
+
+        choice = choose_action("Schedule Management")
+
+        if choice == '0':
+            break
+        elif choice == '1':
+            emp_id = input("Employee ID: ").strip()
+            week_start = input("Week start date (DD-MM-YYYY): ").strip()
+
+            # Take the next ID from the persistent sequence
+            try:
+                schedule_id = data_manager.generate_schedule_id()
+            except Exception as e:
+                print(f"Problem making ID: {e}")
+                continue
+            schedule = Schedule(schedule_id, emp_id, week_start, {})
+
+            days = ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']
+            daily_hours = {}
+
+            for day in days:
+                while True:
+                    try:
+                        hours = float(input(f"{day.capitalize()} hours: "))
+                        if 0 <= hours <= 12:
+                            daily_hours[day] = hours
+                            break
+                        print("Hours must be between 0 and 12")
+                    except ValueError:
+                        print("Please enter a valid number")
+
+            # Validate total weekly hours
+            if sum(daily_hours.values()) > 48:
+                print("Error: Total weekly hours cannot exceed 48")
+                continue
+
+            schedule.hours = daily_hours
+            success, msg = data_manager.save_schedule(schedule.to_dict())
+            print(msg if success else f"Error: {msg}")
+
+        elif choice == '2':
+            emp_id = input("Employee ID: ").strip()
+            start_date = input("Start date (DD-MM-YYYY): ").strip()
+            end_date = input("End date (DD-MM-YYYY): ").strip()
+
+            success, schedules, error = reports.generate_employee_schedule(emp_id, start_date, end_date)
+            if success:
+                print("\nEmployee Schedule:")
+                print(tabulate(schedules, headers="keys"))
+            else:
+                print(f"Error: {error}")
+
+        elif choice == '3':
+            schedule_id = input("Schedule ID: ").strip()
+            confirm = input("Are you sure? (y/n): ").strip().lower()
+            if confirm == 'y':
+                success, msg = data_manager.delete_schedule(schedule_id)
+                print("Schedule deleted!" if success else f"Error: {msg}")
+
+        elif choice == '4':
+            success, schedules, error = data_manager.iter_schedules()
+            if not success:
+                print(f"Error: {error}")
+                continue
+
+            # Show a page at a time rather than loading every schedule
+            print("\nAll Schedules:")
+            while True:
+                page = list(islice(schedules, SCHEDULE_PAGE_SIZE))
+                if page:
+                    print(tabulate(page, headers="keys"))
+                if len(page) < SCHEDULE_PAGE_SIZE:
+                    break
+                if input("Press Enter for more or 'q' to stop: ").strip().lower() == 'q':
+                    break
+        else:
+            print("Invalid choice. Please try again.")
+
+def wage_calculations():
+    while True:
+        print("\n----- Wages and Positions -----")
+        print("1. Calculate Weekly Wage for Employee")
+        print("2. View Position Wage Rates")
+        print("3. Update Position Rates")
+        print("4. Add New Position")
+        print("0. Back to Main Menu")
+
+        choice = choose_action("Wages and Positions")
+
+        if choice == '0':
+            break
+        elif choice == '1':
+            emp_id = input("Employee ID: ").strip()
+            start_date = input("Week start date (DD-MM-YYYY): ").strip()
+
+            success, schedule_report, error = reports.generate_employee_schedule(
+                emp_id, start_date, start_date
+            )
+
+            if success and schedule_report:
+                print("\nWage Calculation:")
+                print(tabulate(schedule_report, headers="keys"))
+            else:
+                print(f"Error: {error}")
+
+        elif choice == '2':
+            success, rates, error = data_manager.get_wage_rates()
+            if success:
+                print("\nPosition Wage Rates:")
+                formatted_rates = [
+                    {"Position": pos, "Base Rate": rate["base_rate"], "Weekend Rate": rate["weekend_rate"]}
+                    for pos, rate in rates.items()
+                ]
+                print(tabulate(formatted_rates, headers="keys"))
+            else:
+                print(f"Error retrieving wage rates: {error}")
+
+        elif choice == '3':
+            # Update position rates
+            # First show current rates
+            success, rates, error = data_manager.get_wage_rates()
+            if not success:
+                print(f"Error retrieving wage rates: {error}")
+                continue
+
+            print("\nCurrent Position Wage Rates:")
+            formatted_rates = [
+                {"Position": pos, "Base Rate": rate["base_rate"], "Weekend Rate": rate["weekend_rate"]}
+                for pos, rate in rates.items()
+            ]
+            print(tabulate(formatted_rates, headers="keys"))
+
+            # Get position to update
+            position = input("\nEnter position to update: ").strip()
+
+            # Check if position exists
+            position_exists = False
+            for pos in rates.keys():
+                if pos.lower() == position.lower():
+                    position = pos  # Use the exact case from the file
+                    position_exists = True
+                    break
+
+            if not position_exists:
+                print(f"Error: Position '{position}' not found")
+                continue
+
+            # Get new rates
+            try:
+                base_rate = float(input(f"New base rate for {position} (current: {rates[position]['base_rate']}): ").strip())
+                weekend_rate = float(input(f"New weekend rate for {position} (current: {rates[position]['weekend_rate']}): ").strip())
+                effective_date = input("Reprice schedules from week starting (DD-MM-YYYY, blank for all): ").strip()
+
+                # Update the rates and the pay on affected schedules
+                success, msg = data_manager.update_wage_rate(position, base_rate, weekend_rate, effective_date or None)
+                print(msg if success else f"Error: {msg}")
+            except ValueError:
+                print("Error: Rates must be valid numbers")
+
+        elif choice == '4':
+            # Add new position
+            position = input("Enter new position name: ").strip()
+
+            # Check if position already exists
+            success, rates, error = data_manager.get_wage_rates()
+            if not success:
+                print(f"Error retrieving wage rates: {error}")
+                continue
+
+            position_exists = False
+            for pos in rates.keys():
+                if pos.lower() == position.lower():
+                    position_exists = True
+                    break
+
+            if position_exists:
+                print(f"Error: Position '{position}' already exists")
+                continue
+
+            # Get rates for new position
+            try:
+                base_rate = float(input(f"Base rate for {position}: ").strip())
+                weekend_rate = float(input(f"Weekend rate for {position}: ").strip())
+
+                # Add the new position
+                success, msg = data_manager.add_wage_rate(position, base_rate, weekend_rate)
+                print(msg if success else f"Error: {msg}")
+            except ValueError:
+                print("Error: Rates must be valid numbers")
+        else:
+            print("Invalid choice. Please try again.")
+
+def reports_menu():
+    while True:
+        print("\n----- Reports -----")
+        print("1. Generate Employee List (Sorted by Name/Position)")
+        print("2. Generate Wage Report for Period")
+        print("3. Export Employee Report to CSV")
+        print("4. Export Wage Report to TXT")
+        print("5. Export Weekly Wage Reports to CSV")
+        print("0. Back to Main Menu")
+
+        choice = choose_action("Reports")
+
+        if choice == '0':
+            break
+        elif choice == '1':
+            sort_by = input("Sort by (name/position): ").strip().lower()
+            field = "lname" if sort_by == "name" else "job"
+
+            success, staff_report, error = reports.create_staff_list(sort_by=field)
+            if success:
+                print("\nEmployee List:")
+                print(tabulate(staff_report, headers="keys"))
+            else:
+                print(f"Error: {error}")
+
+        elif choice in ['2', '3', '4']:
+            start_date = input("Start date (DD-MM-YYYY): ").strip()
+            end_date = input("End date (DD-MM-YYYY): ").strip()
+
+            if choice == '3':
+                # Stream the report straight into the CSV file
+                success, wage_report, error = reports.iter_wage_report(start_date, end_date)
+            else:
+                success, wage_report, error = reports.generate_wage_report(start_date, end_date)
+            if not success:
+                print(f"Error: {error}")
+                continue
+
+            if choice == '2':
+                print("\nWage Report:")
+                print(tabulate(wage_report, headers="keys"))
+            elif choice == '3':
+                success, msg = reports.save_csv_report(wage_report, "wage_report")
+                print("Report saved successfully!" if success else f"Error: {msg}")
+            else:  # choice == '4'
+                success, msg = reports.save_text_report(wage_report, "wage_report")
+                print("Report saved successfully!" if success else f"Error: {msg}")
+
+        elif choice == '5':
+            first_week = input("First week start date (DD-MM-YYYY): ").strip()
+            weeks = input("Number of weeks [52]: ").strip() or "52"
+            start = date_ordinal(first_week)
+            try:
+                weeks = int(weeks)
+            except ValueError:
+                weeks = 0
+            if start is None or weeks < 1:
+                print("Error: Enter a DD-MM-YYYY date and a positive number of weeks")
+                continue
+
+            periods = [
+                (format_ordinal(start + 7 * week), format_ordinal(start + 7 * week + 6))
+                for week in range(weeks)
+            ]
+            success, wage_reports, error = reports.generate_wage_reports(periods)
+            if not success:
+                print(f"Error: {error}")
+                continue
+
+            saved = 0
+            for week, ((week_start, _), wage_report) in enumerate(zip(periods, wage_reports), start=1):
+                if not wage_report:
+                    continue
+                success, msg = reports.save_csv_report(wage_report, f"wage_report_week{week:02d}_{week_start}")
+                if not success:
+                    print(f"Error: {msg}")
+                    break
+                saved += 1
+            else:
+                print(f"Saved {saved} weekly reports ({weeks - saved} weeks had no schedules)")
+        else:
+            print("Invalid choice. Please try again.")
+
+def diagnostics_menu():
+    def on_off(flag: bool) -> str:
+        return "on" if flag else "off"
+
+    while True:
+        print("\n----- Diagnostics -----")
+        print(f"1. Turn Operation Statistics {on_off(not diagnostics.enabled)} (now {on_off(diagnostics.enabled)})")
+        print(f"2. Turn Profiling of Menu Actions {on_off(not diagnostics.profiling)} (now {on_off(diagnostics.profiling)})")
+        print(f"3. Turn Memory Tracing of Menu Actions {on_off(not diagnostics.tracing)} (now {on_off(diagnostics.tracing)})")
+        print("4. View Operation Statistics")
+        print("5. View Recent Profiles")
+        print("6. Save Diagnostics to File")
+        print("7. Reset Statistics")
+        print("0. Back to Main Menu")
+
+        choice = input("Choose an option: ").strip()
+
+        if choice == '0':
+            break
+        elif choice == '1':
+            if diagnostics.enabled:
+                diagnostics.disable()
+            else:
+                diagnostics.enable()
+            print(f"Operation statistics {on_off(diagnostics.enabled)}")
+
+        elif choice == '2':
+            diagnostics.profiling = not diagnostics.profiling
+            print(f"Profiling {on_off(diagnostics.profiling)}")
+
+        elif choice == '3':
+            diagnostics.tracing = not diagnostics.tracing
+            print(f"Memory tracing {on_off(diagnostics.tracing)}")
+
+        elif choice == '4':
+            rows = diagnostics.operation_rows()
+            if rows:
+                print("\nOperation Statistics:")
+                print(tabulate(rows, headers="keys"))
+            else:
+                print("No operations recorded yet. Turn on operation statistics first.")
+
+        elif choice == '5':
+            if not diagnostics.captures:
+                print("No profiles captured yet. Turn on profiling or memory tracing first.")
+                continue
+            for capture in diagnostics.captures:
+                print(f"\n=== {capture.action} at {capture.started} ({capture.elapsed_ms:.1f} ms) ===")
+                if capture.profile:
+                    print(capture.profile)
+                if capture.memory:
+                    print(f"Peak traced memory: {capture.peak_memory / 1024:.1f} KB")
+                    print(capture.memory)
+
+        elif choice == '6':
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            success, msg = diagnostics.dump(reports.reports_folder / f"diagnostics_{timestamp}.json")
+            print(f"Diagnostics saved to {msg}" if success else f"Error: {msg}")
+
+        elif choice == '7':
+            diagnostics.reset()
+            print("Statistics and profiles cleared")
+        else:
+            print("Invalid choice. Please try again.")
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command line options; with no command the interactive menu runs"""
+    parser = argparse.ArgumentParser(description="Murphy's Bakery Management System")
+    subparsers = parser.add_subparsers(dest="command")
+
+    convert = subparsers.add_parser(
+        "convert-storage", help="Copy all data from one storage backend to another"
+    )
+    convert.add_argument("source", choices=sorted(STORAGE_BACKENDS), help="Backend to read from")
+    convert.add_argument("target", choices=sorted(STORAGE_BACKENDS), help="Backend to write to")
+    convert.add_argument("--data-folder", default="data", help="Data folder (default: data)")
+
+    convert_schedules = subparsers.add_parser(
+        "convert-schedules", help="Copy schedules to or from the binary schedules file used for bulk reports"
+    )
+    convert_schedules.add_argument("direction", choices=["to-binary", "from-binary"],
+                                   help="to-binary writes the file from storage; from-binary replaces stored schedules with it")
+    convert_schedules.add_argument("--data-folder", default="data", help="Data folder (default: data)")
+    convert_schedules.add_argument("--backend", choices=sorted(STORAGE_BACKENDS), default="csv",
+                                   help="Storage backend (default: csv)")
+    convert_schedules.add_argument("--binary-file",
+                                   help=f"Binary schedules file (default: {BINARY_SCHEDULES_FILE} in the data folder)")
+
+    import_employees = subparsers.add_parser(
+        "import-employees", help="Add employees from a CSV file with fname, lname, job and start columns"
+    )
+    import_employees.add_argument("csv_file", help="CSV file to import")
+    import_employees.add_argument("--data-folder", default="data", help="Data folder (default: data)")
+    import_employees.add_argument("--backend", choices=sorted(STORAGE_BACKENDS), default="csv",
+                                  help="Storage backend (default: csv)")
+
+    migrate_dates = subparsers.add_parser(
+        "migrate-dates",
+        help="Upgrade older schedules files and rewrite dates stored in older formats (e.g. 03/01/2006) as DD-MM-YYYY"
+    )
+    migrate_dates.add_argument("--data-folder", default="data", help="Data folder (default: data)")
+    migrate_dates.add_argument("--backend", choices=sorted(STORAGE_BACKENDS), default="csv",
+                               help="Storage backend (default: csv)")
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="Serve the data as JSON over HTTP on this machine, keeping it loaded between requests"
+    )
+    serve_parser.add_argument("--data-folder", default="data", help="Data folder (default: data)")
+    serve_parser.add_argument("--backend", choices=sorted(STORAGE_BACKENDS), default="csv",
+                              help="Storage backend (default: csv)")
+    serve_parser.add_argument("--host", default=DEFAULT_HOST, help=f"Loopback address (default: {DEFAULT_HOST})")
+    serve_parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    serve_parser.add_argument("--workers", type=int, default=4, help="Threads for requests (default: 4)")
+    serve_parser.add_argument("--verbose", action="store_true", help="Log every request")
+
+    request = subparsers.add_parser(
+        "request", help="Send one request to a running server and print the JSON response"
+    )
+    request.add_argument("method", help="HTTP method, e.g. GET or POST")
+    request.add_argument("path", help="Endpoint, e.g. /employees/E001 or '/reports/wages?start_date=...'")
+    request.add_argument("--data", help="JSON request body")
+    request.add_argument("--host", default=DEFAULT_HOST, help=f"Server address (default: {DEFAULT_HOST})")
+    request.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Server port (default: {DEFAULT_PORT})")
+
+    return parser
+
+def run_command(args: argparse.Namespace) -> int:
+    """Run a command line command and return the exit status"""
+    if args.command == "convert-storage":
+        if args.source == args.target:
+            print("Error: Source and target backends must differ")
+            return 1
+
+        source = create_storage(args.source, Path(args.data_folder))
+        target = create_storage(args.target, Path(args.data_folder))
+        try:
+            success, msg = copy_storage(source, target)
+        finally:
+            source.close()
+            target.close()
+        print(msg if success else f"Error: {msg}")
+        return 0 if success else 1
+
+    if args.command == "convert-schedules":
+        storage = create_storage(args.backend, Path(args.data_folder))
+        store = BinaryScheduleStore(Path(args.binary_file or Path(args.data_folder) / BINARY_SCHEDULES_FILE))
+        try:
+            if args.direction == "to-binary":
+                count = store.write(storage.iter_schedules())
+                print(f"Wrote {count} schedules to {store.path}")
+            else:
+                schedules = list(store)
+                storage.save_schedules(schedules)
+                print(f"Replaced stored schedules with {len(schedules)} from {store.path}")
+        except Exception as e:
+            print(f"Error: Failed to convert schedules: {str(e)}")
+            return 1
+        finally:
+            storage.close()
+        return 0
+
+    if args.command == "import-employees":
+        manager = DataManager(args.data_folder, args.backend)
+        success, msg = manager.setup_data_folder()
+        if not success:
+            print(f"Error: {msg}")
+            return 1
+
+        # Stream rows straight from the file into the bulk import
+        with open(args.csv_file, newline='', encoding='utf-8-sig') as f:
+            success, results, error = manager.add_employees_bulk(csv.DictReader(f))
+        manager.storage.close()
+        if not success:
+            print(f"Error: {error}")
+            return 1
+
+        errors = [result for result in results if result['error']]
+        print(f"Imported {len(results) - len(errors)} of {len(results)} employees")
+        if errors:
+            print(tabulate(errors, headers="keys"))
+        return 0 if not errors else 1
+
+    if args.command == "migrate-dates":
+        manager = DataManager(args.data_folder, args.backend)
+        success, changed, error = manager.migrate_legacy_dates()
+        manager.storage.close()
+        if not success:
+            print(f"Error: {error}")
+            return 1
+        if error:
+            print(error)
+        print(f"Rewrote {changed} dates as DD-MM-YYYY")
+        return 0
+
+    if args.command == "serve":
+        success, error = serve(args.data_folder, args.backend, args.host, args.port, args.workers, args.verbose)
+        if not success:
+            print(f"Error: {error}")
+            return 1
+        return 0
+
+    if args.command == "request":
+        try:
+            body = json.loads(args.data) if args.data else None
+        except ValueError:
+            print("Error: --data must be valid JSON")
+            return 1
+        try:
+            with BakeryClient(args.host, args.port) as client:
+                status, response = client.request(args.method.upper(), args.path, body)
+        except OSError as e:
+            print(f"Error: Couldn't reach the server at {args.host}:{args.port}: {str(e)}")
+            return 1
+        print(json.dumps(response, indent=2))
+        return 0 if status == 200 else 1
+
+    return 1
+
+def main():
+    args = build_parser().parse_args()
+    if args.command:
+        sys.exit(run_command(args))
+
+    # Initialize all required files and folders
+    data_manager.setup_data_folder()
+    reports.setup_reports_folder()
+
+    # Older data folders are only upgraded by the migrate-dates command
+    success, error = data_manager.check_data_layout()
+    if not success:
+        print(f"Error: {error}")
+        sys.exit(1)
+
+    while True:
+        display_main_menu()
+        choice = input("\nChoose an option (1-6): ").strip()
+
+        if choice == '1':
+            employee_management()
+        elif choice == '2':
+            schedule_management()
+        elif choice == '3':
+            wage_calculations()
+        elif choice == '4':
+            reports_menu()
+        elif choice == '5':
+            diagnostics_menu()
+        elif choice == '6':
+            print("\nThanks for using Murphy's Bakery Management System. Goodbye!")
+            break
+        else:
+            print("Invalid choice. Please enter a number between 1 and 6.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from schedule import Schedule
+from dates import date_ordinal
+from storage import atomic_write
+
+# (regular hours, weekend hours, total pay) for an employee over a range of weeks
+PayTotals = Tuple[float, float, float]
+
+# Hours are kept in hundredths and pay in cents, so adding and taking away stays exact
+UNITS = 100
+
+# Bumped when the saved layout changes, so older snapshots are rebuilt
+SNAPSHOT_VERSION = 2
+
+
+class _EmployeeWeeks:
+    """One employee's weekly totals in hundredths of an hour and cents, with prefix sums built on demand"""
+
+    __slots__ = ('weeks', 'cells', '_prefix')
+
+    def __init__(self):
+        # Sorted week ordinals and a [regular, weekend, pay, schedules] cell per week
+        self.weeks: List[int] = []
+        self.cells: List[List[int]] = []
+        # Running totals over the cells, rebuilt after the cells change
+        self._prefix: Optional[Tuple[List[int], List[int], List[int], List[int]]] = None
+
+    def change(self, week: int, regular: int, weekend: int, pay: int, count: int) -> None:
+        """Add to (or with negative values, take from) one week's totals"""
+        i = bisect_left(self.weeks, week)
+        if i == len(self.weeks) or self.weeks[i] != week:
+            self.weeks.insert(i, week)
+            self.cells.insert(i, [0, 0, 0, 0])
+
+        cell = self.cells[i]
+        cell[0] += regular
+        cell[1] += weekend
+        cell[2] += pay
+        cell[3] += count
+        if cell[3] <= 0:
+            # Drop weeks with no schedules left
+            del self.weeks[i]
+            del self.cells[i]
+        self._prefix = None
+
+    def _prefix_sums(self) -> Tuple[List[int], List[int], List[int], List[int]]:
+        if self._prefix is None:
+            regular, weekend, pay, count = [0], [0], [0], [0]
+            for cell in self.cells:
+                regular.append(regular[-1] + cell[0])
+                weekend.append(weekend[-1] + cell[1])
+                pay.append(pay[-1] + cell[2])
+                count.append(count[-1] + cell[3])
+            self._prefix = regular, weekend, pay, count
+        return self._prefix
+
+    def range_totals(self, start: Optional[int], end: Optional[int]) -> Optional[PayTotals]:
+        """Totals for weeks from start to end inclusive, or None if no schedules fall in the range"""
+        lo = bisect_left(self.weeks, start) if start is not None else 0
+        hi = bisect_right(self.weeks, end) if end is not None else len(self.weeks)
+        if lo >= hi:
+            return None
+
+        regular, weekend, pay, count = self._prefix_sums()
+        if count[hi] == count[lo]:
+            return None
+        return (regular[hi] - regular[lo]) / UNITS, (weekend[hi] - weekend[lo]) / UNITS, (pay[hi] - pay[lo]) / UNITS
+
+
+class PayrollTotals:
+    """
+    Per-employee, per-week hours and pay, for range totals without reading schedules
+
+    Each employee's weeks are kept sorted with prefix sums over them, so the
+    totals for any date range take two binary searches. Hours are summed in
+    hundredths and pay in cents, so totals kept up to date change by change
+    equal a fresh scan of the schedules exactly. Schedules whose
+    week_start can't be parsed are left out, as they never match a date range.
+
+    The totals are saved as a snapshot plus an append-only log of changes,
+    both stamped with the storage's schedules_stamp() at the time. They are
+    only trusted while that stamp still matches the storage.
+    """
+
+    def __init__(self, snapshot_file: Path):
+        self.snapshot_file = Path(snapshot_file)
+        self.log_file = self.snapshot_file.with_name(self.snapshot_file.stem + '_log.jsonl')
+
+        # Fold the log into the snapshot once it holds this many records
+        self.log_limit = 1000
+
+        self.stamp: Optional[List[Any]] = None
+        self._employees: Dict[str, _EmployeeWeeks] = {}
+        self._log_records = 0
+        self._weeks: Dict[str, Optional[int]] = {}
+
+    def _week(self, week_start: str) -> Optional[int]:
+        """Parse a week_start, caching it since the same weeks repeat across schedules"""
+        if week_start in self._weeks:
+            return self._weeks[week_start]
+        ordinal = self._weeks[week_start] = date_ordinal(week_start)
+        return ordinal
+
+    def _changes(self, schedules: Iterable[Schedule], sign: int) -> Iterator[List[Any]]:
+        """Turn schedules into [employee_id, week, regular, weekend, pay, count] changes, in whole units"""
+        for schedule in schedules:
+            week = self._week(schedule.week_start_date)
+            if week is None:
+                continue
+            yield [
+                schedule.employee_id, week,
+                sign * round(schedule.weekday_hours() * UNITS), sign * round(schedule.weekend_hours() * UNITS),
+                sign * round(schedule.total_pay * UNITS), sign
+            ]
+
+    def _apply_changes(self, changes: Iterable[List[Any]]) -> None:
+        for employee_id, week, regular, weekend, pay, count in changes:
+            weeks = self._employees.get(employee_id)
+            if weeks is None:
+                weeks = self._employees[employee_id] = _EmployeeWeeks()
+            weeks.change(week, regular, weekend, pay, count)
+            if not weeks.weeks:
+                del self._employees[employee_id]
+
+    def load(self) -> bool:
+        """Load the saved snapshot and replay its log; False if there is nothing usable on disk"""
+        self.stamp = None
+        self._employees = {}
+        self._log_records = 0
+        try:
+            with self.snapshot_file.open('r') as f:
+                snapshot = json.load(f)
+            if snapshot.get('version') != SNAPSHOT_VERSION:
+                return False
+
+            for employee_id, cells in snapshot['employees'].items():
+                self._apply_changes([employee_id] + cell for cell in cells)
+            stamp = snapshot['stamp']
+
+            if self.log_file.exists():
+                with self.log_file.open('r') as f:
+                    for line in f:
+                        record = json.loads(line)
+                        self._apply_changes(record['changes'])
+                        stamp = record['stamp']
+                        self._log_records += 1
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing, partly written or from an older layout: rebuild instead
+            self._employees = {}
+            return False
+
+        self.stamp = stamp
+        return True
+
+    def save(self) -> None:
+        """Write a fresh snapshot and clear the log"""
+        snapshot = {
+            'version': SNAPSHOT_VERSION,
+            'stamp': self.stamp,
+            'employees': {
+                employee_id: [[week] + cell for week, cell in zip(weeks.weeks, weeks.cells)]
+                for employee_id, weeks in self._employees.items()
+            }
+        }
+        with atomic_write(self.snapshot_file) as f:
+            json.dump(snapshot, f)
+        # Another process may have just folded the log itself
+        self.log_file.unlink(missing_ok=True)
+        self._log_records = 0
+
+    def rebuild(self, schedules: Iterable[Schedule], stamp: List[Any]) -> None:
+        """Recompute every total from the schedules and save them"""
+        self._employees = {}
+        self._apply_changes(self._changes(schedules, 1))
+        self.stamp = stamp
+        self.save()
+
+    def record(self, removed: Iterable[Schedule], added: Iterable[Schedule], stamp: List[Any]) -> None:
+        """
+        Apply schedules removed from and added to storage, and log the change
+
+        Args:
+            removed (Iterable[Schedule]): Schedules as they were before the write
+            added (Iterable[Schedule]): Schedules as they are after the write
+            stamp (List[Any]): The storage's schedules_stamp() after the write
+        """
+        changes = list(self._changes(removed, -1)) + list(self._changes(added, 1))
+        self._apply_changes(changes)
+        self.stamp = stamp
+
+        if self._log_records + 1 >= self.log_limit:
+            self.save()
+            return
+
+        with self.log_file.open('a') as f:
+            f.write(json.dumps({'stamp': stamp, 'changes': changes}) + '\n')
+        self._log_records += 1
+
+    def range_totals(self, start: Optional[int] = None, end: Optional[int] = None) -> Dict[str, PayTotals]:
+        """
+        Totals per employee for weeks from start to end inclusive
+
+        Args:
+            start (Optional[int]): Inclusive lower bound as a day ordinal
+            end (Optional[int]): Inclusive upper bound as a day ordinal
+
+        Returns:
+            Dict[str, PayTotals]: (Regular hours, Weekend hours, Total pay) by employee ID,
+            only for employees with schedules in the range
+        """
+        totals = {}
+        for employee_id, weeks in self._employees.items():
+            employee_totals = weeks.range_totals(start, end)
+            if employee_totals is not None:
+                totals[employee_id] = employee_totals
+        return totals
+
+    def employee_totals(self, employee_id: str, start: Optional[int] = None, end: Optional[int] = None) -> Optional[PayTotals]:
+        """Totals for one employee between two day ordinals, or None if they have no schedules there"""
+        weeks = self._employees.get(employee_id)
+        if weeks is None:
+            return None
+        return weeks.range_totals(start, end)
@@ -1,270 +1,497 @@
-import csv
-from pathlib import Path
-from typing import List, Dict, Tuple, Any
-from datetime import datetime
-from tabulate import tabulate
-
-class Reports:
-    def __init__(self, data_manager):
-        self.data_manager = data_manager
-        self.reports_folder = Path("data/reports")
-        self.setup_reports_folder()
-
-    def setup_reports_folder(self) -> Tuple[bool, str]:
-        """Create reports folder if it doesn't exist"""
-        try:
-            self.reports_folder.mkdir(parents=True, exist_ok=True)
-            return True, ""
-        except Exception as e:
-            return False, f"Failed to create reports folder: {str(e)}"
-
-    def generate_employee_report(self, sort_by: str = "name") -> Tuple[bool, List[Dict[str, Any]], str]:
-        """
-        Generate a comprehensive employee report sorted by specified field
-
-        Args:
-            sort_by (str): Field to sort by ("name" or "position")
-
-        Returns:
-            Tuple[bool, List[Dict[str, Any]], str]: (Success status, Report data, Error message)
-        """
-        try:
-            # Get all employees
-            success, employees, error = self.data_manager.get_all_employees()
-            if not success:
-                return False, [], error
-
-            # Format employee data for report
-            report_data = []
-            for emp in employees:
-                # Calculate tenure
-                start_date = datetime.strptime(emp['start'], '%d-%m-%Y')
-                tenure_days = (datetime.now() - start_date).days
-
-                report_entry = {
-                    'Employee ID': emp['staff_id'],
-                    'First Name': emp['fname'],
-                    'Last Name': emp['lname'],
-                    'Position': emp['job'],
-                    'Start Date': emp['start'],
-                    'Tenure (days)': tenure_days
-                }
-                report_data.append(report_entry)
-
-            # Sort the report data
-            if sort_by.lower() == "name":
-                report_data.sort(key=lambda x: f"{x['Last Name']}, {x['First Name']}".lower())
-            else:  # sort by position
-                report_data.sort(key=lambda x: x['Position'].lower())
-
-            return True, report_data, ""
-        except Exception as e:
-            return False, [], f"Failed to generate employee report: {str(e)}"
-
-    def generate_wage_report(self, start_date: str, end_date: str) -> Tuple[bool, List[Dict[str, Any]], str]:
-        """
-        Generate a comprehensive wage report for all employees within a date range
-
-        Args:
-            start_date (str): Start date in DD-MM-YYYY format
-            end_date (str): End date in DD-MM-YYYY format
-
-        Returns:
-            Tuple[bool, List[Dict[str, Any]], str]: (Success status, Report data, Error message)
-        """
-        try:
-            # Validate dates
-            try:
-                start = datetime.strptime(start_date, '%d-%m-%Y')
-                end = datetime.strptime(end_date, '%d-%m-%Y')
-                if start > end:
-                    return False, [], "Start date must be before end date"
-            except ValueError:
-                return False, [], "Invalid date format. Use DD-MM-YYYY"
-
-            # Get all schedules within date range
-            success, schedules, error = self.data_manager.get_schedules(
-                start_date=start_date,
-                end_date=end_date
-            )
-
-            if not success:
-                return False, [], error
-
-            # Get wage rates
-            success, wage_rates, error = self.data_manager.get_wage_rates()
-            if not success:
-                return False, [], error
-
-            # Group schedules by employee
-            employee_wages = {}
-            for schedule in schedules:
-                emp_id = schedule['employee_id']
-                if emp_id not in employee_wages:
-                    # Get employee details
-                    success, employee, error = self.data_manager.get_employee(emp_id)
-                    if not success:
-                        continue
-
-                    # Get wage rates for position
-                    position = employee['job']
-                    base_rate = 0.0
-                    weekend_rate = 0.0
-
-                    # Find the rate for this position
-                    for pos, rates in wage_rates.items():
-                        if pos.lower() == position.lower():
-                            base_rate = rates['base_rate']
-                            weekend_rate = rates['weekend_rate']
-                            break
-
-                    employee_wages[emp_id] = {
-                        'Employee ID': emp_id,
-                        'Name': f"{employee['fname']} {employee['lname']}",
-                        'Position': position,
-                        'Base Rate': base_rate,
-                        'Weekend Rate': weekend_rate,
-                        'Regular Hours': 0.0,
-                        'Weekend Hours': 0.0,
-                        'Total Hours': 0.0,
-                        'Regular Pay': 0.0,
-                        'Weekend Pay': 0.0,
-                        'Total Pay': 0.0
-                    }
-
-                # Calculate regular and weekend hours
-                regular_hours = sum(float(schedule[day]) for day in ['mon', 'tue', 'wed', 'thu', 'fri'])
-                weekend_hours = sum(float(schedule[day]) for day in ['sat', 'sun'])
-
-                emp_data = employee_wages[emp_id]
-                emp_data['Regular Hours'] += regular_hours
-                emp_data['Weekend Hours'] += weekend_hours
-                emp_data['Total Hours'] += regular_hours + weekend_hours
-                emp_data['Regular Pay'] += regular_hours * emp_data['Base Rate']
-                emp_data['Weekend Pay'] += weekend_hours * emp_data['Weekend Rate']
-                emp_data['Total Pay'] += float(schedule['total_pay'])
-
-            return True, list(employee_wages.values()), ""
-        except Exception as e:
-            return False, [], f"Failed to generate wage report: {str(e)}"
-
-    def export_to_csv(self, data: List[Dict[str, Any]], filename: str) -> Tuple[bool, str]:
-        try:
-            if not data:
-                return False, "No data to export"
-
-            # Generate timestamped filename
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            file_path = self.reports_folder / f"{filename}_{timestamp}.csv"
-
-            # Write data to CSV
-            with file_path.open('w', newline='', encoding='utf-8-sig') as f:
-                writer = csv.DictWriter(f, fieldnames=data[0].keys())
-                writer.writeheader()
-                writer.writerows(data)
-
-            return True, str(file_path)
-        except Exception as e:
-            return False, f"Failed to export to CSV: {str(e)}"
-
-    def export_to_txt(self, data: List[Dict[str, Any]], filename: str) -> Tuple[bool, str]:
-        try:
-            if not data:
-                return False, "No data to export"
-
-            # Generate timestamped filename
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            file_path = self.reports_folder / f"{filename}_{timestamp}.txt"
-
-            # Format data using tabulate
-            headers = data[0].keys()
-            rows = [row.values() for row in data]
-            table = tabulate(rows, headers=headers, tablefmt="grid")
-
-            # Add report header and timestamp
-            report_text = (
-                f"Report: {filename}\n"
-                f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                f"{table}\n"
-            )
-
-            # Write to file
-            with file_path.open('w', encoding='utf-8') as f:
-                f.write(report_text)
-
-            return True, str(file_path)
-        except Exception as e:
-            return False, f"Failed to export to TXT: {str(e)}"
-
-    def create_staff_list(self, sort_by: str = "lname") -> Tuple[bool, List[Dict[str, Any]], str]:
-        """Generate a sorted list of all employees"""
-        try:
-            # Get all employees
-            success, employees, error = self.data_manager.get_all_employees()
-            if not success:
-                return False, [], error
-
-            # Sort employees
-            if sort_by == "lname":
-                employees.sort(key=lambda x: x['lname'].lower())
-            else:  # sort by job
-                employees.sort(key=lambda x: x['job'].lower())
-
-            return True, employees, ""
-        except Exception as e:
-            return False, [], f"Failed to create staff list: {str(e)}"
-
-    def save_csv_report(self, data: List[Dict[str, Any]], filename: str) -> Tuple[bool, str]:
-        """Save report to CSV file"""
-        return self.export_to_csv(data, filename)
-
-    def save_text_report(self, data: List[Dict[str, Any]], filename: str) -> Tuple[bool, str]:
-        """Save report to text file"""
-        return self.export_to_txt(data, filename)
-
-    def generate_employee_schedule(self, employee_id: str, start_date: str, end_date: str) -> Tuple[bool, List[Dict[str, Any]], str]:
-        """Generate schedule report for an employee"""
-        try:
-            # Validate dates
-            try:
-                if start_date:
-                    try:
-                        datetime.strptime(start_date, '%d-%m-%Y')
-                    except ValueError:
-                        # Try alternative format
-                        datetime.strptime(start_date, '%Y-%m-%d')
-                if end_date:
-                    try:
-                        datetime.strptime(end_date, '%d-%m-%Y')
-                    except ValueError:
-                        # Try alternative format
-                        datetime.strptime(end_date, '%Y-%m-%d')
-            except ValueError:
-                return False, [], "Invalid date format. Use DD-MM-YYYY or YYYY-MM-DD"
-
-            # Get employee
-            success, employee, error = self.data_manager.get_employee(employee_id)
-            if not success:
-                return False, [], f"Employee not found: {error}"
-
-            # Get schedules
-            success, schedules, error = self.data_manager.get_schedules(
-                employee_id=employee_id,
-                start_date=start_date,
-                end_date=end_date
-            )
-            if not success:
-                return False, [], error
-
-            if not schedules:
-                return False, [], "No schedules found for this employee in the specified date range"
-
-            # Format schedules for report
-            for schedule in schedules:
-                schedule['Employee Name'] = f"{employee['fname']} {employee['lname']}"
-                schedule['Position'] = employee['job']
-
-            return True, schedules, ""
-        except Exception as e:
-            return False, [], f"Failed to generate employee schedule: {str(e)}"
-
+import csv
+import os
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from operator import itemgetter
+from pathlib import Path
+from typing import List, Dict, Tuple, Any, Iterable, Iterator, Optional, Sequence
+from datetime import datetime
+from employee import Employee
+from schedule import Schedule
+from dates import date_ordinal, format_ordinal, normalise_date, today_ordinal
+from grid_format import write_grid
+from schedule_store import BinaryScheduleStore, BINARY_SCHEDULES_FILE
+from diagnostics import instrumented
+
+# (name, position, base rate, weekend rate) per employee ID
+EmployeeWageInfo = Dict[str, Tuple[str, str, float, float]]
+
+
+def _employee_wage_info(employees: Iterable[Employee], rate_table: Dict[str, Dict[str, float]]) -> EmployeeWageInfo:
+    """Look up each employee's rates once, ahead of totalling their schedules"""
+    info = {}
+    for employee in employees:
+        position = employee.job
+        rates = rate_table.get(position.casefold())
+        base_rate = rates['base_rate'] if rates else 0.0
+        weekend_rate = rates['weekend_rate'] if rates else 0.0
+        info[employee.staff_id] = (f"{employee.fname} {employee.lname}", position, base_rate, weekend_rate)
+    return info
+
+
+def _total_wage_rows(rows: Iterable[Tuple[str, float, float, float]], employee_info: EmployeeWageInfo) -> List[Dict[str, Any]]:
+    """
+    Total up (employee ID, weekday hours, weekend hours, total pay) rows
+    into one wage report row per employee, in employee order
+
+    Hours are added up in hundredths and pay in cents, so the totals don't
+    depend on how the rows were grouped or ordered: a report built from
+    weekly totals, from single schedules or in a worker process comes out
+    the same.
+    """
+    sums: Dict[str, List[int]] = {}
+    for emp_id, regular_hours, weekend_hours, total_pay in rows:
+        cell = sums.get(emp_id)
+        if cell is None:
+            if emp_id not in employee_info:
+                continue
+            cell = sums[emp_id] = [0, 0, 0]
+        cell[0] += round(regular_hours * 100)
+        cell[1] += round(weekend_hours * 100)
+        cell[2] += round(total_pay * 100)
+
+    report = []
+    for emp_id, (name, position, base_rate, weekend_rate) in employee_info.items():
+        cell = sums.get(emp_id)
+        if cell is None:
+            continue
+        regular_hours, weekend_hours = cell[0] / 100, cell[1] / 100
+        report.append({
+            'Employee ID': emp_id,
+            'Name': name,
+            'Position': position,
+            'Base Rate': base_rate,
+            'Weekend Rate': weekend_rate,
+            'Regular Hours': regular_hours,
+            'Weekend Hours': weekend_hours,
+            'Total Hours': (cell[0] + cell[1]) / 100,
+            'Regular Pay': round(regular_hours * base_rate, 2),
+            'Weekend Pay': round(weekend_hours * weekend_rate, 2),
+            'Total Pay': cell[2] / 100
+        })
+    return report
+
+
+def _period_wage_reports(rows: List[Tuple[int, int, str, float, float, float]], bounds: List[Tuple[int, int]],
+                         employee_info: EmployeeWageInfo) -> List[List[Dict[str, Any]]]:
+    """
+    Build the wage report for each (start, end) ordinal pair
+
+    rows are (week ordinal, file position, employee ID, weekday hours,
+    weekend hours, total pay) sorted by week then position. Runs in worker
+    processes, so it only takes plain, picklable data.
+    """
+    weeks = [row[0] for row in rows]
+    reports = []
+    for start, end in bounds:
+        period = rows[bisect_left(weeks, start):bisect_right(weeks, end)]
+        # Back into file order, as a single-period report reads them
+        period.sort(key=itemgetter(1))
+        reports.append(_total_wage_rows((row[2:] for row in period), employee_info))
+    return reports
+
+
+@instrumented
+class Reports:
+    def __init__(self, data_manager):
+        self.data_manager = data_manager
+        self.reports_folder = Path("data/reports")
+        self.setup_reports_folder()
+
+    def setup_reports_folder(self) -> Tuple[bool, str]:
+        """Create reports folder if it doesn't exist"""
+        try:
+            self.reports_folder.mkdir(parents=True, exist_ok=True)
+            return True, ""
+        except Exception as e:
+            return False, f"Failed to create reports folder: {str(e)}"
+
+    def generate_employee_report(self, sort_by: str = "name") -> Tuple[bool, List[Dict[str, Any]], str]:
+        """
+        Generate a comprehensive employee report sorted by specified field
+
+        Args:
+            sort_by (str): Field to sort by ("name" or "position")
+
+        Returns:
+            Tuple[bool, List[Dict[str, Any]], str]: (Success status, Report data, Error message)
+        """
+        try:
+            # Get employees already in report order
+            order = "name" if sort_by.lower() == "name" else "job"
+            success, employees, error = self.data_manager.get_sorted_employees(order)
+            if not success:
+                return False, [], error
+
+            # Format employee data for report
+            today = today_ordinal()
+            report_data = []
+            for emp in employees:
+                # Calculate tenure
+                tenure_days = emp.calculate_tenure(today)
+
+                report_entry = {
+                    'Employee ID': emp['staff_id'],
+                    'First Name': emp['fname'],
+                    'Last Name': emp['lname'],
+                    'Position': emp['job'],
+                    'Start Date': emp['start'],
+                    'Tenure (days)': tenure_days
+                }
+                report_data.append(report_entry)
+
+            return True, report_data, ""
+        except Exception as e:
+            return False, [], f"Failed to generate employee report: {str(e)}"
+
+    def generate_wage_report(self, start_date: str, end_date: str) -> Tuple[bool, List[Dict[str, Any]], str]:
+        """
+        Generate a comprehensive wage report for all employees within a date range
+
+        Args:
+            start_date (str): Start date in DD-MM-YYYY format
+            end_date (str): End date in DD-MM-YYYY format
+
+        Returns:
+            Tuple[bool, List[Dict[str, Any]], str]: (Success status, Report data, Error message)
+        """
+        try:
+            success, report, error = self.iter_wage_report(start_date, end_date)
+            if not success:
+                return False, [], error
+
+            return True, list(report), ""
+        except Exception as e:
+            return False, [], f"Failed to generate wage report: {str(e)}"
+
+    def iter_wage_report(self, start_date: str, end_date: str) -> Tuple[bool, Iterator[Dict[str, Any]], str]:
+        """
+        Stream the wage report for a date range
+
+        Totals come from the data manager's weekly payroll totals, so the
+        cost grows with the number of employees rather than schedules. Where
+        those aren't available (inside a transaction) schedules are read one
+        at a time instead. Rows are in employee order, as in generate_wage_report.
+
+        Args:
+            start_date (str): Start date in DD-MM-YYYY format
+            end_date (str): End date in DD-MM-YYYY format
+
+        Returns:
+            Tuple[bool, Iterator[Dict[str, Any]], str]: (Success status, Report rows, Error message)
+        """
+        try:
+            # Validate dates
+            start = date_ordinal(start_date)
+            end = date_ordinal(end_date)
+            if start is None or end is None:
+                return False, iter(()), "Invalid date format. Use DD-MM-YYYY"
+            if start > end:
+                return False, iter(()), "Start date must be before end date"
+
+            # Get wage rates keyed by case-folded position
+            success, rate_table, error = self.data_manager.get_rate_table()
+            if not success:
+                return False, iter(()), error
+
+            # Build the join table once: names and rates by employee ID
+            success, employees, error = self.data_manager.get_all_employees()
+            if not success:
+                return False, iter(()), error
+            employee_info = _employee_wage_info(employees, rate_table)
+
+            # Weekly totals answer the range without reading any schedules
+            success, totals, error = self.data_manager.get_payroll_totals()
+            if not success:
+                return False, iter(()), error
+            if totals is not None:
+                period_totals = totals.range_totals(start, end)
+                rows = ((emp_id, *period_totals[emp_id]) for emp_id in employee_info if emp_id in period_totals)
+                return True, iter(_total_wage_rows(rows, employee_info)), ""
+
+            # Stream all schedules within date range
+            success, schedules, error = self.data_manager.iter_schedules(
+                start_date=start_date,
+                end_date=end_date
+            )
+
+            if not success:
+                return False, iter(()), error
+
+            return True, self._wage_report_rows(schedules, employee_info), ""
+        except Exception as e:
+            return False, iter(()), f"Failed to generate wage report: {str(e)}"
+
+    def generate_binary_wage_report(self, start_date: str, end_date: str,
+                                    binary_file: Optional[Path] = None) -> Tuple[bool, List[Dict[str, Any]], str]:
+        """
+        Generate the wage report for a date range from a binary schedules file
+
+        The schedules are totalled per employee with NumPy straight from the
+        mapped file where NumPy is installed. The file is a copy made with
+        the convert-schedules command, so it only reflects schedules as they
+        were when it was made. Hours are stored as float32, so hour totals
+        can differ from generate_wage_report's in the last decimal places.
+
+        Args:
+            start_date (str): Start date in DD-MM-YYYY format
+            end_date (str): End date in DD-MM-YYYY format
+            binary_file (Optional[Path]): Binary schedules file (default: schedules.bin in the data folder)
+
+        Returns:
+            Tuple[bool, List[Dict[str, Any]], str]: (Success status, Report data, Error message)
+        """
+        try:
+            start = date_ordinal(start_date)
+            end = date_ordinal(end_date)
+            if start is None or end is None:
+                return False, [], "Invalid date format. Use DD-MM-YYYY"
+            if start > end:
+                return False, [], "Start date must be before end date"
+
+            store = BinaryScheduleStore(binary_file or self.data_manager.data_folder / BINARY_SCHEDULES_FILE)
+            if not store.path.exists():
+                return False, [], f"No binary schedules file at {store.path}"
+
+            success, rate_table, error = self.data_manager.get_rate_table()
+            if not success:
+                return False, [], error
+
+            success, employees, error = self.data_manager.get_all_employees()
+            if not success:
+                return False, [], error
+            employee_info = _employee_wage_info(employees, rate_table)
+
+            period_totals = store.range_totals(start, end)
+            rows = ((emp_id, *period_totals[emp_id]) for emp_id in employee_info if emp_id in period_totals)
+            return True, _total_wage_rows(rows, employee_info), ""
+        except Exception as e:
+            return False, [], f"Failed to generate wage report: {str(e)}"
+
+    @staticmethod
+    def _wage_report_rows(schedules: Iterable[Schedule], employee_info: EmployeeWageInfo) -> Iterator[Dict[str, Any]]:
+        """Total up schedules per employee in a single pass and yield a row per employee"""
+        rows = ((s.employee_id, s.weekday_hours(), s.weekend_hours(), s.total_pay) for s in schedules)
+        yield from _total_wage_rows(rows, employee_info)
+
+    def generate_wage_reports(self, periods: Sequence[Tuple[str, str]],
+                              workers: Optional[int] = None) -> Tuple[bool, List[List[Dict[str, Any]]], str]:
+        """
+        Generate wage reports for many periods from one read of the data
+
+        Schedules, employees and rates are loaded once. The periods are then
+        split between worker processes, each of which only receives the
+        schedules inside its own periods. Each report equals what
+        generate_wage_report returns for that period, since both total
+        hours and pay exactly (see _total_wage_rows).
+
+        Args:
+            periods (Sequence[Tuple[str, str]]): (Start date, End date) pairs in DD-MM-YYYY format
+            workers (Optional[int]): Worker processes to use (default: one per CPU); 1 runs in this process
+
+        Returns:
+            Tuple[bool, List[List[Dict[str, Any]]], str]: (Success status, One report per period in the
+            order given, Error message)
+        """
+        try:
+            # Validate dates
+            bounds = []
+            for start_date, end_date in periods:
+                start = date_ordinal(start_date)
+                end = date_ordinal(end_date)
+                if start is None or end is None:
+                    return False, [], f"Invalid date format in period {start_date} to {end_date}. Use DD-MM-YYYY"
+                if start > end:
+                    return False, [], f"Start date must be before end date ({start_date} to {end_date})"
+                bounds.append((start, end))
+
+            if not bounds:
+                return True, [], ""
+
+            success, rate_table, error = self.data_manager.get_rate_table()
+            if not success:
+                return False, [], error
+
+            success, employees, error = self.data_manager.get_all_employees()
+            if not success:
+                return False, [], error
+            employee_info = _employee_wage_info(employees, rate_table)
+
+            # One pass over every schedule that falls in any period
+            first = min(start for start, _ in bounds)
+            last = max(end for _, end in bounds)
+            success, schedules, error = self.data_manager.iter_schedules(
+                start_date=format_ordinal(first),
+                end_date=format_ordinal(last)
+            )
+            if not success:
+                return False, [], error
+
+            weeks = {}
+            rows = []
+            for position, schedule in enumerate(schedules):
+                emp_id = schedule.employee_id
+                if emp_id not in employee_info:
+                    continue
+                week = schedule.week_start_date
+                ordinal = weeks.get(week)
+                if ordinal is None:
+                    ordinal = weeks[week] = date_ordinal(week)
+                rows.append((ordinal, position, emp_id, schedule.weekday_hours(), schedule.weekend_hours(), schedule.total_pay))
+            rows.sort(key=itemgetter(0, 1))
+
+            workers = min(workers or os.cpu_count() or 1, len(bounds))
+            if workers <= 1:
+                return True, _period_wage_reports(rows, bounds, employee_info), ""
+
+            try:
+                return True, self._wage_reports_in_pool(rows, bounds, employee_info, workers), ""
+            except (OSError, NotImplementedError, BrokenProcessPool):
+                # No usable process pool here (e.g. a sandbox without semaphores)
+                return True, _period_wage_reports(rows, bounds, employee_info), ""
+        except Exception as e:
+            return False, [], f"Failed to generate wage reports: {str(e)}"
+
+    @staticmethod
+    def _wage_reports_in_pool(rows: List[Tuple[int, int, str, float, float, float]], bounds: List[Tuple[int, int]],
+                              employee_info: EmployeeWageInfo, workers: int) -> List[List[Dict[str, Any]]]:
+        """Split the periods into contiguous runs of weeks, one per worker, and gather the reports in order"""
+        order = sorted(range(len(bounds)), key=lambda i: bounds[i])
+        chunk_size = -(-len(order) // workers)
+        chunks = [order[i:i + chunk_size] for i in range(0, len(order), chunk_size)]
+
+        weeks = [row[0] for row in rows]
+        jobs = []
+        for chunk in chunks:
+            chunk_bounds = [bounds[i] for i in chunk]
+            lo = bisect_left(weeks, min(start for start, _ in chunk_bounds))
+            hi = bisect_right(weeks, max(end for _, end in chunk_bounds))
+            chunk_rows = rows[lo:hi]
+            # Keep employee order, which the reports are listed in
+            chunk_ids = {row[2] for row in chunk_rows}
+            chunk_info = {emp_id: info for emp_id, info in employee_info.items() if emp_id in chunk_ids}
+            jobs.append((chunk_rows, chunk_bounds, chunk_info))
+
+        reports: List[List[Dict[str, Any]]] = [[] for _ in bounds]
+        with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+            for chunk, chunk_reports in zip(chunks, pool.map(_period_wage_reports, *zip(*jobs))):
+                for i, report in zip(chunk, chunk_reports):
+                    reports[i] = report
+        return reports
+
+    def export_to_csv(self, data: Iterable[Dict[str, Any]], filename: str) -> Tuple[bool, str]:
+        """Write report rows to a timestamped CSV file, streaming them if data is an iterator"""
+        try:
+            # The first row gives the columns; the rest are written as they arrive
+            rows = iter(data)
+            first = next(rows, None)
+            if first is None:
+                return False, "No data to export"
+
+            # Generate timestamped filename
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            file_path = self.reports_folder / f"{filename}_{timestamp}.csv"
+
+            # Write data to CSV
+            with file_path.open('w', newline='', encoding='utf-8-sig') as f:
+                writer = csv.DictWriter(f, fieldnames=first.keys())
+                writer.writeheader()
+                writer.writerow(first)
+                writer.writerows(rows)
+
+            return True, str(file_path)
+        except Exception as e:
+            return False, f"Failed to export to CSV: {str(e)}"
+
+    def export_to_txt(self, data: Iterable[Dict[str, Any]], filename: str) -> Tuple[bool, str]:
+        """Write report rows to a timestamped text file as a grid table"""
+        try:
+            # The grid needs every row to size its columns
+            if not isinstance(data, list):
+                data = list(data)
+            if not data:
+                return False, "No data to export"
+
+            # Generate timestamped filename
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            file_path = self.reports_folder / f"{filename}_{timestamp}.txt"
+
+            headers = list(data[0].keys())
+            rows = [row.values() for row in data]
+
+            # Write the report header, then the table line by line
+            with file_path.open('w', encoding='utf-8') as f:
+                f.write(
+                    f"Report: {filename}\n"
+                    f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+                )
+                write_grid(f, headers, rows)
+
+            return True, str(file_path)
+        except Exception as e:
+            return False, f"Failed to export to TXT: {str(e)}"
+
+    def create_staff_list(self, sort_by: str = "lname") -> Tuple[bool, List[Dict[str, Any]], str]:
+        """Generate a sorted list of all employees"""
+        try:
+            # Employees come back already sorted
+            order = "lname" if sort_by == "lname" else "job"
+            success, employees, error = self.data_manager.get_sorted_employees(order)
+            if not success:
+                return False, [], error
+
+            return True, employees, ""
+        except Exception as e:
+            return False, [], f"Failed to create staff list: {str(e)}"
+
+    def save_csv_report(self, data: Iterable[Dict[str, Any]], filename: str) -> Tuple[bool, str]:
+        """Save report to CSV file"""
+        return self.export_to_csv(data, filename)
+
+    def save_text_report(self, data: Iterable[Dict[str, Any]], filename: str) -> Tuple[bool, str]:
+        """Save report to text file"""
+        return self.export_to_txt(data, filename)
+
+    def generate_employee_schedule(self, employee_id: str, start_date: str, end_date: str) -> Tuple[bool, List[Dict[str, Any]], str]:
+        """Generate schedule report for an employee"""
+        try:
+            # Validate dates, accepting the alternative formats but querying in DD-MM-YYYY
+            if start_date:
+                start_date = normalise_date(start_date)
+                if start_date is None:
+                    return False, [], "Invalid date format. Use DD-MM-YYYY or YYYY-MM-DD"
+            if end_date:
+                end_date = normalise_date(end_date)
+                if end_date is None:
+                    return False, [], "Invalid date format. Use DD-MM-YYYY or YYYY-MM-DD"
+
+            # Get employee
+            success, employee, error = self.data_manager.get_employee(employee_id)
+            if not success:
+                return False, [], f"Employee not found: {error}"
+
+            # Get schedules
+            success, schedules, error = self.data_manager.get_schedules(
+                employee_id=employee_id,
+                start_date=start_date,
+                end_date=end_date
+            )
+            if not success:
+                return False, [], error
+
+            if not schedules:
+                return False, [], "No schedules found for this employee in the specified date range"
+
+            # Format schedules for report
+            report_data = []
+            for schedule in schedules:
+                row = schedule.to_dict()
+                row['Employee Name'] = f"{employee.fname} {employee.lname}"
+                row['Position'] = employee.job
+                report_data.append(row)
+
+            return True, report_data, ""
+        except Exception as e:
+            return False, [], f"Failed to generate employee schedule: {str(e)}"
+
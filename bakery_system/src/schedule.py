@@ -1,108 +1,208 @@
-from datetime import datetime
-from typing import Dict, List, Tuple, Any
-
-class Schedule:
-    def __init__(self, schedule_id: str, employee_id: str, week_start_date: str, daily_hours: Dict[str, float]):
-        self.schedule_id = schedule_id
-        self.employee_id = employee_id
-        self.week_start_date = week_start_date
-        self.hours = daily_hours
-        self.total_hours = 0.0
-        self.total_pay = 0.0
-
-    @classmethod
-    def validate_hours(cls, daily_hours: Dict[str, float]) -> Tuple[bool, str]:
-        """Validates daily and weekly hours against legal limits"""
-        try:
-            # Check daily limits (≤12h)
-            for day, hours in daily_hours.items():
-                if hours < 0 or hours > 12:
-                    return False, f"Invalid hours for {day}: must be between 0 and 12"
-
-            # Check weekly limit (≤48h)
-            total_weekly = sum(daily_hours.values())
-            if total_weekly > 48:
-                return False, "Weekly hours cannot exceed 48"
-
-            return True, ""
-        except Exception as e:
-            return False, f"Error validating hours: {str(e)}"
-
-    def validate(self) -> Tuple[bool, str]:
-        """Validate all schedule data"""
-        # Check if employee ID is provided
-        if not self.employee_id:
-            return False, "Employee ID is required"
-
-        # Check if week start date is valid
-        try:
-            datetime.strptime(self.week_start_date, '%d-%m-%Y')
-        except ValueError:
-            return False, "Invalid date format. Use DD-MM-YYYY"
-
-        # Validate hours
-        return self.validate_hours(self.hours)
-
-    def calculate_total_hours(self) -> float:
-        """Calculate total hours worked in the week"""
-        self.total_hours = sum(self.hours.values())
-        return self.total_hours
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert schedule to dictionary for storage"""
-        return {
-            'schedule_id': self.schedule_id,
-            'employee_id': self.employee_id,
-            'week_start': self.week_start_date,
-            'mon': self.hours.get('mon', 0),
-            'tue': self.hours.get('tue', 0),
-            'wed': self.hours.get('wed', 0),
-            'thu': self.hours.get('thu', 0),
-            'fri': self.hours.get('fri', 0),
-            'sat': self.hours.get('sat', 0),
-            'sun': self.hours.get('sun', 0),
-            'total_hours': self.total_hours,
-            'total_pay': self.total_pay
-        }
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'Schedule':
-        """Create Schedule object from dictionary data"""
-        daily_hours = {
-            'mon': float(data.get('mon', 0)),
-            'tue': float(data.get('tue', 0)),
-            'wed': float(data.get('wed', 0)),
-            'thu': float(data.get('thu', 0)),
-            'fri': float(data.get('fri', 0)),
-            'sat': float(data.get('sat', 0)),
-            'sun': float(data.get('sun', 0))
-        }
-
-        schedule = cls(
-            data.get('schedule_id'),
-            data.get('employee_id'),
-            data.get('week_start'),
-            daily_hours
-        )
-        schedule.total_hours = float(data.get('total_hours', 0))
-        schedule.total_pay = float(data.get('total_pay', 0))
-        return schedule
-
-    @staticmethod
-    def generate_schedule_id(existing_ids: List[str]) -> str:
-        """Generate a unique schedule ID"""
-        if not existing_ids:
-            return "S001"
-
-        # Find the highest ID number
-        highest_num = 0
-        for schedule_id in existing_ids:
-            if schedule_id.startswith('S'):
-                try:
-                    id_num = int(schedule_id[1:])
-                    highest_num = max(highest_num, id_num)
-                except ValueError:
-                    # Skip IDs that don't follow the expected format
-                    continue
-
-        return f"S{highest_num + 1:03d}"
+from array import array
+from collections.abc import MutableMapping
+from sys import intern
+from typing import Dict, List, Tuple, Any, Iterator, Sequence
+from dates import date_ordinal
+
+DAYS = ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']
+
+SCHEDULE_FIELDS = ['schedule_id', 'employee_id', 'week_start'] + DAYS + ['total_hours', 'total_pay']
+
+# Fields no stored schedule can do without
+REQUIRED_SCHEDULE_FIELDS = ['schedule_id', 'employee_id', 'week_start']
+
+# Column names in older schedules files -> the fields they hold
+LEGACY_SCHEDULE_COLUMNS = {'week_start_date': 'week_start', **{f"{day}_hours": day for day in DAYS}}
+
+_DAY_INDEX = {day: i for i, day in enumerate(DAYS)}
+
+# Stored field name -> attribute, for the fields that aren't daily hours
+_FIELD_ATTRS = {
+    'schedule_id': 'schedule_id',
+    'employee_id': 'employee_id',
+    'week_start': 'week_start_date',
+    'total_hours': 'total_hours',
+    'total_pay': 'total_pay'
+}
+
+
+def parse_hours(value: Any) -> float:
+    """Convert a stored hours or pay value to float, treating blanks as zero"""
+    if value is None or value == '':
+        return 0.0
+    return float(value)
+
+
+class Schedule(MutableMapping):
+    """
+    One employee's hours for one week
+
+    Fields live in __slots__ and the seven daily hours in a packed array of
+    doubles, so loaded schedules take a fraction of the memory of row dicts.
+    A schedule can also be read and written like the row it is stored as,
+    e.g. schedule['mon'] or dict(schedule), keyed by SCHEDULE_FIELDS.
+    """
+
+    __slots__ = ('schedule_id', 'employee_id', 'week_start_date', 'daily_hours', 'total_hours', 'total_pay')
+
+    def __init__(self, schedule_id: str, employee_id: str, week_start_date: str, daily_hours: Dict[str, float]):
+        self.schedule_id = schedule_id
+        self.employee_id = employee_id
+        self.week_start_date = week_start_date
+        self.hours = daily_hours
+        self.total_hours = 0.0
+        self.total_pay = 0.0
+
+    @property
+    def hours(self) -> Dict[str, float]:
+        """Daily hours keyed by day"""
+        return dict(zip(DAYS, self.daily_hours))
+
+    @hours.setter
+    def hours(self, daily_hours: Dict[str, float]) -> None:
+        self.daily_hours = array('d', [daily_hours.get(day, 0) for day in DAYS])
+
+    # Row access
+    def __getitem__(self, key: str) -> Any:
+        day = _DAY_INDEX.get(key)
+        if day is not None:
+            return self.daily_hours[day]
+        try:
+            return getattr(self, _FIELD_ATTRS[key])
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        day = _DAY_INDEX.get(key)
+        if day is not None:
+            self.daily_hours[day] = parse_hours(value)
+        elif key in ('total_hours', 'total_pay'):
+            setattr(self, key, parse_hours(value))
+        elif key in _FIELD_ATTRS:
+            setattr(self, _FIELD_ATTRS[key], value)
+        else:
+            raise KeyError(key)
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("Schedule fields can't be removed")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(SCHEDULE_FIELDS)
+
+    def __len__(self) -> int:
+        return len(SCHEDULE_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"Schedule({self.to_dict()!r})"
+
+    @classmethod
+    def validate_hours(cls, daily_hours: Dict[str, float]) -> Tuple[bool, str]:
+        """Validates daily and weekly hours against legal limits"""
+        try:
+            # Check daily limits (≤12h)
+            for day, hours in daily_hours.items():
+                if hours < 0 or hours > 12:
+                    return False, f"Invalid hours for {day}: must be between 0 and 12"
+
+            # Check weekly limit (≤48h)
+            total_weekly = sum(daily_hours.values())
+            if total_weekly > 48:
+                return False, "Weekly hours cannot exceed 48"
+
+            return True, ""
+        except Exception as e:
+            return False, f"Error validating hours: {str(e)}"
+
+    def validate(self) -> Tuple[bool, str]:
+        """Validate all schedule data"""
+        # Check if employee ID is provided
+        if not self.employee_id:
+            return False, "Employee ID is required"
+
+        # Check if week start date is valid
+        if date_ordinal(self.week_start_date) is None:
+            return False, "Invalid date format. Use DD-MM-YYYY"
+
+        # Validate hours
+        return self.validate_hours(self.hours)
+
+    def calculate_total_hours(self) -> float:
+        """Calculate total hours worked in the week"""
+        self.total_hours = sum(self.daily_hours)
+        return self.total_hours
+
+    def weekday_hours(self) -> float:
+        """Hours worked Monday to Friday"""
+        return sum(self.daily_hours[:5])
+
+    def weekend_hours(self) -> float:
+        """Hours worked Saturday and Sunday"""
+        return sum(self.daily_hours[5:])
+
+    def to_values(self) -> List[Any]:
+        """Field values in SCHEDULE_FIELDS order"""
+        return [self.schedule_id, self.employee_id, self.week_start_date,
+                *self.daily_hours, self.total_hours, self.total_pay]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert schedule to dictionary for storage"""
+        return dict(zip(SCHEDULE_FIELDS, self.to_values()))
+
+    def copy(self) -> 'Schedule':
+        """Return an independent copy of this schedule"""
+        schedule = Schedule.__new__(Schedule)
+        schedule.schedule_id = self.schedule_id
+        schedule.employee_id = self.employee_id
+        schedule.week_start_date = self.week_start_date
+        schedule.daily_hours = array('d', self.daily_hours)
+        schedule.total_hours = self.total_hours
+        schedule.total_pay = self.total_pay
+        return schedule
+
+    @classmethod
+    def from_values(cls, values: Sequence[Any]) -> 'Schedule':
+        """Create Schedule object from stored values in SCHEDULE_FIELDS order"""
+        (schedule_id, employee_id, week_start,
+         mon, tue, wed, thu, fri, sat, sun, total_hours, total_pay) = values
+
+        schedule = cls.__new__(cls)
+        schedule.schedule_id = schedule_id
+        # Employees and weeks repeat across many rows, so share one copy of each string
+        schedule.employee_id = intern(employee_id) if isinstance(employee_id, str) else employee_id
+        schedule.week_start_date = intern(week_start) if isinstance(week_start, str) else week_start
+        try:
+            schedule.daily_hours = array('d', map(float, (mon, tue, wed, thu, fri, sat, sun)))
+            schedule.total_hours = float(total_hours)
+            schedule.total_pay = float(total_pay)
+        except (TypeError, ValueError):
+            # Blank or missing values count as zero
+            schedule.daily_hours = array('d', map(parse_hours, (mon, tue, wed, thu, fri, sat, sun)))
+            schedule.total_hours = parse_hours(total_hours)
+            schedule.total_pay = parse_hours(total_pay)
+        return schedule
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Schedule':
+        """Create Schedule object from dictionary data"""
+        if isinstance(data, Schedule):
+            return data.copy()
+        return cls.from_values([data.get(field) for field in SCHEDULE_FIELDS])
+
+    @staticmethod
+    def generate_schedule_id(existing_ids: List[str]) -> str:
+        """Generate a unique schedule ID"""
+        if not existing_ids:
+            return "S001"
+
+        # Find the highest ID number
+        highest_num = 0
+        for schedule_id in existing_ids:
+            if schedule_id.startswith('S'):
+                try:
+                    id_num = int(schedule_id[1:])
+                    highest_num = max(highest_num, id_num)
+                except ValueError:
+                    # Skip IDs that don't follow the expected format
+                    continue
+
+        return f"S{highest_num + 1:03d}"
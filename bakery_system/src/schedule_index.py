@@ -0,0 +1,160 @@
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from schedule import Schedule
+from dates import date_ordinal
+
+
+def schedule_filter(employee_id: str = None, start: Optional[int] = None, end: Optional[int] = None) -> Callable[[Schedule], bool]:
+    """
+    Build a test for rows outside the index that matches ScheduleIndex.query
+
+    Rows with an unparseable week_start only match when no date bounds are
+    given. Parsed weeks are cached, since the same weeks repeat across rows.
+    """
+    ordinals: Dict[str, Optional[int]] = {}
+
+    def matches(row: Schedule) -> bool:
+        if employee_id and row.employee_id != employee_id:
+            return False
+        if start is None and end is None:
+            return True
+
+        week = row.week_start_date
+        if week in ordinals:
+            ordinal = ordinals[week]
+        else:
+            ordinal = ordinals[week] = date_ordinal(week)
+        if ordinal is None:
+            return False
+        return (start is None or ordinal >= start) and (end is None or ordinal <= end)
+
+    return matches
+
+
+class ScheduleIndex:
+    """Sorted week_start index over the rows of the schedules file and its change log"""
+
+    def __init__(self, rows: Iterable[Schedule]):
+        self.rows: List[Schedule] = []
+
+        # (ordinal, row position) pairs kept sorted, overall and per employee
+        self._ordinals: List[int] = []
+        self._positions: List[int] = []
+        self._by_employee: Dict[str, Tuple[List[int], List[int]]] = {}
+
+        # Row positions per employee in file order, including undated rows
+        self._employee_rows: Dict[str, List[int]] = {}
+
+        # Live row positions per schedule_id, and positions hidden by the log
+        self._by_schedule_id: Dict[str, List[int]] = {}
+        self._dead: Set[int] = set()
+
+        # Number of change log records applied on top of the schedules file
+        self.log_records = 0
+
+        dated = []
+        for row in rows:
+            position = self._append(row)
+            ordinal = date_ordinal(row.week_start_date)
+            if ordinal is not None:
+                dated.append((ordinal, position))
+
+        # Sort once on load rather than inserting row by row
+        dated.sort()
+        for ordinal, position in dated:
+            self._ordinals.append(ordinal)
+            self._positions.append(position)
+            ordinals, positions = self._by_employee.setdefault(self.rows[position].employee_id, ([], []))
+            ordinals.append(ordinal)
+            positions.append(position)
+
+    def __len__(self) -> int:
+        return len(self.rows) - len(self._dead)
+
+    def __contains__(self, schedule_id: str) -> bool:
+        return bool(self._by_schedule_id.get(schedule_id))
+
+    def get(self, schedule_id: str) -> List[Schedule]:
+        """Return the live rows with this schedule_id (shared with the index, copy before changing)"""
+        return [self.rows[p] for p in self._by_schedule_id.get(schedule_id, [])]
+
+    def _append(self, row: Schedule) -> int:
+        """Store a row and return its position"""
+        position = len(self.rows)
+        self.rows.append(row)
+        self._employee_rows.setdefault(row.employee_id, []).append(position)
+        self._by_schedule_id.setdefault(row.schedule_id, []).append(position)
+        return position
+
+    def add(self, row: Schedule) -> None:
+        """Index a row that was appended to the schedules file or its log"""
+        position = self._append(row)
+
+        ordinal = date_ordinal(row.week_start_date)
+        if ordinal is None:
+            return
+        self._insert(self._ordinals, self._positions, ordinal, position)
+        ordinals, positions = self._by_employee.setdefault(row.employee_id, ([], []))
+        self._insert(ordinals, positions, ordinal, position)
+
+    def remove(self, schedule_id: str) -> int:
+        """Hide every live row with this schedule_id and return how many there were"""
+        positions = self._by_schedule_id.pop(schedule_id, [])
+        self._dead.update(positions)
+        return len(positions)
+
+    def apply_log_record(self, op: str, schedule_id: str, row: Optional[Schedule] = None) -> None:
+        """
+        Apply one change log record
+
+        A 'delete' tombstone hides the schedule; a 'replace' record hides it
+        and adds the new row. Both fully determine the schedule's state, so
+        replaying a log over an already compacted file is harmless.
+        """
+        self.remove(schedule_id)
+        if op == 'replace':
+            self.add(row)
+        self.log_records += 1
+
+    @staticmethod
+    def _insert(ordinals: List[int], positions: List[int], ordinal: int, position: int) -> None:
+        """Insert into parallel sorted lists, after any rows for the same week"""
+        i = bisect_right(ordinals, ordinal)
+        ordinals.insert(i, ordinal)
+        positions.insert(i, position)
+
+    def live_rows(self) -> List[Schedule]:
+        """Return every row not hidden by the log, in order"""
+        if not self._dead:
+            return list(self.rows)
+        return [row for p, row in enumerate(self.rows) if p not in self._dead]
+
+    def query(self, employee_id: str = None, start: Optional[int] = None, end: Optional[int] = None) -> List[Schedule]:
+        """
+        Return live rows matching the filters in file order
+
+        Args:
+            employee_id (str): Only return rows for this employee
+            start (Optional[int]): Inclusive lower bound as a day ordinal
+            end (Optional[int]): Inclusive upper bound as a day ordinal
+
+        Returns:
+            List[Schedule]: The matching rows (shared with the index, copy before changing)
+        """
+        if start is None and end is None:
+            if employee_id:
+                positions = self._employee_rows.get(employee_id, [])
+            else:
+                return self.live_rows()
+        else:
+            if employee_id:
+                ordinals, positions = self._by_employee.get(employee_id, ([], []))
+            else:
+                ordinals, positions = self._ordinals, self._positions
+
+            lo = bisect_left(ordinals, start) if start is not None else 0
+            hi = bisect_right(ordinals, end) if end is not None else len(ordinals)
+            positions = sorted(positions[lo:hi])
+
+        dead = self._dead
+        return [self.rows[p] for p in positions if p not in dead]
@@ -0,0 +1,148 @@
+import codecs
+import mmap
+import os
+from pathlib import Path
+from typing import Container, Dict, Iterator, Optional
+from schedule import Schedule, SCHEDULE_FIELDS
+from dates import date_ordinal
+
+# The header the scanner's fixed column positions rely on
+_HEADER = ','.join(SCHEDULE_FIELDS).encode('ascii')
+
+
+class ScheduleScanner:
+    """
+    Filtered reads of schedules.csv straight from a memory map
+
+    Row boundaries are found with bytes searches over the mapped file
+    (memchr underneath) and only the employee_id and week_start fields are
+    sliced out to test each row; a row is decoded into a Schedule only if it
+    matches. An employee filter jumps from one occurrence of the ID to the
+    next instead of visiting every row.
+
+    The scanner sees the file as it was when opened: rows appended later
+    are past the mapped length, and a file replaced by rename stays mapped.
+
+    Only files in the usual layout can be scanned this way, since fields
+    are located by counting commas. open() returns None for anything else
+    (another column order, or quoted values), and callers fall back to
+    parsing the file as CSV.
+    """
+
+    def __init__(self, mapped: mmap.mmap, body_start: int):
+        self._mapped = mapped
+        self._body_start = body_start
+        self._size = len(mapped)
+
+    @classmethod
+    def open(cls, path: Path) -> Optional['ScheduleScanner']:
+        """Map a schedules file, or return None if it is empty or can't be scanned"""
+        with Path(path).open('rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return None
+            mapped = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+
+        header_end = mapped.find(b'\n')
+        if header_end == -1:
+            header_end = size
+        header = mapped[:header_end].rstrip(b'\r')
+        if header.startswith(codecs.BOM_UTF8):
+            header = header[len(codecs.BOM_UTF8):]
+
+        # A quote anywhere means a value may hold a comma or newline
+        if header != _HEADER or mapped.find(b'"') != -1:
+            mapped.close()
+            return None
+        return cls(mapped, header_end + 1)
+
+    def close(self) -> None:
+        self._mapped.close()
+
+    def __enter__(self) -> 'ScheduleScanner':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _decode(self, line_start: int, line_end: int) -> Schedule:
+        values = self._mapped[line_start:line_end].rstrip(b'\r').decode('utf-8').split(',')
+        if len(values) != len(SCHEDULE_FIELDS):
+            values = (values + [None] * len(SCHEDULE_FIELDS))[:len(SCHEDULE_FIELDS)]
+        return Schedule.from_values(values)
+
+    def scan(self, employee_id: str = None, start: Optional[int] = None, end: Optional[int] = None,
+             skip: Container[str] = ()) -> Iterator[Schedule]:
+        """
+        Yield the rows matching the filters, in file order
+
+        Matches the same rows as schedule_filter: rows with an unparseable
+        week_start only match when no date bounds are given.
+
+        Args:
+            employee_id (str): Only yield rows for this employee
+            start (Optional[int]): Inclusive lower bound as a day ordinal
+            end (Optional[int]): Inclusive upper bound as a day ordinal
+            skip (Container[str]): schedule_ids to leave out, e.g. those superseded by the change log
+
+        Returns:
+            Iterator[Schedule]: The matching rows, each decoded on its own
+        """
+        mapped = self._mapped
+        size = self._size
+        dated = start is not None or end is not None
+        # Weeks repeat across rows, so each distinct week_start is tested once
+        weeks: Dict[bytes, bool] = {}
+
+        def in_range(week: bytes) -> bool:
+            result = weeks.get(week)
+            if result is None:
+                ordinal = date_ordinal(week.decode('utf-8', 'replace'))
+                result = weeks[week] = ordinal is not None and \
+                    (start is None or ordinal >= start) and (end is None or ordinal <= end)
+            return result
+
+        if employee_id:
+            # The ID always sits between the first and second commas of its rows
+            needle = b',' + employee_id.encode('utf-8') + b','
+            pos = self._body_start
+            while True:
+                hit = mapped.find(needle, pos)
+                if hit == -1:
+                    return
+                line_start = mapped.rfind(b'\n', 0, hit) + 1
+                line_end = mapped.find(b'\n', hit)
+                if line_end == -1:
+                    line_end = size
+                pos = line_end + 1
+
+                if mapped.find(b',', line_start, hit + 1) != hit:
+                    # The needle matched further along the row, not in employee_id
+                    continue
+                if dated:
+                    week_start = hit + len(needle)
+                    week_end = mapped.find(b',', week_start, line_end)
+                    if week_end == -1 or not in_range(mapped[week_start:week_end]):
+                        continue
+                row = self._decode(line_start, line_end)
+                if row.schedule_id not in skip:
+                    yield row
+            return
+
+        line_start = self._body_start
+        while line_start < size:
+            line_end = mapped.find(b'\n', line_start)
+            if line_end == -1:
+                line_end = size
+            if dated:
+                id_end = mapped.find(b',', line_start, line_end)
+                employee_end = mapped.find(b',', id_end + 1, line_end) if id_end != -1 else -1
+                week_end = mapped.find(b',', employee_end + 1, line_end) if employee_end != -1 else -1
+                matched = week_end != -1 and in_range(mapped[employee_end + 1:week_end])
+            else:
+                matched = line_end > line_start and mapped[line_start:line_end] != b'\r'
+            if matched:
+                row = self._decode(line_start, line_end)
+                if row.schedule_id not in skip:
+                    yield row
+            line_start = line_end + 1
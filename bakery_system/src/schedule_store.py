@@ -0,0 +1,278 @@
+import csv
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+from schedule import Schedule, SCHEDULE_FIELDS, DAYS
+from dates import any_date_ordinal, format_ordinal
+from storage import atomic_write, read_schedules
+from payroll_totals import PayTotals
+
+try:
+    import numpy as np
+except ImportError:
+    # Bulk reads fall back to struct; everything else works without NumPy
+    np = None
+
+# Default name of the binary schedules file in a data folder
+BINARY_SCHEDULES_FILE = "schedules.bin"
+
+# Magic, format version, record size and record count, padded to 32 bytes
+HEADER = struct.Struct('<8sIIQ8x')
+MAGIC = b'BKSCHED\x00'
+VERSION = 1
+
+# schedule_id, employee number, week ordinal, seven daily hours, total hours, pay in cents
+RECORD = struct.Struct('<16sIi7ffq')
+SCHEDULE_ID_BYTES = 16
+
+# The same layout for NumPy; the record struct has no padding, so the sizes match
+RECORD_DTYPE = np.dtype([
+    ('schedule_id', 'S16'),
+    ('employee', '<u4'),
+    ('week', '<i4'),
+    ('hours', '<f4', (len(DAYS),)),
+    ('total_hours', '<f4'),
+    ('pay_cents', '<i8'),
+]) if np is not None else None
+
+# Records read per chunk when streaming
+_CHUNK_RECORDS = 8192
+
+
+def _from_float32(value: float) -> float:
+    """The shortest float that reads back as the same float32, e.g. 7.3 rather than 7.300000190734863"""
+    return float(f"{value:.7g}")
+
+
+class BinaryScheduleStore:
+    """
+    Schedules as fixed-width binary records
+
+    The file is a 32-byte header, then one 64-byte record per schedule, then
+    the employee IDs as a JSON list. Records refer to an employee by its
+    position in that list, so record n always starts at byte 32 + 64 * n and
+    any one can be read with a single seek. Weeks are stored as day
+    ordinals, hours as float32 and pay as whole cents, so hours come back at
+    float32 precision (about 7 significant digits).
+
+    The whole file is rewritten on every write and swapped in by rename, so
+    readers always see one complete version. It is a separate copy of the
+    schedules for bulk reading; the storage backend stays the one DataManager
+    reads and writes.
+
+    Example:
+        store = BinaryScheduleStore(Path("data") / BINARY_SCHEDULES_FILE)
+        store.import_csv(Path("data") / "schedules.csv")
+        schedule = store[0]
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+        # Employee IDs of the file last read, invalidated by file mtime/size
+        self._employee_ids: List[str] = []
+        self._employee_ids_stamp: Optional[Tuple[int, int]] = None
+
+    def _open(self) -> Tuple[BinaryIO, int, List[str]]:
+        """Open the file and return it with its record count and employee IDs"""
+        f = self.path.open('rb')
+        try:
+            magic, version, record_size, count = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+                raise ValueError(f"{self.path} isn't a binary schedules file this version can read")
+
+            stat = os.fstat(f.fileno())
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            if stamp != self._employee_ids_stamp:
+                f.seek(HEADER.size + count * RECORD.size)
+                self._employee_ids = json.loads(f.read().decode('utf-8'))
+                self._employee_ids_stamp = stamp
+            return f, count, self._employee_ids
+        except BaseException:
+            f.close()
+            raise
+
+    @staticmethod
+    def _pack(schedule: Schedule, employee_numbers: Dict[str, int]) -> bytes:
+        schedule_id = str(schedule.schedule_id).encode('utf-8')
+        if len(schedule_id) > SCHEDULE_ID_BYTES:
+            raise ValueError(f"Schedule ID {schedule.schedule_id} is longer than {SCHEDULE_ID_BYTES} bytes")
+        week = any_date_ordinal(schedule.week_start_date)
+        if week is None:
+            raise ValueError(f"Schedule {schedule.schedule_id} has an invalid week_start: {schedule.week_start_date}")
+
+        employee = employee_numbers.get(schedule.employee_id)
+        if employee is None:
+            employee = employee_numbers[schedule.employee_id] = len(employee_numbers)
+        return RECORD.pack(schedule_id, employee, week, *schedule.daily_hours,
+                           schedule.total_hours, round(schedule.total_pay * 100))
+
+    @staticmethod
+    def _unpack(values: Tuple[Any, ...], employee_ids: List[str]) -> Schedule:
+        schedule_id, employee, week, *hours, total_hours, pay_cents = values
+        return Schedule.from_values([
+            schedule_id.rstrip(b'\x00').decode('utf-8'), employee_ids[employee], format_ordinal(week),
+            *map(_from_float32, hours), _from_float32(total_hours), pay_cents / 100
+        ])
+
+    def write(self, schedules: Iterable[Any]) -> int:
+        """
+        Replace the file with these schedules
+
+        Args:
+            schedules (Iterable[Any]): Schedules or schedule dicts, streamed one at a time
+
+        Returns:
+            int: Number of schedules written
+        """
+        employee_numbers: Dict[str, int] = {}
+        count = 0
+        with atomic_write(self.path, 'wb') as f:
+            # Placeholder until the count is known
+            f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, 0))
+            for schedule in schedules:
+                if not isinstance(schedule, Schedule):
+                    schedule = Schedule.from_dict(schedule)
+                f.write(self._pack(schedule, employee_numbers))
+                count += 1
+            f.write(json.dumps(list(employee_numbers)).encode('utf-8'))
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, count))
+        return count
+
+    def __len__(self) -> int:
+        f, count, _ = self._open()
+        f.close()
+        return count
+
+    def __getitem__(self, record: int) -> Schedule:
+        """Read one schedule by record number, with a single seek"""
+        f, count, employee_ids = self._open()
+        with f:
+            if record < 0:
+                record += count
+            if not 0 <= record < count:
+                raise IndexError(f"Record {record} out of range for {count} schedules")
+            f.seek(HEADER.size + record * RECORD.size)
+            return self._unpack(RECORD.unpack(f.read(RECORD.size)), employee_ids)
+
+    def __iter__(self) -> Iterator[Schedule]:
+        """Yield every schedule in record order, reading the file in chunks"""
+        f, count, employee_ids = self._open()
+        with f:
+            f.seek(HEADER.size)
+            remaining = count
+            while remaining:
+                chunk = min(remaining, _CHUNK_RECORDS)
+                for values in RECORD.iter_unpack(f.read(chunk * RECORD.size)):
+                    yield self._unpack(values, employee_ids)
+                remaining -= chunk
+
+    def employee_ids(self) -> List[str]:
+        """Employee IDs in the order records refer to them"""
+        f, _, employee_ids = self._open()
+        f.close()
+        return list(employee_ids)
+
+    def import_csv(self, csv_file: Path) -> int:
+        """Replace the file with the schedules in a schedules.csv file and return how many there were"""
+        with Path(csv_file).open('r', newline='', encoding='utf-8-sig') as f:
+            return self.write(read_schedules(f))
+
+    def export_csv(self, csv_file: Path) -> int:
+        """Write every schedule to a CSV file in the schedules.csv layout and return how many there were"""
+        count = 0
+        with atomic_write(Path(csv_file), newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(SCHEDULE_FIELDS)
+            for schedule in self:
+                writer.writerow(schedule.to_values())
+                count += 1
+        return count
+
+    def to_array(self, memory_map: bool = True) -> Any:
+        """
+        Read every record into a NumPy structured array of RECORD_DTYPE
+
+        Args:
+            memory_map (bool): Map the file with np.memmap, reading pages only as
+                they're used, rather than read it all with np.fromfile (default: True)
+
+        Returns:
+            np.ndarray: Fields schedule_id, employee (position in employee_ids()),
+            week (day ordinal), hours (seven per row), total_hours and pay_cents
+        """
+        if np is None:
+            raise ImportError("NumPy is required to read schedules as an array")
+
+        f, count, _ = self._open()
+        with f:
+            return self._read_array(f, count, memory_map)
+
+    @staticmethod
+    def _read_array(f: BinaryIO, count: int, memory_map: bool) -> Any:
+        if count == 0:
+            return np.empty(0, dtype=RECORD_DTYPE)
+        if memory_map:
+            # The mapping outlives the file object
+            return np.memmap(f, dtype=RECORD_DTYPE, mode='r', offset=HEADER.size, shape=(count,))
+        f.seek(HEADER.size)
+        return np.fromfile(f, dtype=RECORD_DTYPE, count=count)
+
+    def range_totals(self, start: Optional[int] = None, end: Optional[int] = None) -> Dict[str, PayTotals]:
+        """
+        Regular hours, weekend hours and pay per employee for weeks from start to end inclusive
+
+        Uses NumPy over the mapped file where available, otherwise streams the
+        records. Employees with no schedules in the range are left out.
+        """
+        if np is None:
+            return self._range_totals_unpacked(start, end)
+
+        f, count, employee_ids = self._open()
+        with f:
+            records = self._read_array(f, count, memory_map=True)
+        mask = np.ones(len(records), dtype=bool)
+        if start is not None:
+            mask &= records['week'] >= start
+        if end is not None:
+            mask &= records['week'] <= end
+
+        selected = records[mask]
+        employees = selected['employee']
+        hours = selected['hours'].astype(np.float64)
+        size = len(employee_ids)
+        regular = np.bincount(employees, weights=hours[:, :5].sum(axis=1), minlength=size)
+        weekend = np.bincount(employees, weights=hours[:, 5:].sum(axis=1), minlength=size)
+        # Whole cents add up exactly as float64
+        pay = np.bincount(employees, weights=selected['pay_cents'].astype(np.float64), minlength=size) / 100
+        counts = np.bincount(employees, minlength=size)
+        return {
+            employee_ids[i]: (float(regular[i]), float(weekend[i]), float(pay[i]))
+            for i in np.flatnonzero(counts)
+        }
+
+    def _range_totals_unpacked(self, start: Optional[int], end: Optional[int]) -> Dict[str, PayTotals]:
+        f, count, employee_ids = self._open()
+        sums: Dict[int, List[float]] = {}
+        with f:
+            f.seek(HEADER.size)
+            remaining = count
+            while remaining:
+                chunk = min(remaining, _CHUNK_RECORDS)
+                for _, employee, week, *hours, _, pay_cents in RECORD.iter_unpack(f.read(chunk * RECORD.size)):
+                    if (start is not None and week < start) or (end is not None and week > end):
+                        continue
+                    cell = sums.get(employee)
+                    if cell is None:
+                        cell = sums[employee] = [0.0, 0.0, 0]
+                    cell[0] += sum(hours[:5])
+                    cell[1] += sum(hours[5:])
+                    cell[2] += pay_cents
+                remaining -= chunk
+        return {
+            employee_ids[employee]: (regular, weekend, cents / 100)
+            for employee, (regular, weekend, cents) in sorted(sums.items())
+        }
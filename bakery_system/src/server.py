@@ -0,0 +1,387 @@
+import asyncio
+import ipaddress
+import json
+import re
+import socket
+import threading
+from collections.abc import Mapping
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+from data_manager import DataManager
+from reports import Reports
+from async_service import AsyncService, AsyncDataManager, AsyncReports
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Largest request body accepted, in bytes
+MAX_BODY = 10 * 1024 * 1024
+
+# Most requests in one /batch call
+MAX_BATCH = 1000
+
+# (method, path pattern, handler); handlers take the API, path parameters, query and body
+Handler = Callable[['BakeryApi', Dict[str, str], Dict[str, str], Any], Awaitable[Tuple]]
+ROUTES: List[Tuple[str, Pattern, Handler]] = []
+
+
+def route(method: str, path: str) -> Callable[[Handler], Handler]:
+    """Register a handler for a method and a path like /employees/{employee_id}"""
+    pattern = re.compile('^' + re.sub(r'\{(\w+)\}', r'(?P<\1>[^/]+)', path) + '$')
+
+    def register(handler: Handler) -> Handler:
+        ROUTES.append((method, pattern, handler))
+        return handler
+    return register
+
+
+def _int_param(query: Dict[str, str], name: str, default: Optional[int] = None) -> Optional[int]:
+    value = query.get(name)
+    if value in (None, ''):
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a whole number") from None
+
+
+def _float_field(body: Dict[str, Any], name: str) -> float:
+    try:
+        return float(body.get(name))
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be a number") from None
+
+
+def _body_dict(body: Any) -> Dict[str, Any]:
+    if not isinstance(body, dict):
+        raise ValueError("Request body must be a JSON object")
+    return body
+
+
+class BakeryApi:
+    """
+    One warm DataManager and Reports behind an event loop thread
+
+    The storage keeps its indexes in memory between requests, so after the
+    first request nothing is re-read unless the files change. Calls go
+    through an AsyncService, so reports run side by side, writes run alone
+    and identical concurrent reads are served once.
+    """
+
+    def __init__(self, data_manager: DataManager, reports: Reports, max_workers: int = 4):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="bakery-api", daemon=True)
+        self._thread.start()
+
+        self.service = AsyncService(max_workers)
+        self.data = AsyncDataManager(data_manager, self.service)
+        self.reports = AsyncReports(reports, self.service)
+
+    def run(self, coro: Awaitable) -> Any:
+        """Run a coroutine on the API's loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    async def warm(self) -> Tuple[bool, str]:
+        """Load employees, schedules, wage rates and payroll totals ahead of the first request"""
+        for result in await asyncio.gather(
+            self.data.get_all_employees(), self.data.get_sorted_employees(),
+            self.data.get_schedules(), self.data.get_rate_table()
+        ):
+            if not result[0]:
+                return False, result[-1]
+        # Totals are rebuilt here rather than by the first wage report if they're stale
+        success, _, error = await self.service.read(self.data.target, 'get_payroll_totals')
+        return success, error
+
+    async def dispatch(self, method: str, target: str, body: Any) -> Tuple[int, Dict[str, Any]]:
+        """
+        Route one request and turn its result into a status and JSON body
+
+        Returns:
+            Tuple[int, Dict[str, Any]]: (HTTP status, {"ok", "data" or "message", "error"})
+        """
+        url = urlsplit(target)
+        path = url.path.rstrip('/') or '/'
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+
+        allowed = []
+        for route_method, pattern, handler in ROUTES:
+            match = pattern.match(path)
+            if match is None:
+                continue
+            if route_method != method:
+                allowed.append(route_method)
+                continue
+            params = {name: unquote(value) for name, value in match.groupdict().items()}
+            try:
+                result = await handler(self, params, query, body)
+            except ValueError as e:
+                return 400, {'ok': False, 'error': str(e)}
+            except Exception as e:
+                return 500, {'ok': False, 'error': f"Internal error: {str(e)}"}
+            return self._response(result)
+
+        if allowed:
+            return 405, {'ok': False, 'error': f"Method {method} not allowed; use {', '.join(allowed)}"}
+        return 404, {'ok': False, 'error': f"No such endpoint: {path}"}
+
+    @staticmethod
+    def _response(result: Tuple) -> Tuple[int, Dict[str, Any]]:
+        """Map a (success, [data,] message) result onto HTTP"""
+        success, message = result[0], result[-1]
+        if not success:
+            status = 404 if 'not found' in message.lower() else 400
+            return status, {'ok': False, 'error': message}
+        if len(result) > 2:
+            return 200, {'ok': True, 'data': result[1]}
+        return 200, {'ok': True, 'message': message}
+
+    def close(self) -> None:
+        self.run(self.service.close())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+# Service
+@route('GET', '/health')
+async def health(api: BakeryApi, params, query, body) -> Tuple:
+    return True, {'status': 'ok'}, ""
+
+
+@route('POST', '/batch')
+async def batch(api: BakeryApi, params, query, body) -> Tuple:
+    """Run several requests in order in one round trip: {"requests": [{"method", "path", "body"}]}"""
+    requests = _body_dict(body).get('requests')
+    if not isinstance(requests, list):
+        raise ValueError("requests must be a list")
+    if len(requests) > MAX_BATCH:
+        raise ValueError(f"At most {MAX_BATCH} requests per batch")
+
+    responses = []
+    for request in requests:
+        if not isinstance(request, dict) or 'path' not in request:
+            responses.append({'status': 400, 'body': {'ok': False, 'error': "Each request needs a path"}})
+            continue
+        method, path = str(request.get('method', 'GET')).upper(), str(request['path'])
+        if path.split('?')[0].rstrip('/') == '/batch':
+            responses.append({'status': 400, 'body': {'ok': False, 'error': "Batches can't be nested"}})
+            continue
+        status, payload = await api.dispatch(method, path, request.get('body'))
+        responses.append({'status': status, 'body': payload})
+    return True, responses, ""
+
+
+# Employees
+@route('GET', '/employees')
+async def list_employees(api: BakeryApi, params, query, body) -> Tuple:
+    return await api.data.get_sorted_employees(
+        query.get('order', 'lname'), _int_param(query, 'offset', 0), _int_param(query, 'limit')
+    )
+
+
+@route('POST', '/employees')
+async def add_employee(api: BakeryApi, params, query, body) -> Tuple:
+    body = _body_dict(body)
+    return await api.data.add_employee(
+        body.get('fname', ''), body.get('lname', ''), body.get('job', ''), body.get('start_date', '')
+    )
+
+
+@route('GET', '/employees/{employee_id}')
+async def get_employee(api: BakeryApi, params, query, body) -> Tuple:
+    return await api.data.get_employee(params['employee_id'])
+
+
+@route('PATCH', '/employees/{employee_id}')
+async def update_employee(api: BakeryApi, params, query, body) -> Tuple:
+    body = _body_dict(body)
+    return await api.data.update_employee(
+        params['employee_id'], body.get('fname'), body.get('lname'), body.get('job')
+    )
+
+
+@route('DELETE', '/employees/{employee_id}')
+async def delete_employee(api: BakeryApi, params, query, body) -> Tuple:
+    return await api.data.delete_employee(params['employee_id'])
+
+
+@route('GET', '/employees/{employee_id}/schedule')
+async def employee_schedule(api: BakeryApi, params, query, body) -> Tuple:
+    return await api.reports.generate_employee_schedule(
+        params['employee_id'], query.get('start_date', ''), query.get('end_date', '')
+    )
+
+
+# Schedules
+@route('GET', '/schedules')
+async def list_schedules(api: BakeryApi, params, query, body) -> Tuple:
+    return await api.data.get_schedules(
+        query.get('employee_id') or None, query.get('start_date') or None, query.get('end_date') or None
+    )
+
+
+@route('POST', '/schedules')
+async def save_schedule(api: BakeryApi, params, query, body) -> Tuple:
+    return await api.data.save_schedule(dict(_body_dict(body)))
+
+
+@route('PUT', '/schedules/{schedule_id}')
+async def update_schedule(api: BakeryApi, params, query, body) -> Tuple:
+    return await api.data.update_schedule(params['schedule_id'], dict(_body_dict(body)))
+
+
+@route('DELETE', '/schedules/{schedule_id}')
+async def delete_schedule(api: BakeryApi, params, query, body) -> Tuple:
+    return await api.data.delete_schedule(params['schedule_id'])
+
+
+# Wage rates
+@route('GET', '/wage-rates')
+async def list_wage_rates(api: BakeryApi, params, query, body) -> Tuple:
+    return await api.data.get_wage_rates()
+
+
+@route('POST', '/wage-rates')
+async def add_wage_rate(api: BakeryApi, params, query, body) -> Tuple:
+    body = _body_dict(body)
+    return await api.data.add_wage_rate(
+        body.get('position', ''), _float_field(body, 'base_rate'), _float_field(body, 'weekend_rate')
+    )
+
+
+@route('PUT', '/wage-rates/{position}')
+async def update_wage_rate(api: BakeryApi, params, query, body) -> Tuple:
+    body = _body_dict(body)
+    return await api.data.update_wage_rate(
+        params['position'], _float_field(body, 'base_rate'), _float_field(body, 'weekend_rate'),
+        body.get('effective_date') or None
+    )
+
+
+# Reports
+@route('GET', '/reports/wages')
+async def wage_report(api: BakeryApi, params, query, body) -> Tuple:
+    return await api.reports.generate_wage_report(query.get('start_date', ''), query.get('end_date', ''))
+
+
+@route('GET', '/reports/staff')
+async def staff_list(api: BakeryApi, params, query, body) -> Tuple:
+    return await api.reports.create_staff_list(query.get('sort_by', 'lname'))
+
+
+@route('GET', '/reports/employees')
+async def employee_report(api: BakeryApi, params, query, body) -> Tuple:
+    return await api.reports.generate_employee_report(query.get('sort_by', 'name'))
+
+
+def _json_default(value: Any) -> Any:
+    """Employees and schedules are mappings; anything else iterable becomes a list"""
+    if isinstance(value, Mapping):
+        return dict(value)
+    try:
+        return list(value)
+    except TypeError:
+        raise TypeError(f"Can't convert {type(value).__name__} to JSON") from None
+
+
+class BakeryRequestHandler(BaseHTTPRequestHandler):
+    """JSON over HTTP/1.1, with the connection kept open between requests"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "BakeryServer/1.0"
+    # Headers and body go out as separate writes; without this, kept-alive
+    # connections stall ~40ms per response on delayed ACKs
+    disable_nagle_algorithm = True
+
+    def _handle(self) -> None:
+        body = None
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            if length < 0:
+                raise ValueError(length)
+        except ValueError:
+            # Without a length there's no telling where the next request starts
+            self._send(400, {'ok': False, 'error': "Content-Length must be a whole number of bytes"})
+            self.close_connection = True
+            return
+        if length > MAX_BODY:
+            self._send(413, {'ok': False, 'error': f"Request body over {MAX_BODY} bytes"})
+            self.close_connection = True
+            return
+        if length:
+            try:
+                body = json.loads(self.rfile.read(length))
+            except ValueError:
+                self._send(400, {'ok': False, 'error': "Request body isn't valid JSON"})
+                return
+
+        status, payload = self.server.api.run(self.server.api.dispatch(self.command, self.path, body))
+        self._send(status, payload)
+
+    def _send(self, status: int, payload: Dict[str, Any]) -> None:
+        data = json.dumps(payload, default=_json_default).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+    def log_message(self, format: str, *args) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class BakeryServer(ThreadingHTTPServer):
+    """HTTP server for a BakeryApi, listening on a loopback address only"""
+
+    daemon_threads = True
+
+    def __init__(self, api: BakeryApi, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, verbose: bool = False):
+        address = ipaddress.ip_address(socket.gethostbyname(host))
+        if not address.is_loopback:
+            raise ValueError(f"Refusing to listen on {host}: the server is for this machine only")
+        self.api = api
+        self.verbose = verbose
+        super().__init__((str(address), port), BakeryRequestHandler)
+
+
+def serve(data_folder: str = "data", backend: str = "csv", host: str = DEFAULT_HOST,
+          port: int = DEFAULT_PORT, workers: int = 4, verbose: bool = False) -> Tuple[bool, str]:
+    """
+    Serve the data folder over HTTP until interrupted
+
+    Returns:
+        Tuple[bool, str]: (Success status, Error message)
+    """
+    try:
+        data_manager = DataManager(data_folder, backend)
+        success, error = data_manager.setup_data_folder()
+        if not success:
+            return False, error
+        success, error = data_manager.check_data_layout()
+        if not success:
+            return False, error
+        reports = Reports(data_manager)
+        reports.reports_folder = data_manager.reports_folder
+
+        api = BakeryApi(data_manager, reports, workers)
+        try:
+            success, error = api.run(api.warm())
+            if not success:
+                return False, error
+            with BakeryServer(api, host, port, verbose) as server:
+                print(f"Serving {data_folder} on http://{server.server_address[0]}:{server.server_address[1]} (Ctrl+C to stop)")
+                try:
+                    server.serve_forever()
+                except KeyboardInterrupt:
+                    pass
+        finally:
+            api.close()
+            data_manager.storage.close()
+        return True, ""
+    except Exception as e:
+        return False, f"Server failed: {str(e)}"
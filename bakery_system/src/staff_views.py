@@ -0,0 +1,84 @@
+from bisect import bisect_left, insort
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from employee import Employee
+
+# Sort keys for the staff listings: by last name, by "Last, First" and by position
+STAFF_ORDERS: Dict[str, Callable[[Employee], str]] = {
+    'lname': lambda emp: emp.lname.lower(),
+    'name': lambda emp: f"{emp.lname}, {emp.fname}".lower(),
+    'job': lambda emp: emp.job.lower(),
+}
+
+
+class StaffViews:
+    """
+    Staff IDs kept sorted by each of STAFF_ORDERS
+
+    Entries are (key, sequence, staff_id) tuples, where the sequence is the
+    employee's position in storage order, so ties come out in the same order
+    a stable sort of the employee list would give. Adds, updates and deletes
+    move single entries with bisect instead of re-sorting.
+    """
+
+    def __init__(self, employees: Iterable[Employee]):
+        # Each employee's record and sequence number, in storage order
+        self._employees: Dict[str, Tuple[Employee, int]] = {}
+        for employee in employees:
+            self._employees.setdefault(employee.staff_id, (employee, len(self._employees)))
+        self._next_sequence = len(self._employees)
+
+        self._orders: Dict[str, List[Tuple[str, int, str]]] = {}
+        for order, key in STAFF_ORDERS.items():
+            entries = [(key(emp), sequence, emp.staff_id) for emp, sequence in self._employees.values()]
+            entries.sort()
+            self._orders[order] = entries
+
+    def __len__(self) -> int:
+        return len(self._employees)
+
+    def _insert(self, employee: Employee, sequence: int) -> None:
+        for order, key in STAFF_ORDERS.items():
+            insort(self._orders[order], (key(employee), sequence, employee.staff_id))
+
+    def _discard(self, employee: Employee, sequence: int) -> None:
+        for order, key in STAFF_ORDERS.items():
+            entries = self._orders[order]
+            del entries[bisect_left(entries, (key(employee), sequence, employee.staff_id))]
+
+    def add(self, employee: Employee) -> None:
+        """Add an employee at the end of storage order, or update them if already present"""
+        if employee.staff_id in self._employees:
+            self.update(employee)
+            return
+        sequence = self._next_sequence
+        self._next_sequence += 1
+        self._employees[employee.staff_id] = (employee, sequence)
+        self._insert(employee, sequence)
+
+    def update(self, employee: Employee) -> None:
+        """Re-sort an employee whose details changed, keeping their place in storage order"""
+        old, sequence = self._employees[employee.staff_id]
+        self._discard(old, sequence)
+        self._employees[employee.staff_id] = (employee, sequence)
+        self._insert(employee, sequence)
+
+    def remove(self, staff_id: str) -> None:
+        """Drop an employee from every ordering"""
+        old, sequence = self._employees.pop(staff_id)
+        self._discard(old, sequence)
+
+    def ordered(self, order: str, offset: int = 0, limit: Optional[int] = None) -> List[str]:
+        """
+        Return staff IDs in the given order
+
+        Args:
+            order (str): One of STAFF_ORDERS ("lname", "name" or "job")
+            offset (int): Number of employees to skip
+            limit (Optional[int]): Most employees to return (default: all)
+
+        Returns:
+            List[str]: Staff IDs for the requested slice
+        """
+        entries = self._orders[order]
+        end = len(entries) if limit is None else offset + limit
+        return [staff_id for _, _, staff_id in entries[offset:end]]
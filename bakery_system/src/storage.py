@@ -0,0 +1,1269 @@
+from pathlib import Path
+from contextlib import contextmanager, nullcontext
+import os
+import io
+import json
+import csv
+import functools
+import sqlite3
+import threading
+import uuid
+from typing import IO, Tuple, List, Dict, Any, Callable, ContextManager, Iterator, Optional, Sequence, TextIO
+from employee import Employee, EMPLOYEE_FIELDS, REQUIRED_EMPLOYEE_FIELDS
+from schedule import Schedule, SCHEDULE_FIELDS, REQUIRED_SCHEDULE_FIELDS, LEGACY_SCHEDULE_COLUMNS
+from schedule_index import ScheduleIndex, schedule_filter
+from schedule_scanner import ScheduleScanner
+from dates import date_ordinal
+from staff_views import StaffViews, STAFF_ORDERS
+from wage_data import WageManager
+from file_lock import FileLock
+
+DEFAULT_WAGE_RATES = {
+    "Head Baker": {"base_rate": 18.50, "weekend_rate": 22.00},
+    "Baker": {"base_rate": 16.00, "weekend_rate": 19.00},
+    "Pastry Chef": {"base_rate": 16.50, "weekend_rate": 19.50},
+    "Counter Staff": {"base_rate": 14.00, "weekend_rate": 16.50},
+    "Kitchen Assistant": {"base_rate": 13.50, "weekend_rate": 16.00}
+}
+
+
+@contextmanager
+def atomic_write(path: Path, mode: str = 'w', **open_kwargs) -> Iterator[IO]:
+    """Write to a temp file beside path and rename it over path once complete ('wb' mode for binary)"""
+    # Named per process and thread, so concurrent writers never share a temp file
+    temp_file = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with temp_file.open(mode, **open_kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, path)
+    except BaseException:
+        if temp_file.exists():
+            temp_file.unlink()
+        raise
+
+
+def read_records(f: TextIO, fields: Sequence[str], from_values: Callable[[List[Any]], Any],
+                 required: Sequence[str] = (), aliases: Optional[Dict[str, str]] = None,
+                 hints: Optional[Dict[str, str]] = None) -> Iterator[Any]:
+    """
+    Build records straight from CSV rows, without a dict per row
+
+    Columns are matched to fields by the header, after renaming any column
+    listed in aliases, so files with extra or missing optional columns still
+    load and missing values come through as None. A required field is never
+    filled in that way: a file without its column, or a row without a value
+    for it, raises ValueError rather than yield a record that would be
+    written back without it. Any advice in hints for a missing column's
+    field is added to that error.
+    """
+    name = getattr(f, 'name', 'file')
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is None:
+        return
+    if aliases:
+        header = [aliases.get(column, column) for column in header]
+
+    columns = [header.index(field) if field in header else None for field in fields]
+    for field in required:
+        if columns[fields.index(field)] is None:
+            hint = (hints or {}).get(field)
+            raise ValueError(f"{name} has no {field} column" + (f"; {hint}" if hint else ""))
+    checked = [(fields.index(field), field) for field in required]
+
+    def missing(values: Sequence[Any]) -> None:
+        for i, field in checked:
+            if not values[i]:
+                raise ValueError(f"Row {reader.line_num} of {name} has no {field}")
+
+    if columns == list(range(len(fields))):
+        # The usual layout: take each row as it is
+        for row in reader:
+            if len(row) != len(fields):
+                if not row:
+                    continue
+                row = (row + [None] * len(fields))[:len(fields)]
+            if checked:
+                missing(row)
+            yield from_values(row)
+        return
+
+    for row in reader:
+        if row:
+            values = [row[i] if i is not None and i < len(row) else None for i in columns]
+            if checked:
+                missing(values)
+            yield from_values(values)
+
+
+# Schedules files from before schedule IDs can be brought up to date, but only on request
+UPGRADE_HINT = "run 'python main.py migrate-dates' to upgrade it"
+
+
+def read_schedules(f: TextIO) -> Iterator[Schedule]:
+    """Read schedules from a schedules file, including files with the legacy column names"""
+    return read_records(f, SCHEDULE_FIELDS, Schedule.from_values, REQUIRED_SCHEDULE_FIELDS, LEGACY_SCHEDULE_COLUMNS,
+                        {'schedule_id': UPGRADE_HINT})
+
+
+class _BoundedReader(io.RawIOBase):
+    """Reads at most limit bytes from a binary file, as if the file ended there"""
+
+    def __init__(self, raw: io.BufferedReader, limit: int):
+        self._raw = raw
+        self._remaining = limit
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._remaining <= 0:
+            return 0
+        view = memoryview(buffer)[:self._remaining]
+        count = self._raw.readinto(view) or 0
+        self._remaining -= count
+        return count
+
+    def close(self) -> None:
+        self._raw.close()
+        super().close()
+
+
+def open_snapshot(path: Path, **text_kwargs) -> TextIO:
+    """
+    Open a file for reading only the bytes it holds now
+
+    Rows appended after the call aren't seen, so a reader never meets a
+    half-written last row, and a file replaced by rename keeps reading the
+    old contents. Call it while holding the lock writers take.
+    """
+    raw = path.open('rb')
+    size = os.fstat(raw.fileno()).st_size
+    return io.TextIOWrapper(io.BufferedReader(_BoundedReader(raw, size)), **text_kwargs)
+
+
+def _shared(method: Callable) -> Callable:
+    """Run a CsvStorage method holding the data folder lock alongside other readers"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock.shared():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _exclusive(method: Callable) -> Callable:
+    """Run a CsvStorage method holding the data folder lock alone"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock.exclusive():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class StorageBackend:
+    """
+    Persistence interface used by DataManager
+
+    Rows come back as Employee and Schedule records, which read like dicts
+    keyed by EMPLOYEE_FIELDS or SCHEDULE_FIELDS; plain dicts with those keys
+    are accepted wherever rows are written. Wage rates are a
+    {position: {'base_rate', 'weekend_rate'}} dict. Methods raise on
+    failure; DataManager turns errors into (success, message) results.
+    """
+
+    # Lock on the data folder shared by every process using it, if the backend has one
+    lock: Optional[FileLock] = None
+
+    def setup(self) -> None:
+        """Create the underlying files or tables if they don't exist"""
+        raise NotImplementedError
+
+    def shared(self) -> ContextManager[None]:
+        """Keep writers in other processes out across several reads"""
+        return self.lock.shared() if self.lock is not None else nullcontext()
+
+    def exclusive(self) -> ContextManager[None]:
+        """Keep other processes out across a read-modify-write spanning several calls"""
+        return self.lock.exclusive() if self.lock is not None else nullcontext()
+
+    def close(self) -> None:
+        """Release any open handles"""
+
+    # Wage rates
+    def load_wage_rates(self) -> Optional[Dict[str, Dict[str, float]]]:
+        """Return all wage rates, or None if none have been stored"""
+        raise NotImplementedError
+
+    def save_wage_rates(self, rates: Dict[str, Dict[str, float]]) -> None:
+        """Replace all wage rates"""
+        raise NotImplementedError
+
+    def load_rate_table(self) -> Dict[str, Dict[str, float]]:
+        """Return wage rates keyed by case-folded position (shared, don't modify)"""
+        return WageManager.build_rate_table(self.load_wage_rates() or {})
+
+    # Employees
+    def get_employee(self, staff_id: str) -> Optional[Employee]:
+        """Return one employee row, or None if not found"""
+        raise NotImplementedError
+
+    def get_all_employees(self) -> List[Employee]:
+        """Return every employee row in storage order"""
+        raise NotImplementedError
+
+    def add_employee(self, employee: Dict[str, str]) -> None:
+        """Store a new employee row"""
+        raise NotImplementedError
+
+    def add_employees(self, employees: List[Dict[str, str]]) -> None:
+        """Store several new employee rows"""
+        for employee in employees:
+            self.add_employee(employee)
+
+    def save_employees(self, employees: List[Dict[str, str]]) -> None:
+        """Replace all employee rows"""
+        raise NotImplementedError
+
+    def update_employee(self, employee: Dict[str, str]) -> bool:
+        """Replace the row with this employee's staff_id, returning False if there isn't one"""
+        employees = self.get_all_employees()
+        for i, emp in enumerate(employees):
+            if emp.staff_id == employee['staff_id']:
+                employees[i] = Employee.from_dict(employee)
+                self.save_employees(employees)
+                return True
+        return False
+
+    def delete_employee(self, staff_id: str) -> bool:
+        """Delete an employee, returning False if they didn't exist"""
+        employees = self.get_all_employees()
+        remaining = [emp for emp in employees if emp.staff_id != staff_id]
+        if len(remaining) == len(employees):
+            return False
+        self.save_employees(remaining)
+        return True
+
+    def get_sorted_employees(self, order: str, offset: int = 0, limit: Optional[int] = None) -> List[Employee]:
+        """
+        Return employees sorted by one of STAFF_ORDERS ("lname", "name" or "job"),
+        ties in storage order, optionally a single page of them
+        """
+        employees = sorted(self.get_all_employees(), key=STAFF_ORDERS[order])
+        end = len(employees) if limit is None else offset + limit
+        return employees[offset:end]
+
+    # Schedules
+    def query_schedules(self, employee_id: str = None, start: Optional[int] = None, end: Optional[int] = None) -> List[Schedule]:
+        """Return schedules filtered by employee and inclusive week_start day ordinals"""
+        raise NotImplementedError
+
+    def iter_schedules(self, employee_id: str = None, start: Optional[int] = None, end: Optional[int] = None) -> Iterator[Schedule]:
+        """Yield the same schedules as query_schedules, holding as few in memory as the backend allows"""
+        yield from self.query_schedules(employee_id, start, end)
+
+    def has_schedule(self, schedule_id: str) -> bool:
+        """Check whether a schedule with this ID exists"""
+        raise NotImplementedError
+
+    def get_schedule_rows(self, schedule_id: str) -> List[Schedule]:
+        """Return every row with this schedule_id (normally one)"""
+        return [row for row in self.iter_schedules() if row.schedule_id == schedule_id]
+
+    def schedules_stamp(self) -> Optional[List[Any]]:
+        """
+        Return a JSON-serialisable token that changes whenever the schedules do,
+        or None if the backend can't tell
+        """
+        return None
+
+    def add_schedule(self, schedule: Dict[str, Any]) -> None:
+        """Store a new schedule row"""
+        raise NotImplementedError
+
+    def add_schedules(self, schedules: List[Dict[str, Any]]) -> None:
+        """Store several new schedule rows"""
+        for schedule in schedules:
+            self.add_schedule(schedule)
+
+    def replace_schedule(self, schedule: Dict[str, Any]) -> None:
+        """Replace every schedule sharing this row's schedule_id with the row"""
+        raise NotImplementedError
+
+    def replace_schedules(self, schedules: List[Dict[str, Any]]) -> None:
+        """Replace several schedules (with distinct schedule_ids) in one write"""
+        for schedule in schedules:
+            self.replace_schedule(schedule)
+
+    def delete_schedule(self, schedule_id: str) -> bool:
+        """Delete a schedule, returning False if it didn't exist"""
+        raise NotImplementedError
+
+    def load_schedules(self) -> List[Schedule]:
+        """Return every schedule row in storage order"""
+        raise NotImplementedError
+
+    def save_schedules(self, schedules: List[Dict[str, Any]]) -> None:
+        """Replace all schedule rows"""
+        raise NotImplementedError
+
+    def compact_schedules(self) -> int:
+        """Reclaim space left by deletes and updates, returning the number of changes folded in"""
+        return 0
+
+    def schedules_need_upgrade(self) -> bool:
+        """Whether the schedules are stored in an older layout that upgrade_schedules() would rewrite"""
+        return False
+
+    def upgrade_schedules(self) -> int:
+        """Rewrite schedules stored in an older layout in the current one, returning the rows rewritten"""
+        return 0
+
+    def apply_changes(self, wage_rates: Optional[Dict[str, Dict[str, float]]] = None,
+                      employees: Optional[List[Dict[str, str]]] = None,
+                      schedules: Optional[List[Dict[str, Any]]] = None,
+                      new_schedules: Optional[List[Dict[str, Any]]] = None) -> None:
+        """
+        Write the results of a transaction, touching each dataset at most once
+
+        Args:
+            wage_rates: Replacement wage rates, or None to leave them alone
+            employees: Replacement employee rows, or None to leave them alone
+            schedules: Replacement schedule rows, or None to leave them alone
+            new_schedules: Rows to append when the schedules aren't being replaced
+        """
+        if wage_rates is not None:
+            self.save_wage_rates(wage_rates)
+        if employees is not None:
+            self.save_employees(employees)
+        if schedules is not None:
+            self.save_schedules(schedules)
+        elif new_schedules:
+            self.add_schedules(new_schedules)
+
+
+class CsvStorage(StorageBackend):
+    """Employees and schedules in CSV files, wage rates in JSON"""
+
+    def __init__(self, data_folder: Path):
+        self.data_folder = Path(data_folder)
+        self.pay_rates_file = self.data_folder / "wage_rates.json"
+        self.schedules_file = self.data_folder / "schedules.csv"
+        self.schedule_log_file = self.data_folder / "schedules_log.csv"
+        self.staff_file = self.data_folder / "employees.csv"
+        self.schedule_log_fields = ['op'] + SCHEDULE_FIELDS
+        # Tombstones only carry the schedule_id
+        self.schedule_log_required = ['op', 'schedule_id']
+
+        # Readers share this lock and writers hold it alone, across processes
+        self.lock = FileLock(self.data_folder / "data.lock")
+
+        # Compact once the change log holds this many records (or a quarter of the schedules)
+        self.schedule_log_limit = 1000
+
+        # Filtered reads of a schedules file this big scan it rather than load the whole index
+        self.schedule_scan_bytes = 32 * 1024 * 1024
+
+        # Parsed wage rates and their case-folded table, invalidated by file mtime/size
+        self._wage_rates: Optional[Dict[str, Dict[str, float]]] = None
+        self._rate_table: Dict[str, Dict[str, float]] = {}
+        self._wage_rates_stamp: Optional[Tuple[int, int]] = None
+        self._wage_rates_loaded = False
+
+        # In-memory employee index keyed by staff_id, invalidated the same way
+        self._employee_index: Optional[Dict[str, Employee]] = None
+        self._employee_index_stamp: Optional[Tuple[int, int]] = None
+
+        # Sorted staff orderings over the employee index, kept current on writes
+        self._staff_views: Optional[StaffViews] = None
+        self._staff_views_index: Optional[Dict[str, Employee]] = None
+
+        # Sorted week_start index over schedules and their change log, invalidated the same way
+        self._schedule_index: Optional[ScheduleIndex] = None
+        self._schedule_index_stamp: Optional[Tuple[Optional[Tuple[int, int]], ...]] = None
+
+    @_exclusive
+    def setup(self) -> None:
+        """Create any missing data files"""
+        if not self.pay_rates_file.exists():
+            self._create_pay_rates()
+        if not self.schedules_file.exists():
+            self._create_schedules_file()
+        if not self.staff_file.exists():
+            self._create_staff_file()
+
+    def _create_staff_file(self) -> None:
+        """Create initial staff CSV file with headers"""
+        with self.staff_file.open('w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(EMPLOYEE_FIELDS)
+
+    def _create_pay_rates(self) -> None:
+        """Create initial wage rates file"""
+        with self.pay_rates_file.open('w') as f:
+            json.dump(DEFAULT_WAGE_RATES, f, indent=4)
+
+    def _create_schedules_file(self) -> None:
+        """Create initial schedules CSV file with headers"""
+        with self.schedules_file.open('w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(SCHEDULE_FIELDS)
+
+    @staticmethod
+    def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) for a file, or None if it doesn't exist"""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    # Wage rates
+    def _get_wage_rates(self) -> Optional[Dict[str, Dict[str, float]]]:
+        """Return the cached wage rates, reloading them if the file changed on disk"""
+        stamp = self._file_stamp(self.pay_rates_file)
+        if self._wage_rates_loaded and stamp == self._wage_rates_stamp:
+            return self._wage_rates
+
+        rates = None
+        if stamp is not None:
+            with self.pay_rates_file.open('r') as f:
+                rates = json.load(f)
+        self._set_wage_rates(rates, stamp)
+        return rates
+
+    def _set_wage_rates(self, rates: Optional[Dict[str, Dict[str, float]]], stamp: Optional[Tuple[int, int]]) -> None:
+        """Cache wage rates along with their case-folded table"""
+        self._wage_rates = rates
+        self._rate_table = WageManager.build_rate_table(rates or {})
+        self._wage_rates_stamp = stamp
+        self._wage_rates_loaded = True
+
+    @_shared
+    def load_wage_rates(self) -> Optional[Dict[str, Dict[str, float]]]:
+        rates = self._get_wage_rates()
+        if rates is None:
+            return None
+        # Hand out a copy so callers can't modify the cache
+        return {position: dict(info) for position, info in rates.items()}
+
+    @_shared
+    def load_rate_table(self) -> Dict[str, Dict[str, float]]:
+        self._get_wage_rates()
+        return self._rate_table
+
+    @_exclusive
+    def save_wage_rates(self, rates: Dict[str, Dict[str, float]]) -> None:
+        with atomic_write(self.pay_rates_file) as f:
+            json.dump(rates, f, indent=4)
+        # Refresh the cache from what was written rather than re-reading it
+        self._set_wage_rates({position: dict(info) for position, info in rates.items()},
+                             self._file_stamp(self.pay_rates_file))
+
+    # Employees
+    def _get_employee_index(self) -> Dict[str, Employee]:
+        """Return the employee index, reloading it if the staff file changed on disk"""
+        stamp = self._file_stamp(self.staff_file)
+        if self._employee_index is not None and stamp == self._employee_index_stamp:
+            return self._employee_index
+
+        index = {}
+        if stamp is not None:
+            with self.staff_file.open(mode='r', newline='', encoding='utf-8-sig') as file:
+                for employee in read_records(file, EMPLOYEE_FIELDS, Employee.from_values, REQUIRED_EMPLOYEE_FIELDS):
+                    index.setdefault(employee.staff_id, employee)
+
+        self._employee_index = index
+        self._employee_index_stamp = stamp
+        return index
+
+    def _refresh_employee_index(self, index: Optional[Dict[str, Employee]]) -> None:
+        """Store an index that matches what was just written to the staff file"""
+        self._employee_index = index
+        self._employee_index_stamp = self._file_stamp(self.staff_file) if index is not None else None
+
+    @_shared
+    def get_employee(self, staff_id: str) -> Optional[Employee]:
+        employee = self._get_employee_index().get(staff_id)
+        # Hand out a copy so callers can't modify the cached row
+        return employee.copy() if employee is not None else None
+
+    @_shared
+    def get_all_employees(self) -> List[Employee]:
+        return [employee.copy() for employee in self._get_employee_index().values()]
+
+    def add_employee(self, employee: Dict[str, str]) -> None:
+        self.add_employees([employee])
+
+    def _current_staff_views(self, index: Dict[str, Employee]) -> Optional[StaffViews]:
+        """Return the staff views if they were built over this index, else None"""
+        return self._staff_views if self._staff_views_index is index else None
+
+    @_exclusive
+    def add_employees(self, employees: List[Dict[str, str]]) -> None:
+        # Make sure the index reflects the file before appending to it
+        index = self._get_employee_index()
+        views = self._current_staff_views(index)
+        records = [Employee.from_dict(employee) for employee in employees]
+
+        with self.staff_file.open('a', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerows(employee.to_values() for employee in records)
+
+        for employee in records:
+            index[employee.staff_id] = employee
+            if views is not None:
+                views.add(employee)
+        self._refresh_employee_index(index)
+
+    def _write_employee_index(self, index: Dict[str, Employee]) -> None:
+        """Rewrite the staff file from the index"""
+        try:
+            with atomic_write(self.staff_file, newline='', encoding='utf-8-sig') as f:
+                writer = csv.writer(f)
+                writer.writerow(EMPLOYEE_FIELDS)
+                writer.writerows(emp.to_values() for emp in index.values())
+        except BaseException:
+            # The index may already hold the change; reload it from the file next time
+            self._refresh_employee_index(None)
+            raise
+        self._refresh_employee_index(index)
+
+    @_exclusive
+    def save_employees(self, employees: List[Dict[str, str]]) -> None:
+        index = {}
+        for emp in employees:
+            emp = Employee.from_dict(emp)
+            index.setdefault(emp.staff_id, emp)
+        self._write_employee_index(index)
+
+    @_exclusive
+    def update_employee(self, employee: Dict[str, str]) -> bool:
+        index = self._get_employee_index()
+        record = Employee.from_dict(employee)
+        if record.staff_id not in index:
+            return False
+
+        views = self._current_staff_views(index)
+        # Assigning to an existing key keeps the employee's place in the file
+        index[record.staff_id] = record
+        self._write_employee_index(index)
+        if views is not None:
+            views.update(record)
+        return True
+
+    @_exclusive
+    def delete_employee(self, staff_id: str) -> bool:
+        index = self._get_employee_index()
+        if staff_id not in index:
+            return False
+
+        views = self._current_staff_views(index)
+        del index[staff_id]
+        self._write_employee_index(index)
+        if views is not None:
+            views.remove(staff_id)
+        return True
+
+    @_shared
+    def get_sorted_employees(self, order: str, offset: int = 0, limit: Optional[int] = None) -> List[Employee]:
+        index = self._get_employee_index()
+        views = self._current_staff_views(index)
+        if views is None:
+            views = self._staff_views = StaffViews(index.values())
+            self._staff_views_index = index
+        return [index[staff_id].copy() for staff_id in views.ordered(order, offset, limit)]
+
+    # Schedules
+    def _schedules_stamp(self) -> Tuple[Optional[Tuple[int, int]], ...]:
+        """Return the change stamps of the schedules file and its change log"""
+        return self._file_stamp(self.schedules_file), self._file_stamp(self.schedule_log_file)
+
+    def _get_schedule_index(self) -> ScheduleIndex:
+        """Return the schedule index, reloading it if the schedules file or log changed on disk"""
+        stamp = self._schedules_stamp()
+        if self._schedule_index is not None and stamp == self._schedule_index_stamp:
+            return self._schedule_index
+
+        with self.schedules_file.open('r', newline='', encoding='utf-8-sig') as f:
+            index = ScheduleIndex(read_schedules(f))
+
+        # Merge pending deletes and replacements on top of the file
+        if self.schedule_log_file.exists():
+            with self.schedule_log_file.open('r', newline='', encoding='utf-8-sig') as f:
+                for op, row in read_records(f, self.schedule_log_fields, self._log_record, self.schedule_log_required):
+                    index.apply_log_record(op, row.schedule_id, row)
+
+        self._schedule_index = index
+        self._schedule_index_stamp = stamp
+        return index
+
+    @staticmethod
+    def _log_record(values: List[Any]) -> Tuple[str, Schedule]:
+        """Split a change log row into its op and schedule"""
+        return values[0], Schedule.from_values(values[1:])
+
+    def _append_schedule_log(self, op: str, rows: List[Schedule]) -> None:
+        """Append 'replace' or 'delete' records to the schedule change log and the index"""
+        index = self._get_schedule_index()
+        limit = max(self.schedule_log_limit, len(index) // 4)
+
+        if index.log_records + len(rows) >= limit:
+            # A rewrite is due anyway, so apply the batch in memory and rewrite once
+            for row in rows:
+                index.apply_log_record(op, row.schedule_id, row)
+            self.compact_schedules()
+            return
+
+        new_log = not self.schedule_log_file.exists()
+        with self.schedule_log_file.open('a', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            if new_log:
+                writer.writerow(self.schedule_log_fields)
+            for row in rows:
+                if op == 'delete':
+                    # Tombstones only need the schedule_id
+                    writer.writerow([op, row.schedule_id] + [''] * (len(SCHEDULE_FIELDS) - 1))
+                else:
+                    writer.writerow([op] + row.to_values())
+
+        for row in rows:
+            index.apply_log_record(op, row.schedule_id, row)
+        self._schedule_index_stamp = self._schedules_stamp()
+
+    def _schedule_index_current(self) -> bool:
+        return self._schedule_index is not None and self._schedules_stamp() == self._schedule_index_stamp
+
+    def _prefer_scan(self, employee_id: str = None, start: Optional[int] = None, end: Optional[int] = None) -> bool:
+        """Whether a filtered read should scan the file instead of loading the index for it"""
+        if not (employee_id or start is not None or end is not None) or self._schedule_index_current():
+            return False
+        stamp = self._file_stamp(self.schedules_file)
+        return stamp is not None and stamp[1] >= self.schedule_scan_bytes
+
+    @_shared
+    def query_schedules(self, employee_id: str = None, start: Optional[int] = None, end: Optional[int] = None) -> List[Schedule]:
+        if self._prefer_scan(employee_id, start, end):
+            return list(self.iter_schedules(employee_id, start, end))
+        index = self._get_schedule_index()
+        return [row.copy() for row in index.query(employee_id, start, end)]
+
+    def iter_schedules(self, employee_id: str = None, start: Optional[int] = None, end: Optional[int] = None) -> Iterator[Schedule]:
+        """
+        Yield matching schedules from the index if it's loaded, otherwise straight from the files
+
+        Filtered reads from the files go through ScheduleScanner, so only
+        matching rows are decoded. The lock is only held while the rows to read are pinned down, not
+        while the caller consumes them, so a slow consumer (such as a paged
+        listing) never holds up writers.
+        """
+        with self.lock.shared():
+            if self._schedule_index_current():
+                rows = self._schedule_index.query(employee_id, start, end)
+                schedules_file = scanner = None
+            else:
+                rows = None
+                if not self.schedules_file.exists():
+                    return
+
+                # The final state of every logged schedule; only these are held in memory.
+                # A later record for the same ID moves it to the end, as in the index.
+                logged: Dict[str, Optional[Schedule]] = {}
+                if self.schedule_log_file.exists():
+                    with self.schedule_log_file.open('r', newline='', encoding='utf-8-sig') as f:
+                        for op, row in read_records(f, self.schedule_log_fields, self._log_record, self.schedule_log_required):
+                            logged.pop(row.schedule_id, None)
+                            logged[row.schedule_id] = row if op == 'replace' else None
+
+                # Rows appended after this point belong to a later read
+                scanner = schedules_file = None
+                if employee_id or start is not None or end is not None:
+                    scanner = ScheduleScanner.open(self.schedules_file)
+                if scanner is None:
+                    schedules_file = open_snapshot(self.schedules_file, newline='', encoding='utf-8-sig')
+
+        if rows is not None:
+            for row in rows:
+                yield row.copy()
+            return
+
+        matches = schedule_filter(employee_id, start, end)
+        if scanner is not None:
+            with scanner:
+                yield from scanner.scan(employee_id, start, end, skip=logged)
+        else:
+            with schedules_file as f:
+                for row in read_schedules(f):
+                    if row.schedule_id not in logged and matches(row):
+                        yield row
+
+        for row in logged.values():
+            if row is not None and matches(row):
+                yield row
+
+    @_shared
+    def has_schedule(self, schedule_id: str) -> bool:
+        return schedule_id in self._get_schedule_index()
+
+    @_shared
+    def get_schedule_rows(self, schedule_id: str) -> List[Schedule]:
+        return [row.copy() for row in self._get_schedule_index().get(schedule_id)]
+
+    @_shared
+    def schedules_stamp(self) -> Optional[List[Any]]:
+        return [list(stamp) if stamp is not None else None for stamp in self._schedules_stamp()]
+
+    def add_schedule(self, schedule: Dict[str, Any]) -> None:
+        self.add_schedules([schedule])
+
+    @_exclusive
+    def add_schedules(self, schedules: List[Dict[str, Any]]) -> None:
+        # Make sure the index reflects the file before appending to it
+        index = self._get_schedule_index()
+
+        rows = [Schedule.from_dict(schedule) for schedule in schedules]
+
+        if index.log_records:
+            # Rows appended to the file would sort before the pending log records
+            self._append_schedule_log('replace', rows)
+            return
+
+        with self.schedules_file.open('a', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerows(row.to_values() for row in rows)
+
+        for row in rows:
+            index.add(row)
+        self._schedule_index_stamp = self._schedules_stamp()
+
+    def replace_schedule(self, schedule: Dict[str, Any]) -> None:
+        self.replace_schedules([schedule])
+
+    @_exclusive
+    def replace_schedules(self, schedules: List[Dict[str, Any]]) -> None:
+        if schedules:
+            self._append_schedule_log('replace', [Schedule.from_dict(schedule) for schedule in schedules])
+
+    @_exclusive
+    def delete_schedule(self, schedule_id: str) -> bool:
+        if not self.has_schedule(schedule_id):
+            return False
+        # Record a tombstone instead of rewriting the file
+        self._append_schedule_log('delete', [Schedule(schedule_id, None, None, {})])
+        return True
+
+    @_exclusive
+    def apply_changes(self, wage_rates: Optional[Dict[str, Dict[str, float]]] = None,
+                      employees: Optional[List[Dict[str, str]]] = None,
+                      schedules: Optional[List[Dict[str, Any]]] = None,
+                      new_schedules: Optional[List[Dict[str, Any]]] = None) -> None:
+        """Write a transaction under one lock, so other processes see all of it or none"""
+        super().apply_changes(wage_rates, employees, schedules, new_schedules)
+
+    @_shared
+    def load_schedules(self) -> List[Schedule]:
+        """Return every live schedule row"""
+        if not self.schedules_file.exists():
+            return []
+        return [row.copy() for row in self._get_schedule_index().live_rows()]
+
+    @_exclusive
+    def save_schedules(self, schedules: List[Dict[str, Any]]) -> None:
+        with atomic_write(self.schedules_file, newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(SCHEDULE_FIELDS)
+            writer.writerows(Schedule.from_dict(schedule).to_values() for schedule in schedules)
+        # The rewritten file already reflects any logged changes
+        if self.schedule_log_file.exists():
+            self.schedule_log_file.unlink()
+
+    @_shared
+    def schedules_need_upgrade(self) -> bool:
+        """Check the header of the schedules file, without reading any rows"""
+        if not self.schedules_file.exists():
+            return False
+        with self.schedules_file.open('r', newline='', encoding='utf-8-sig') as f:
+            header = next(csv.reader(f), None)
+        return header is not None and 'schedule_id' not in header
+
+    @_exclusive
+    def upgrade_schedules(self) -> int:
+        """
+        Rewrite a schedules file saved without a schedule_id column
+
+        Older files named their columns week_start_date, mon_hours and so
+        on, and had no schedule IDs. Their rows are numbered S001, S002, ...
+        in file order and written back under the current header, keeping
+        every other value as it was. Files that already have schedule IDs
+        are left alone.
+        """
+        if not self.schedules_need_upgrade():
+            return 0
+        with self.schedules_file.open('r', newline='', encoding='utf-8-sig') as f:
+            required = [field for field in REQUIRED_SCHEDULE_FIELDS if field != 'schedule_id']
+            rows = list(read_records(f, SCHEDULE_FIELDS, Schedule.from_values, required, LEGACY_SCHEDULE_COLUMNS))
+
+        for number, row in enumerate(rows, 1):
+            row.schedule_id = f"S{number:03d}"
+        self.save_schedules(rows)
+        return len(rows)
+
+    @_exclusive
+    def compact_schedules(self) -> int:
+        """Fold the change log into the schedules file"""
+        index = self._get_schedule_index()
+        if not index.log_records:
+            return 0
+
+        # Write the merged rows next to the file and swap them in
+        rows = index.live_rows()
+        with atomic_write(self.schedules_file, newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(SCHEDULE_FIELDS)
+            writer.writerows(row.to_values() for row in rows)
+        # A batch big enough to trigger the rewrite may never have reached the log
+        if self.schedule_log_file.exists():
+            self.schedule_log_file.unlink()
+
+        self._schedule_index = ScheduleIndex(rows)
+        self._schedule_index_stamp = self._schedules_stamp()
+        return index.log_records
+
+
+class SqliteStorage(StorageBackend):
+    """All data in a single SQLite database with indexed lookups"""
+
+    # Values are kept as TEXT so rows read back exactly as they do from the CSV files
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS employees (
+            staff_id TEXT PRIMARY KEY,
+            fname TEXT, lname TEXT, job TEXT, start TEXT
+        );
+        CREATE TABLE IF NOT EXISTS schedules (
+            row_id INTEGER PRIMARY KEY,
+            schedule_id TEXT, employee_id TEXT, week_start TEXT,
+            week_ordinal INTEGER,
+            mon TEXT, tue TEXT, wed TEXT, thu TEXT, fri TEXT, sat TEXT, sun TEXT,
+            total_hours TEXT, total_pay TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_schedules_schedule_id ON schedules (schedule_id);
+        CREATE INDEX IF NOT EXISTS idx_schedules_employee_week ON schedules (employee_id, week_ordinal);
+        CREATE INDEX IF NOT EXISTS idx_schedules_week ON schedules (week_ordinal);
+        CREATE TABLE IF NOT EXISTS wage_rates (
+            position TEXT PRIMARY KEY,
+            base_rate REAL, weekend_rate REAL
+        );
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value
+        );
+    """
+
+    def __init__(self, data_folder: Path, filename: str = "bakery.db"):
+        self.data_folder = Path(data_folder)
+        # SQLite locks its own reads and writes; this only spans DataManager's multi-step updates
+        self.lock = FileLock(self.data_folder / "data.lock")
+        self.db_file = self.data_folder / filename
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use and make sure the schema exists"""
+        if self._conn is None:
+            # Shared across threads for concurrent reads; writes are never run side by side
+            self._conn = sqlite3.connect(self.db_file, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            with self._conn:
+                self._conn.executescript(self.SCHEMA)
+                # A random ID tells a recreated database apart from the one it replaced
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO meta (key, value) VALUES ('database_id', ?), ('schedules_version', 0)",
+                    (uuid.uuid4().hex,)
+                )
+        return self._conn
+
+    def setup(self) -> None:
+        """Create the database and seed default wage rates"""
+        conn = self._connect()
+        if conn.execute("SELECT 1 FROM wage_rates LIMIT 1").fetchone() is None:
+            self.save_wage_rates(DEFAULT_WAGE_RATES)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # Wage rates
+    def load_wage_rates(self) -> Optional[Dict[str, Dict[str, float]]]:
+        rows = self._connect().execute(
+            "SELECT position, base_rate, weekend_rate FROM wage_rates ORDER BY rowid"
+        ).fetchall()
+        return {row['position']: {'base_rate': row['base_rate'], 'weekend_rate': row['weekend_rate']} for row in rows}
+
+    def save_wage_rates(self, rates: Dict[str, Dict[str, float]]) -> None:
+        conn = self._connect()
+        with conn:
+            self._write_wage_rates(conn, rates)
+
+    @staticmethod
+    def _write_wage_rates(conn: sqlite3.Connection, rates: Dict[str, Dict[str, float]]) -> None:
+        conn.execute("DELETE FROM wage_rates")
+        conn.executemany(
+            "INSERT INTO wage_rates (position, base_rate, weekend_rate) VALUES (?, ?, ?)",
+            [(position, info['base_rate'], info['weekend_rate']) for position, info in rates.items()]
+        )
+
+    # Employees
+    def get_employee(self, staff_id: str) -> Optional[Employee]:
+        row = self._connect().execute(
+            "SELECT staff_id, fname, lname, job, start FROM employees WHERE staff_id = ?", (staff_id,)
+        ).fetchone()
+        return Employee.from_values(row) if row is not None else None
+
+    def get_all_employees(self) -> List[Employee]:
+        rows = self._connect().execute(
+            "SELECT staff_id, fname, lname, job, start FROM employees ORDER BY rowid"
+        ).fetchall()
+        return [Employee.from_values(row) for row in rows]
+
+    def add_employee(self, employee: Dict[str, str]) -> None:
+        self.add_employees([employee])
+
+    def add_employees(self, employees: List[Dict[str, str]]) -> None:
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT INTO employees (staff_id, fname, lname, job, start) VALUES (?, ?, ?, ?, ?)",
+                [[employee[field] for field in EMPLOYEE_FIELDS] for employee in employees]
+            )
+
+    def save_employees(self, employees: List[Dict[str, str]]) -> None:
+        conn = self._connect()
+        with conn:
+            self._write_employees(conn, employees)
+
+    def update_employee(self, employee: Dict[str, str]) -> bool:
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute(
+                "UPDATE employees SET fname = ?, lname = ?, job = ?, start = ? WHERE staff_id = ?",
+                [employee[field] for field in EMPLOYEE_FIELDS[1:]] + [employee['staff_id']]
+            )
+        return cursor.rowcount > 0
+
+    def delete_employee(self, staff_id: str) -> bool:
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute("DELETE FROM employees WHERE staff_id = ?", (staff_id,))
+        return cursor.rowcount > 0
+
+    @staticmethod
+    def _write_employees(conn: sqlite3.Connection, employees: List[Dict[str, str]]) -> None:
+        conn.execute("DELETE FROM employees")
+        # Keep the first row for a duplicated ID, like the CSV index does
+        conn.executemany(
+            "INSERT OR IGNORE INTO employees (staff_id, fname, lname, job, start) VALUES (?, ?, ?, ?, ?)",
+            [[emp[field] for field in EMPLOYEE_FIELDS] for emp in employees]
+        )
+
+    # Schedules
+    _SCHEDULE_COLUMNS = ", ".join(SCHEDULE_FIELDS)
+    _INSERT_SCHEDULE = (
+        f"INSERT INTO schedules ({_SCHEDULE_COLUMNS}, week_ordinal) "
+        f"VALUES ({', '.join('?' for _ in SCHEDULE_FIELDS)}, ?)"
+    )
+
+    @staticmethod
+    def _schedule_params(schedule: Dict[str, Any]) -> List[Any]:
+        """Column values for an INSERT, with the parsed week ordinal last"""
+        return [schedule.get(field, '') for field in SCHEDULE_FIELDS] + [date_ordinal(schedule.get('week_start'))]
+
+    def query_schedules(self, employee_id: str = None, start: Optional[int] = None, end: Optional[int] = None) -> List[Schedule]:
+        return list(self.iter_schedules(employee_id, start, end))
+
+    def iter_schedules(self, employee_id: str = None, start: Optional[int] = None, end: Optional[int] = None) -> Iterator[Schedule]:
+        clauses, params = [], []
+        if employee_id:
+            clauses.append("employee_id = ?")
+            params.append(employee_id)
+        if start is not None:
+            clauses.append("week_ordinal >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("week_ordinal <= ?")
+            params.append(end)
+
+        sql = f"SELECT {self._SCHEDULE_COLUMNS} FROM schedules"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY row_id"
+        # Step through the cursor so rows are fetched as they are consumed
+        for row in self._connect().execute(sql, params):
+            yield Schedule.from_values(row)
+
+    def has_schedule(self, schedule_id: str) -> bool:
+        row = self._connect().execute(
+            "SELECT 1 FROM schedules WHERE schedule_id = ? LIMIT 1", (schedule_id,)
+        ).fetchone()
+        return row is not None
+
+    def get_schedule_rows(self, schedule_id: str) -> List[Schedule]:
+        rows = self._connect().execute(
+            f"SELECT {self._SCHEDULE_COLUMNS} FROM schedules WHERE schedule_id = ? ORDER BY row_id", (schedule_id,)
+        ).fetchall()
+        return [Schedule.from_values(row) for row in rows]
+
+    def schedules_stamp(self) -> Optional[List[Any]]:
+        rows = self._connect().execute(
+            "SELECT key, value FROM meta WHERE key IN ('database_id', 'schedules_version')"
+        ).fetchall()
+        meta = {row['key']: row['value'] for row in rows}
+        return [meta.get('database_id'), meta.get('schedules_version')]
+
+    @staticmethod
+    def _bump_schedules_version(conn: sqlite3.Connection) -> None:
+        """Mark the schedules as changed; call inside the write's transaction"""
+        conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'schedules_version'")
+
+    def add_schedule(self, schedule: Dict[str, Any]) -> None:
+        self.add_schedules([schedule])
+
+    def add_schedules(self, schedules: List[Dict[str, Any]]) -> None:
+        conn = self._connect()
+        with conn:
+            conn.executemany(self._INSERT_SCHEDULE, [self._schedule_params(s) for s in schedules])
+            self._bump_schedules_version(conn)
+
+    def replace_schedule(self, schedule: Dict[str, Any]) -> None:
+        self.replace_schedules([schedule])
+
+    def replace_schedules(self, schedules: List[Dict[str, Any]]) -> None:
+        if not schedules:
+            return
+        # Delete and re-insert so the rows move to the end, as they do in the CSV log
+        conn = self._connect()
+        with conn:
+            conn.executemany("DELETE FROM schedules WHERE schedule_id = ?",
+                             [(schedule['schedule_id'],) for schedule in schedules])
+            conn.executemany(self._INSERT_SCHEDULE, [self._schedule_params(s) for s in schedules])
+            self._bump_schedules_version(conn)
+
+    def delete_schedule(self, schedule_id: str) -> bool:
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute("DELETE FROM schedules WHERE schedule_id = ?", (schedule_id,))
+            if cursor.rowcount > 0:
+                self._bump_schedules_version(conn)
+        return cursor.rowcount > 0
+
+    def load_schedules(self) -> List[Schedule]:
+        return self.query_schedules()
+
+    def save_schedules(self, schedules: List[Dict[str, Any]]) -> None:
+        conn = self._connect()
+        with conn:
+            self._write_schedules(conn, schedules)
+
+    def _write_schedules(self, conn: sqlite3.Connection, schedules: List[Dict[str, Any]]) -> None:
+        conn.execute("DELETE FROM schedules")
+        conn.executemany(self._INSERT_SCHEDULE, [self._schedule_params(s) for s in schedules])
+        self._bump_schedules_version(conn)
+
+    def apply_changes(self, wage_rates: Optional[Dict[str, Dict[str, float]]] = None,
+                      employees: Optional[List[Dict[str, str]]] = None,
+                      schedules: Optional[List[Dict[str, Any]]] = None,
+                      new_schedules: Optional[List[Dict[str, Any]]] = None) -> None:
+        """Write the results of a transaction in a single database transaction"""
+        conn = self._connect()
+        with conn:
+            if wage_rates is not None:
+                self._write_wage_rates(conn, wage_rates)
+            if employees is not None:
+                self._write_employees(conn, employees)
+            if schedules is not None:
+                self._write_schedules(conn, schedules)
+            elif new_schedules:
+                conn.executemany(self._INSERT_SCHEDULE, [self._schedule_params(s) for s in new_schedules])
+                self._bump_schedules_version(conn)
+
+
+class TransactionStorage(StorageBackend):
+    """
+    Working set over another backend used by DataManager.transaction()
+
+    Each dataset is loaded from the backing storage the first time it is
+    read or changed. Changes stay in memory until commit() writes every
+    touched dataset back once. New schedules are kept as a list of rows
+    to append, and the full schedule set is only loaded for a replace or
+    delete.
+    """
+
+    def __init__(self, backing: StorageBackend):
+        self.backing = backing
+        self._wage_rates: Optional[Dict[str, Dict[str, float]]] = None
+        self._wage_rates_loaded = False
+        self._employees: Optional[Dict[str, Employee]] = None
+        self._schedules: Optional[ScheduleIndex] = None
+        self._new_schedules: List[Schedule] = []
+        self._dirty = set()
+        self.rolled_back = False
+
+    def rollback(self) -> None:
+        """Discard every buffered change"""
+        self.rolled_back = True
+
+    def setup(self) -> None:
+        self.backing.setup()
+
+    # Wage rates
+    def load_wage_rates(self) -> Optional[Dict[str, Dict[str, float]]]:
+        if not self._wage_rates_loaded:
+            self._wage_rates = self.backing.load_wage_rates()
+            self._wage_rates_loaded = True
+        if self._wage_rates is None:
+            return None
+        return {position: dict(info) for position, info in self._wage_rates.items()}
+
+    def save_wage_rates(self, rates: Dict[str, Dict[str, float]]) -> None:
+        self._wage_rates = {position: dict(info) for position, info in rates.items()}
+        self._wage_rates_loaded = True
+        self._dirty.add('wage_rates')
+
+    # Employees
+    def _get_employees(self) -> Dict[str, Employee]:
+        if self._employees is None:
+            self._employees = {}
+            for emp in self.backing.get_all_employees():
+                self._employees.setdefault(emp.staff_id, emp)
+        return self._employees
+
+    def get_employee(self, staff_id: str) -> Optional[Employee]:
+        employee = self._get_employees().get(staff_id)
+        return employee.copy() if employee is not None else None
+
+    def get_all_employees(self) -> List[Employee]:
+        return [emp.copy() for emp in self._get_employees().values()]
+
+    def add_employee(self, employee: Dict[str, str]) -> None:
+        employee = Employee.from_dict(employee)
+        self._get_employees()[employee.staff_id] = employee
+        self._dirty.add('employees')
+
+    def save_employees(self, employees: List[Dict[str, str]]) -> None:
+        self._employees = {}
+        for emp in employees:
+            emp = Employee.from_dict(emp)
+            self._employees.setdefault(emp.staff_id, emp)
+        self._dirty.add('employees')
+
+    def update_employee(self, employee: Dict[str, str]) -> bool:
+        employees = self._get_employees()
+        employee = Employee.from_dict(employee)
+        if employee.staff_id not in employees:
+            return False
+        employees[employee.staff_id] = employee
+        self._dirty.add('employees')
+        return True
+
+    def delete_employee(self, staff_id: str) -> bool:
+        if self._get_employees().pop(staff_id, None) is None:
+            return False
+        self._dirty.add('employees')
+        return True
+
+    # Schedules
+    def _get_schedules(self) -> ScheduleIndex:
+        """Load the full schedule set, folding in any rows added so far"""
+        if self._schedules is None:
+            self._schedules = ScheduleIndex(self.backing.load_schedules())
+            for row in self._new_schedules:
+                self._schedules.add(row)
+            self._new_schedules = []
+        return self._schedules
+
+    def query_schedules(self, employee_id: str = None, start: Optional[int] = None, end: Optional[int] = None) -> List[Schedule]:
+        if self._schedules is not None:
+            return [row.copy() for row in self._schedules.query(employee_id, start, end)]
+
+        schedules = self.backing.query_schedules(employee_id, start, end)
+        matches = schedule_filter(employee_id, start, end)
+        schedules.extend(row.copy() for row in self._new_schedules if matches(row))
+        return schedules
+
+    def has_schedule(self, schedule_id: str) -> bool:
+        if self._schedules is not None:
+            return schedule_id in self._schedules
+        return (any(row.schedule_id == schedule_id for row in self._new_schedules)
+                or self.backing.has_schedule(schedule_id))
+
+    def add_schedule(self, schedule: Dict[str, Any]) -> None:
+        row = Schedule.from_dict(schedule)
+        if self._schedules is not None:
+            self._schedules.add(row)
+            self._dirty.add('schedules')
+        else:
+            self._new_schedules.append(row)
+
+    def replace_schedule(self, schedule: Dict[str, Any]) -> None:
+        schedules = self._get_schedules()
+        row = Schedule.from_dict(schedule)
+        schedules.remove(row.schedule_id)
+        schedules.add(row)
+        self._dirty.add('schedules')
+
+    def delete_schedule(self, schedule_id: str) -> bool:
+        if not self._get_schedules().remove(schedule_id):
+            return False
+        self._dirty.add('schedules')
+        return True
+
+    def load_schedules(self) -> List[Schedule]:
+        return [row.copy() for row in self._get_schedules().live_rows()]
+
+    def save_schedules(self, schedules: List[Dict[str, Any]]) -> None:
+        self._schedules = ScheduleIndex([Schedule.from_dict(s) for s in schedules])
+        self._new_schedules = []
+        self._dirty.add('schedules')
+
+    def commit(self) -> None:
+        """Write every changed dataset back to the backing storage"""
+        self.backing.apply_changes(
+            wage_rates=self._wage_rates if 'wage_rates' in self._dirty else None,
+            employees=list(self._employees.values()) if 'employees' in self._dirty else None,
+            schedules=self._schedules.live_rows() if 'schedules' in self._dirty else None,
+            new_schedules=self._new_schedules
+        )
+
+
+STORAGE_BACKENDS = {
+    "csv": CsvStorage,
+    "sqlite": SqliteStorage,
+}
+
+
+def create_storage(backend: str, data_folder: Path) -> StorageBackend:
+    """Create a storage backend by name ("csv" or "sqlite")"""
+    try:
+        return STORAGE_BACKENDS[backend](data_folder)
+    except KeyError:
+        raise ValueError(f"Unknown storage backend: {backend}") from None
+
+
+def copy_storage(source: StorageBackend, target: StorageBackend) -> Tuple[bool, str]:
+    """Copy all employees, schedules and wage rates from one backend to another"""
+    try:
+        target.setup()
+
+        rates = source.load_wage_rates()
+        if rates is not None:
+            target.save_wage_rates(rates)
+
+        employees = source.get_all_employees()
+        target.save_employees(employees)
+
+        schedules = source.load_schedules()
+        target.save_schedules(schedules)
+
+        return True, f"Copied {len(employees)} employees, {len(schedules)} schedules and {len(rates or {})} wage rates"
+    except Exception as e:
+        return False, f"Failed to copy data: {str(e)}"
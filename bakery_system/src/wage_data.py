@@ -1,58 +1,165 @@
-from typing import Dict, Optional, Tuple
-
-class WageManager:
-    def __init__(self):
-        pass
-
-    @staticmethod
-    def validate_rate(rate: float, rate_type: str) -> Tuple[bool, str]:
-        """Validate wage rate"""
-        if rate <= 0:
-            return False, f"Invalid {rate_type}: must be greater than zero"
-        return True, ""
-
-    def validate_position(self, position: str, available_positions: Dict[str, Dict[str, float]]) -> Tuple[bool, str]:
-        """Validate if position exists in wage rates"""
-        if not position:
-            return False, "Position cannot be empty"
-
-        for stored_title in available_positions.keys():
-            if stored_title.lower() == position.lower():
-                return True, ""
-
-        return False, f"Position '{position}' not found"
-
-    def get_rate(self, position: str, is_weekend: bool, rates: Dict[str, Dict[str, float]]) -> Tuple[bool, float, str]:
-        """Get wage rate for a position"""
-        for stored_title, rate_info in rates.items():
-            if stored_title.lower() == position.lower():
-                rate_key = 'weekend_rate' if is_weekend else 'base_rate'
-                return True, rate_info[rate_key], ""
-        return False, 0.0, f"Position '{position}' not found"
-
-    def calculate_pay(self, position: str, hours: Dict[str, float], rates: Dict[str, Dict[str, float]]) -> Tuple[bool, float, str]:
-        """Calculate pay based on position and hours worked"""
-        # Validate position exists
-        valid, msg = self.validate_position(position, rates)
-        if not valid:
-            return False, 0.0, msg
-
-        # Get rates for this position
-        position_rates = None
-        for stored_title, rate_info in rates.items():
-            if stored_title.lower() == position.lower():
-                position_rates = rate_info
-                break
-
-        if not position_rates:
-            return False, 0.0, f"No rates found for position '{position}'"
-
-        # Calculate pay
-        base_rate = position_rates['base_rate']
-        weekend_rate = position_rates['weekend_rate']
-
-        weekday_hours = sum([hours.get(day, 0) for day in ['mon', 'tue', 'wed', 'thu', 'fri']])
-        weekend_hours = sum([hours.get(day, 0) for day in ['sat', 'sun']])
-
-        total_pay = (weekday_hours * base_rate) + (weekend_hours * weekend_rate)
-        return True, round(total_pay, 2), ""
+import sys
+from typing import Dict, Optional, Sequence, Tuple, Any
+from schedule import DAYS
+from diagnostics import instrumented
+
+try:
+    import numpy as np
+except ImportError:
+    # Batch pay calculation is optional; everything else works without NumPy
+    np = None
+
+@instrumented
+class WageManager:
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def validate_rate(rate: float, rate_type: str) -> Tuple[bool, str]:
+        """Validate wage rate"""
+        if rate <= 0:
+            return False, f"Invalid {rate_type}: must be greater than zero"
+        return True, ""
+
+    @staticmethod
+    def build_rate_table(rates: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+        """Key wage rates by case-folded position for O(1) lookups"""
+        table = {}
+        for stored_title, rate_info in rates.items():
+            # Keep the first match, like the linear scans do
+            table.setdefault(stored_title.casefold(), rate_info)
+        return table
+
+    def validate_position(self, position: str, available_positions: Dict[str, Dict[str, float]]) -> Tuple[bool, str]:
+        """Validate if position exists in wage rates"""
+        if not position:
+            return False, "Position cannot be empty"
+
+        for stored_title in available_positions.keys():
+            if stored_title.lower() == position.lower():
+                return True, ""
+
+        return False, f"Position '{position}' not found"
+
+    def get_rate(self, position: str, is_weekend: bool, rates: Dict[str, Dict[str, float]]) -> Tuple[bool, float, str]:
+        """Get wage rate for a position"""
+        for stored_title, rate_info in rates.items():
+            if stored_title.lower() == position.lower():
+                rate_key = 'weekend_rate' if is_weekend else 'base_rate'
+                return True, rate_info[rate_key], ""
+        return False, 0.0, f"Position '{position}' not found"
+
+    def calculate_pay(self, position: str, hours: Dict[str, float], rates: Dict[str, Dict[str, float]]) -> Tuple[bool, float, str]:
+        """Calculate pay based on position and hours worked"""
+        # Validate position exists
+        valid, msg = self.validate_position(position, rates)
+        if not valid:
+            return False, 0.0, msg
+
+        # Get rates for this position
+        position_rates = None
+        for stored_title, rate_info in rates.items():
+            if stored_title.lower() == position.lower():
+                position_rates = rate_info
+                break
+
+        if not position_rates:
+            return False, 0.0, f"No rates found for position '{position}'"
+
+        return self.calculate_pay_at_rates(position_rates, hours)
+
+    def calculate_pay_at_rates(self, position_rates: Dict[str, float], hours: Dict[str, float]) -> Tuple[bool, float, str]:
+        """Calculate pay from a position's rates that have already been looked up"""
+        base_rate = position_rates['base_rate']
+        weekend_rate = position_rates['weekend_rate']
+
+        weekday_hours = sum([hours.get(day, 0) for day in ['mon', 'tue', 'wed', 'thu', 'fri']])
+        weekend_hours = sum([hours.get(day, 0) for day in ['sat', 'sun']])
+
+        total_pay = (weekday_hours * base_rate) + (weekend_hours * weekend_rate)
+        return True, round(total_pay, 2), ""
+
+    @staticmethod
+    def compile_rate_array(rates: Dict[str, Dict[str, float]]) -> Tuple[Dict[str, int], Any]:
+        """
+        Pack wage rates into an array for calculate_pay_batch
+
+        Args:
+            rates (Dict[str, Dict[str, float]]): Wage rates keyed by position
+
+        Returns:
+            Tuple[Dict[str, int], np.ndarray]: (Position code by case-folded position,
+            (positions, 2) array of base and weekend rates indexed by code)
+        """
+        if np is None:
+            raise ImportError("NumPy is required for batch pay calculation")
+
+        table = WageManager.build_rate_table(rates)
+        codes = {position: code for code, position in enumerate(table)}
+        rate_array = np.array(
+            [[info['base_rate'], info['weekend_rate']] for info in table.values()],
+            dtype=np.float64
+        ).reshape(len(table), 2)
+        return codes, rate_array
+
+    @staticmethod
+    def _sum_columns(columns: Sequence[Any]) -> Any:
+        """Add day columns the same way the built-in sum() adds a list of floats"""
+        total = np.zeros_like(columns[0])
+        if sys.version_info < (3, 12):
+            for column in columns:
+                total = total + column
+            return total
+
+        # Python 3.12+ compensates float sums (Neumaier), so do the same
+        compensation = np.zeros_like(total)
+        for column in columns:
+            t = total + column
+            compensation += np.where(np.abs(total) >= np.abs(column), (total - t) + column, (column - t) + total)
+            total = t
+        return np.where(np.isfinite(compensation) & (compensation != 0), total + compensation, total)
+
+    def calculate_pay_batch(self, hours: Any, position_codes: Any, rate_array: Any) -> Tuple[bool, Any, str]:
+        """
+        Calculate pay for many employee-weeks at once
+
+        Gives the same results as calculate_pay row by row, including rounding
+        to 2 decimal places.
+
+        Args:
+            hours: (rows, 7) matrix of hours, Monday to Sunday
+            position_codes: (rows,) vector of codes from compile_rate_array; -1 marks an unknown position
+            rate_array: (positions, 2) array from compile_rate_array
+
+        Returns:
+            Tuple[bool, np.ndarray, str]: (Success status, Pay per row with NaN for unknown positions, Error message)
+        """
+        if np is None:
+            return False, None, "NumPy is required for batch pay calculation"
+
+        try:
+            hours = np.asarray(hours, dtype=np.float64).reshape(-1, len(DAYS))
+            position_codes = np.asarray(position_codes, dtype=np.intp)
+            rate_array = np.asarray(rate_array, dtype=np.float64)
+            if position_codes.shape != (hours.shape[0],):
+                return False, None, "Need one position code per row of hours"
+
+            known = position_codes >= 0
+            rates = rate_array[np.where(known, position_codes, 0)] if len(rate_array) else np.zeros((len(hours), 2))
+
+            weekday_hours = self._sum_columns([hours[:, i] for i in range(5)])
+            weekend_hours = self._sum_columns([hours[:, i] for i in range(5, 7)])
+            total_pay = (weekday_hours * rates[:, 0]) + (weekend_hours * rates[:, 1])
+
+            # np.round scales by 100 first, so values sitting on a half cent can
+            # round the other way from round(); redo those few with round()
+            pay = np.round(total_pay, 2)
+            cents = total_pay * 100
+            near_half = np.abs(cents - np.floor(cents) - 0.5) < 1e-6
+            for i in np.flatnonzero(near_half):
+                pay[i] = round(float(total_pay[i]), 2)
+
+            pay[~known] = np.nan
+            return True, pay, ""
+        except Exception as e:
+            return False, None, f"Error calculating pay: {str(e)}"
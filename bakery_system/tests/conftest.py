@@ -0,0 +1,30 @@
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# The modules in src import each other by bare name, as they do when main.py runs
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from data_manager import DataManager  # noqa: E402
+
+# The sample data folder shipped with the app
+SHIPPED_DATA = Path(__file__).resolve().parents[1] / "data"
+
+
+@pytest.fixture
+def shipped_data(tmp_path: Path) -> Path:
+    """A copy of the shipped data folder, safe to change"""
+    folder = tmp_path / "data"
+    shutil.copytree(SHIPPED_DATA, folder)
+    return folder
+
+
+@pytest.fixture
+def data_folder(tmp_path: Path) -> Path:
+    """An empty data folder, set up as on first run"""
+    folder = tmp_path / "data"
+    DataManager(folder).setup_data_folder()
+    return folder
@@ -0,0 +1,122 @@
+import asyncio
+import threading
+
+from async_service import AsyncDataManager, AsyncService, _ReadWriteGate
+from data_manager import DataManager
+
+
+def test_a_waiting_write_holds_back_later_reads():
+    async def scenario():
+        gate = _ReadWriteGate()
+        events = []
+        first_read_in = asyncio.Event()
+        release_first_read = asyncio.Event()
+
+        async def first_read():
+            async with gate.reading():
+                first_read_in.set()
+                await release_first_read.wait()
+                events.append("first read")
+
+        async def write():
+            async with gate.writing():
+                events.append("write")
+
+        async def later_read():
+            async with gate.reading():
+                events.append("later read")
+
+        tasks = [asyncio.create_task(first_read())]
+        await first_read_in.wait()
+        tasks.append(asyncio.create_task(write()))
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(later_read()))
+        await asyncio.sleep(0.05)
+        # The write waits for the running read; the later read waits for the write
+        assert events == []
+        release_first_read.set()
+        await asyncio.gather(*tasks)
+        return events
+
+    assert asyncio.run(scenario()) == ["first read", "write", "later read"]
+
+
+def test_reads_run_together():
+    async def scenario():
+        gate = _ReadWriteGate()
+        both_in = asyncio.Barrier(2)
+
+        async def read():
+            async with gate.reading():
+                await asyncio.wait_for(both_in.wait(), 5)
+
+        await asyncio.gather(read(), read())
+
+    asyncio.run(scenario())
+
+
+class Counter:
+    """Blocking reads that can be held open, counting how often they really run"""
+
+    def __init__(self):
+        self.calls = 0
+        self.value = 0
+        self.release = threading.Event()
+
+    def read(self, key):
+        self.calls += 1
+        self.release.wait(5)
+        return (key, self.value)
+
+    def write(self, value):
+        self.value = value
+        return value
+
+
+def test_identical_reads_share_one_call_until_a_write():
+    async def scenario():
+        target = Counter()
+        async with AsyncService(max_workers=4) as service:
+            first = asyncio.ensure_future(service.read(target, "read", ("a",)))
+            second = asyncio.ensure_future(service.read(target, "read", ("a",)))
+            await asyncio.sleep(0.05)
+            assert target.calls == 1
+
+            # A write drops the shared call, so a read asked for after it runs afresh
+            write = asyncio.ensure_future(service.write(target, "write", (5,)))
+            await asyncio.sleep(0)
+            third = asyncio.ensure_future(service.read(target, "read", ("a",)))
+            target.release.set()
+            results = await asyncio.gather(first, second, write, third)
+        return target.calls, results
+
+    calls, (first, second, write, third) = asyncio.run(scenario())
+    assert calls == 2
+    assert first is second and first == ("a", 0)
+    assert third == ("a", 5)
+
+
+def test_a_cancelled_write_still_runs_to_completion():
+    async def scenario():
+        target = Counter()
+        async with AsyncService() as service:
+            write = asyncio.ensure_future(service.write(target, "write", (7,)))
+            await asyncio.sleep(0)
+            write.cancel()
+        return target.value
+
+    assert asyncio.run(scenario()) == 7
+
+
+def test_async_data_manager_matches_data_manager(data_folder):
+    manager = DataManager(data_folder)
+
+    async def scenario():
+        async with AsyncService() as service:
+            async_manager = AsyncDataManager(manager, service)
+            added = await async_manager.add_employee("Ann", "Lee", "Baker", "01-01-2020")
+            return added, await async_manager.get_employee("E001")
+
+    added, (success, employee, error) = asyncio.run(scenario())
+    assert added == (True, "Employee added successfully with ID: E001")
+    assert success and employee.fname == "Ann"
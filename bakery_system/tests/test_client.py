@@ -0,0 +1,63 @@
+import http.client
+import socket
+import threading
+
+import pytest
+
+from client import BakeryClient
+
+
+@pytest.fixture
+def flaky_server():
+    """A server that answers the first request, then drops each connection after reading the request"""
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    received = []
+
+    def handle(conn):
+        with conn, conn.makefile("rb") as f:
+            while True:
+                request_line = f.readline()
+                if not request_line:
+                    return
+                length = 0
+                for line in iter(f.readline, b"\r\n"):
+                    name, _, value = line.partition(b":")
+                    if name.lower() == b"content-length":
+                        length = int(value)
+                f.read(length)
+                received.append(request_line.split()[0].decode())
+                if len(received) > 1:
+                    return
+                conn.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}")
+
+    def accept():
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            threading.Thread(target=handle, args=(conn,), daemon=True).start()
+
+    threading.Thread(target=accept, daemon=True).start()
+    yield listener.getsockname()[1], received
+    listener.close()
+
+
+def test_post_is_not_sent_again_after_the_server_took_it(flaky_server):
+    port, received = flaky_server
+    with BakeryClient("127.0.0.1", port, timeout=5) as client:
+        assert client.request("GET", "/health") == (200, {})
+        with pytest.raises(http.client.RemoteDisconnected):
+            client.request("POST", "/schedules", {"employee_id": "E001"})
+    assert received == ["GET", "POST"]
+
+
+def test_get_is_sent_again_on_a_new_connection(flaky_server):
+    port, received = flaky_server
+    with BakeryClient("127.0.0.1", port, timeout=5) as client:
+        assert client.request("GET", "/health") == (200, {})
+        with pytest.raises(http.client.RemoteDisconnected):
+            client.request("GET", "/employees/E001")
+    assert received == ["GET", "GET", "GET"]
@@ -0,0 +1,91 @@
+import threading
+import time
+
+import pytest
+
+from data_manager import DataManager
+from file_lock import FileLock
+from storage import CsvStorage
+
+
+def test_locks_are_reentrant_within_a_thread(tmp_path):
+    lock = FileLock(tmp_path / "data.lock")
+    with lock.exclusive():
+        with lock.exclusive():
+            with lock.shared():
+                pass
+    with lock.shared():
+        with lock.shared():
+            pass
+
+
+def test_upgrading_a_shared_lock_raises(tmp_path):
+    lock = FileLock(tmp_path / "data.lock")
+    with lock.shared():
+        with pytest.raises(RuntimeError, match="exclusive"):
+            with lock.exclusive():
+                pass
+    # The lock is still usable once the shared hold is released
+    with lock.exclusive():
+        pass
+
+
+def test_exclusive_lock_keeps_other_threads_out(tmp_path):
+    lock = FileLock(tmp_path / "data.lock")
+    events = []
+    held = threading.Event()
+
+    def writer():
+        with lock.exclusive():
+            held.set()
+            time.sleep(0.2)
+            events.append("writer done")
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    held.wait()
+    with lock.shared():
+        events.append("reader in")
+    thread.join()
+    assert events == ["writer done", "reader in"]
+
+
+def test_shared_locks_run_together(tmp_path):
+    lock = FileLock(tmp_path / "data.lock")
+    both_in = threading.Barrier(2, timeout=5)
+
+    def reader():
+        with lock.shared():
+            both_in.wait()
+
+    threads = [threading.Thread(target=reader) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not both_in.broken
+
+
+def test_add_record_does_not_lose_a_row_added_mid_write(data_folder):
+    first, second = DataManager(data_folder), DataManager(data_folder)
+    loaded = threading.Event()
+    save_data = first.save_data
+
+    def slow_save_data(file_type, data):
+        # The rows are loaded by now; give the other manager every chance to write before they're saved
+        loaded.set()
+        time.sleep(0.2)
+        return save_data(file_type, data)
+
+    first.save_data = slow_save_data
+    results = []
+    record = {'staff_id': 'E100', 'fname': 'Ann', 'lname': 'Lee', 'job': 'Baker', 'start': '01-01-2020'}
+    thread = threading.Thread(target=lambda: results.append(first.add_record("employees", record)))
+    thread.start()
+    assert loaded.wait(5)
+    success, msg = second.add_employee("Bob", "Ray", "Baker", "01-01-2020")
+    thread.join()
+
+    assert success, msg
+    assert results[0][0], results
+    assert sorted(emp.fname for emp in CsvStorage(data_folder).get_all_employees()) == ["Ann", "Bob"]
@@ -0,0 +1,55 @@
+import json
+
+from data_manager import DataManager
+from id_allocator import IdAllocator
+
+
+def test_numbers_follow_on_and_persist(tmp_path):
+    counter_file = tmp_path / "ids.json"
+    allocator = IdAllocator(counter_file)
+    assert allocator.reserve("E", 3, lambda: 0) == 1
+    assert allocator.next("E", lambda: 0) == 4
+    assert json.loads(counter_file.read_text()) == {"E": 4}
+
+
+def test_first_use_catches_up_with_stored_ids(tmp_path):
+    counter_file = tmp_path / "ids.json"
+    counter_file.write_text(json.dumps({"E": 3}))
+
+    # Rows restored from a backup go past the saved counter
+    assert IdAllocator(counter_file).next("E", lambda: 10) == 11
+    # The counter never moves back, whatever the stored rows say
+    assert IdAllocator(counter_file).next("E", lambda: 2) == 12
+
+
+def test_taken_numbers_trigger_a_recheck(tmp_path):
+    allocator = IdAllocator(tmp_path / "ids.json")
+    stored = {1}
+    seeds = []
+
+    def seed():
+        seeds.append(max(stored))
+        return max(stored)
+
+    assert allocator.next("S", seed, stored.__contains__) == 2
+    stored.add(2)
+    # Nothing new taken: the counter is trusted without reading the stored IDs
+    assert allocator.next("S", seed, stored.__contains__) == 3
+    assert len(seeds) == 1
+
+    # Another tool writes rows the counter doesn't know about
+    stored.update({3, 4, 5})
+    assert allocator.next("S", seed, stored.__contains__) == 6
+    assert seeds == [1, 5]
+
+
+def test_add_employee_fails_when_no_id_can_be_made(data_folder, monkeypatch):
+    manager = DataManager(data_folder)
+
+    def broken(*args, **kwargs):
+        raise OSError("counter file unreadable")
+
+    monkeypatch.setattr(manager.id_allocator, "reserve", broken)
+    success, msg = manager.add_employee("Ann", "Lee", "Baker", "01-01-2020")
+    assert not success and "counter file unreadable" in msg
+    assert manager.get_all_employees() == (True, [], "")
@@ -0,0 +1,114 @@
+import random
+
+import pytest
+
+from data_manager import DataManager
+from dates import date_ordinal, format_ordinal
+from reports import Reports
+from schedule import DAYS
+
+# Monday 6 January 2020
+FIRST_WEEK = 737430
+WEEKS = 30
+
+
+@pytest.fixture
+def payroll(tmp_path, monkeypatch):
+    """Reports over a data folder of schedules with tenths of hours, which don't add up exactly as floats"""
+    monkeypatch.chdir(tmp_path)
+    manager = DataManager(tmp_path / "data")
+    manager.setup_data_folder()
+
+    rng = random.Random(1234)
+    jobs = ["Baker", "Head Baker", "Counter Staff"]
+    manager.storage.add_employees([
+        {'staff_id': f"E{i:03d}", 'fname': 'Ann', 'lname': f"Lee{i}", 'job': jobs[i % len(jobs)], 'start': '01-01-2019'}
+        for i in range(1, 21)
+    ])
+    schedules = []
+    for week in range(WEEKS):
+        for i in rng.sample(range(1, 21), 12):
+            hours = {day: rng.randrange(0, 80) / 10 for day in DAYS}
+            schedules.append({
+                'schedule_id': f"S{len(schedules) + 1:04d}", 'employee_id': f"E{i:03d}",
+                'week_start': format_ordinal(FIRST_WEEK + 7 * week), **hours,
+                'total_hours': round(sum(hours.values()), 1),
+                'total_pay': rng.randrange(0, 100000) / 100,
+            })
+    manager.storage.add_schedules(schedules)
+    return manager, Reports(manager)
+
+
+def random_periods(count, seed):
+    rng = random.Random(seed)
+    periods = []
+    for _ in range(count):
+        start = FIRST_WEEK + rng.randrange(-10, 7 * WEEKS)
+        end = start + rng.randrange(0, 7 * WEEKS)
+        periods.append((format_ordinal(start), format_ordinal(end)))
+    return periods
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_multi_period_reports_equal_single_reports(payroll, workers):
+    manager, reports = payroll
+    periods = [(format_ordinal(FIRST_WEEK + 7 * week), format_ordinal(FIRST_WEEK + 7 * week + 6))
+               for week in range(WEEKS)] + random_periods(20, seed=1)
+
+    success, many, error = reports.generate_wage_reports(periods, workers=workers)
+    assert success, error
+    for period, report in zip(periods, many):
+        success, single, error = reports.generate_wage_report(*period)
+        assert success, error
+        assert report == single, period
+
+
+def scanned_wage_report(manager, reports, start_date, end_date):
+    """The wage report read schedule by schedule, as it is inside a transaction"""
+    with manager.transaction() as txn:
+        success, rows, error = reports.iter_wage_report(start_date, end_date)
+        assert success, error
+        report = list(rows)
+        txn.rollback()
+    return report
+
+
+def exact_totals(schedules, start, end):
+    """(regular hours, weekend hours, pay) by employee, added up in hundredths"""
+    sums = {}
+    for schedule in schedules:
+        if start <= date_ordinal(schedule.week_start_date) <= end:
+            cell = sums.setdefault(schedule.employee_id, [0, 0, 0])
+            cell[0] += round(schedule.weekday_hours() * 100)
+            cell[1] += round(schedule.weekend_hours() * 100)
+            cell[2] += round(schedule.total_pay * 100)
+    return {emp_id: tuple(units / 100 for units in cell) for emp_id, cell in sums.items()}
+
+
+def test_weekly_totals_report_equals_scanned_report(payroll):
+    manager, reports = payroll
+    rng = random.Random(99)
+
+    # Move the kept totals through many small changes first
+    success, schedules, error = manager.get_schedules()
+    assert success, error
+    for schedule in rng.sample(schedules, 40):
+        hours = {day: rng.randrange(0, 80) / 10 for day in DAYS}
+        success, msg = manager.update_schedule(schedule.schedule_id, {
+            'employee_id': schedule.employee_id, 'week_start': schedule.week_start_date, **hours})
+        assert success, msg
+    for schedule in rng.sample(schedules, 20):
+        manager.delete_schedule(schedule.schedule_id)
+
+    success, totals, error = manager.get_payroll_totals()
+    assert success and totals is not None, error
+    success, schedules, error = manager.get_schedules()
+    assert success, error
+
+    for start_date, end_date in random_periods(200, seed=2):
+        start, end = date_ordinal(start_date), date_ordinal(end_date)
+        assert totals.range_totals(start, end) == exact_totals(schedules, start, end), (start_date, end_date)
+
+        success, totals_report, error = reports.generate_wage_report(start_date, end_date)
+        assert success, error
+        assert totals_report == scanned_wage_report(manager, reports, start_date, end_date), (start_date, end_date)
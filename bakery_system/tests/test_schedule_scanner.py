@@ -0,0 +1,107 @@
+import csv
+import random
+
+from dates import date_ordinal, format_ordinal
+from schedule import DAYS, SCHEDULE_FIELDS
+from schedule_index import schedule_filter
+from schedule_scanner import ScheduleScanner
+from storage import CsvStorage, read_schedules
+
+FIRST_WEEK = 737430
+
+# IDs that are prefixes of others, and weeks that don't parse, one of them
+# an employee ID that mustn't be taken for the row's employee
+EMPLOYEES = ["E1", "E10", "E100", "E2"]
+BAD_WEEKS = ["2020-01-06", "not a week", "E1"]
+
+
+def write_schedules(path, rows):
+    with path.open("w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(SCHEDULE_FIELDS)
+        writer.writerows(rows)
+
+
+def random_rows(count, seed):
+    rng = random.Random(seed)
+    rows = []
+    for number in range(1, count + 1):
+        week = rng.choice(BAD_WEEKS) if rng.random() < 0.05 else format_ordinal(FIRST_WEEK + 7 * rng.randrange(20))
+        hours = [rng.randrange(0, 9) for _ in DAYS]
+        rows.append([f"S{number:03d}", rng.choice(EMPLOYEES), week, *hours, sum(hours), sum(hours) * 15])
+    return rows
+
+
+def expected(path, employee_id, start, end):
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        matches = schedule_filter(employee_id, start, end)
+        return [row.to_values() for row in read_schedules(f) if matches(row)]
+
+
+def test_scan_matches_the_csv_reader(tmp_path):
+    path = tmp_path / "schedules.csv"
+    write_schedules(path, random_rows(500, seed=3))
+    rng = random.Random(4)
+
+    with ScheduleScanner.open(path) as scanner:
+        for _ in range(100):
+            employee_id = rng.choice(EMPLOYEES + [None, "E3"])
+            start = FIRST_WEEK + rng.randrange(-7, 140) if rng.random() < 0.7 else None
+            end = start + rng.randrange(0, 70) if start is not None and rng.random() < 0.7 else None
+            found = [row.to_values() for row in scanner.scan(employee_id, start, end)]
+            assert found == expected(path, employee_id, start, end), (employee_id, start, end)
+
+
+def test_scan_skips_superseded_rows(tmp_path):
+    path = tmp_path / "schedules.csv"
+    write_schedules(path, random_rows(50, seed=5))
+    with ScheduleScanner.open(path) as scanner:
+        found = [row.schedule_id for row in scanner.scan("E1", skip={"S001", "S002", "S003"})]
+    assert found and not {"S001", "S002", "S003"} & set(found)
+
+
+def test_files_the_scanner_cant_read_are_left_to_the_csv_reader(tmp_path):
+    path = tmp_path / "schedules.csv"
+    week = format_ordinal(FIRST_WEEK)
+    write_schedules(path, [["S001", "E1", week, 1, 2, 3, 4, 5, 0, 0, 15, "1,000"]])
+    assert ScheduleScanner.open(path) is None
+
+    reordered = tmp_path / "reordered.csv"
+    with reordered.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(list(reversed(SCHEDULE_FIELDS)))
+        writer.writerow(["15", "15", 0, 0, 5, 4, 3, 2, 1, week, "E1", "S001"])
+    assert ScheduleScanner.open(reordered) is None
+
+    (tmp_path / "empty.csv").write_bytes(b"")
+    assert ScheduleScanner.open(tmp_path / "empty.csv") is None
+
+
+def test_storage_scans_and_falls_back_to_the_same_rows(tmp_path):
+    rows = random_rows(200, seed=6)
+    # A quote anywhere, as spreadsheet exports add, rules out the scanner for the whole file
+    quoted = f'S900,E10,"{format_ordinal(FIRST_WEEK + 21)}",1,0,0,0,0,0,0,1,15\r\n'
+    start, end = FIRST_WEEK + 14, FIRST_WEEK + 70
+
+    results = []
+    for extra in ("", quoted):
+        storage = CsvStorage(tmp_path)
+        storage.setup()
+        storage.schedule_log_file.unlink(missing_ok=True)
+        write_schedules(storage.schedules_file, rows)
+        with storage.schedules_file.open("a", newline="", encoding="utf-8") as f:
+            f.write(extra)
+        assert (ScheduleScanner.open(storage.schedules_file) is None) == bool(extra)
+        # Scan the file for every filtered read instead of loading the index,
+        # with a logged delete for the scan to skip
+        storage.schedule_scan_bytes = 0
+        storage.delete_schedule(next(row[0] for row in rows if row[1] == "E10"))
+        storage._schedule_index = None
+
+        scanned = [row.to_values() for row in storage.iter_schedules("E10", start, end)]
+        indexed = [row.to_values() for row in CsvStorage(tmp_path).query_schedules("E10", start, end)]
+        assert scanned == indexed
+        assert all(date_ordinal(values[2]) for values in scanned)
+        results.append(scanned)
+
+    assert results[1] == results[0] + [["S900", "E10", format_ordinal(FIRST_WEEK + 21), 1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 15.0]]
@@ -0,0 +1,101 @@
+import random
+
+import pytest
+
+from dates import format_ordinal
+from schedule import DAYS, Schedule
+import schedule_store
+from schedule_store import BinaryScheduleStore
+from storage import CsvStorage
+
+FIRST_WEEK = 737430
+
+
+def random_schedules(count, seed):
+    rng = random.Random(seed)
+    schedules = []
+    for number in range(1, count + 1):
+        hours = {day: rng.randrange(0, 121) / 10 for day in DAYS}
+        schedule = Schedule(f"S{number:03d}", f"E{rng.randrange(1, 15):03d}",
+                            format_ordinal(FIRST_WEEK + 7 * rng.randrange(30)), hours)
+        # Totals as they'd be saved, not with float addition's trailing digits
+        schedule.total_hours = round(sum(hours.values()), 1)
+        schedule.total_pay = rng.randrange(0, 100000) / 100
+        schedules.append(schedule)
+    return schedules
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BinaryScheduleStore(tmp_path / "schedules.bin")
+
+
+def test_schedules_round_trip(store):
+    schedules = random_schedules(300, seed=1)
+    assert store.write(schedules) == 300
+
+    # Tenths of an hour and whole cents come back exactly as written
+    assert [schedule.to_values() for schedule in store] == [schedule.to_values() for schedule in schedules]
+    assert len(store) == 300
+    assert store[0].to_values() == schedules[0].to_values()
+    assert store[-1].to_values() == schedules[-1].to_values()
+    assert store[137].to_values() == schedules[137].to_values()
+    with pytest.raises(IndexError):
+        store[300]
+
+
+def test_csv_import_and_export_match_storage(store, tmp_path):
+    storage = CsvStorage(tmp_path)
+    storage.setup()
+    storage.save_schedules(random_schedules(50, seed=2))
+
+    assert store.import_csv(storage.schedules_file) == 50
+    exported = tmp_path / "exported.csv"
+    assert store.export_csv(exported) == 50
+    assert exported.read_bytes() == storage.schedules_file.read_bytes()
+
+
+def test_legacy_week_formats_are_stored_as_dd_mm_yyyy(store):
+    schedule = Schedule("S001", "E001", "2020-01-06", {'mon': 8})
+    store.write([schedule])
+    assert store[0].week_start_date == "06-01-2020"
+
+
+def test_unstorable_schedules_are_refused(store):
+    with pytest.raises(ValueError, match="week_start"):
+        store.write([Schedule("S001", "E001", "not a week", {})])
+    with pytest.raises(ValueError, match="longer than"):
+        store.write([Schedule("S" * 17, "E001", "06-01-2020", {})])
+    # A failed write leaves no partial file behind
+    assert not store.path.exists()
+
+
+def test_other_files_are_refused(store):
+    store.path.write_bytes(b"schedule_id,employee_id\n" + b"\x00" * 64)
+    with pytest.raises(ValueError, match="isn't a binary schedules file"):
+        len(store)
+
+
+def test_array_reads_and_range_totals_agree(store):
+    pytest.importorskip("numpy")
+    schedules = random_schedules(400, seed=3)
+    store.write(schedules)
+
+    mapped, loaded = store.to_array(), store.to_array(memory_map=False)
+    assert (mapped == loaded).all()
+    assert [store.employee_ids()[i] for i in mapped['employee']] == [s.employee_id for s in schedules]
+
+    start, end = FIRST_WEEK + 35, FIRST_WEEK + 140
+    expected = store._range_totals_unpacked(start, end)
+    totals = store.range_totals(start, end)
+    assert totals.keys() == expected.keys()
+    for employee_id, values in totals.items():
+        assert values == pytest.approx(expected[employee_id])
+
+
+def test_empty_store(store):
+    assert store.write([]) == 0
+    assert len(store) == 0 and list(store) == []
+    assert store.range_totals() == {}
+    if schedule_store.np is not None:
+        assert len(store.to_array()) == 0
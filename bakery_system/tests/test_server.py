@@ -0,0 +1,48 @@
+import socket
+import threading
+
+import pytest
+
+from client import BakeryClient
+from data_manager import DataManager
+from reports import Reports
+from server import BakeryApi, BakeryServer
+
+
+@pytest.fixture
+def server(data_folder):
+    """A server for an empty data folder, listening on a free local port"""
+    data_manager = DataManager(data_folder)
+    api = BakeryApi(data_manager, Reports(data_manager))
+    with BakeryServer(api, "127.0.0.1", 0) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server.server_address[1]
+        server.shutdown()
+    api.close()
+
+
+def raw_request(port, request):
+    with socket.create_connection(("127.0.0.1", port), timeout=5) as conn:
+        conn.sendall(request)
+        response = b""
+        while chunk := conn.recv(65536):
+            response += chunk
+    return response
+
+
+@pytest.mark.parametrize("length", [b"abc", b"-5", b"1.5"])
+def test_bad_content_length_gets_a_400(server, length):
+    response = raw_request(server, b"POST /employees HTTP/1.1\r\nHost: x\r\nContent-Length: " + length + b"\r\n\r\n{}")
+    status_line, _, _ = response.partition(b"\r\n")
+    assert b" 400 " in status_line
+    assert b"Content-Length must be a whole number of bytes" in response
+
+
+def test_requests_still_work(server):
+    with BakeryClient("127.0.0.1", server) as client:
+        status, response = client.request("POST", "/employees", {
+            'fname': 'Ann', 'lname': 'Lee', 'job': 'Baker', 'start_date': '01-01-2020'})
+        assert status == 200, response
+        status, response = client.request("GET", "/employees/E001")
+        assert status == 200 and response['data']['fname'] == 'Ann'
@@ -0,0 +1,73 @@
+import random
+
+from data_manager import DataManager
+from employee import Employee
+from staff_views import STAFF_ORDERS, StaffViews
+
+NAMES = ["Lee", "lee", "Ray", "Ng", "Ng", "Abbot"]
+JOBS = ["Baker", "baker", "Counter Staff", "Head Baker"]
+
+
+def random_employee(rng, staff_id):
+    return Employee(staff_id, rng.choice(NAMES), rng.choice(NAMES), rng.choice(JOBS), "01-01-2020")
+
+
+def sorted_ids(employees, order):
+    """What a stable sort of the employee list in storage order gives"""
+    return [emp.staff_id for emp in sorted(employees.values(), key=STAFF_ORDERS[order])]
+
+
+def test_views_match_a_fresh_sort_through_adds_updates_and_removes():
+    rng = random.Random(7)
+    employees = {f"E{i:03d}": random_employee(rng, f"E{i:03d}") for i in range(1, 30)}
+    views = StaffViews(employees.values())
+    next_id = 30
+
+    for _ in range(300):
+        action = rng.random()
+        if action < 0.4 or not employees:
+            employee = random_employee(rng, f"E{next_id:03d}")
+            next_id += 1
+            employees[employee.staff_id] = employee
+            views.add(employee)
+        elif action < 0.7:
+            staff_id = rng.choice(list(employees))
+            employee = random_employee(rng, staff_id)
+            employees[staff_id] = employee
+            views.update(employee)
+        else:
+            staff_id = rng.choice(list(employees))
+            del employees[staff_id]
+            views.remove(staff_id)
+
+        assert len(views) == len(employees)
+        for order in STAFF_ORDERS:
+            assert views.ordered(order) == sorted_ids(employees, order)
+
+    assert views.ordered("name", 5, 3) == sorted_ids(employees, "name")[5:8]
+
+
+def test_adding_a_known_employee_updates_them_in_place():
+    views = StaffViews([Employee("E001", "Ann", "Zed", "Baker", "01-01-2020"),
+                        Employee("E002", "Bob", "Zed", "Baker", "01-01-2020")])
+    views.add(Employee("E001", "Ann", "Zed", "Baker", "01-01-2020"))
+    assert len(views) == 2
+    # E001 keeps its place in storage order, so still sorts first on a tie
+    assert views.ordered("lname") == ["E001", "E002"]
+
+
+def test_sorted_listings_follow_employee_changes(data_folder):
+    manager = DataManager(data_folder)
+    for fname, lname in [("Ann", "Moss"), ("Bob", "Cole"), ("Cat", "Young")]:
+        manager.add_employee(fname, lname, "Baker", "01-01-2020")
+
+    def listing():
+        success, employees, error = manager.get_sorted_employees("lname")
+        assert success, error
+        return [employee.staff_id for employee in employees]
+
+    assert listing() == ["E002", "E001", "E003"]
+    manager.update_employee("E003", new_lname="Adams")
+    assert listing() == ["E003", "E002", "E001"]
+    manager.delete_employee("E002")
+    assert listing() == ["E003", "E001"]
@@ -0,0 +1,135 @@
+import csv
+import io
+
+import pytest
+
+from data_manager import DataManager
+from schedule import SCHEDULE_FIELDS
+from server import serve
+from storage import CsvStorage, read_schedules
+
+
+def test_shipped_employees_round_trip(shipped_data):
+    storage = CsvStorage(shipped_data)
+    employees = [employee.to_values() for employee in storage.get_all_employees()]
+    assert employees and all(values[0] for values in employees)
+
+    storage.save_employees([dict(employee) for employee in storage.get_all_employees()])
+    assert [employee.to_values() for employee in CsvStorage(shipped_data).get_all_employees()] == employees
+
+
+def test_legacy_schedules_file_is_refused_not_rewritten(shipped_data):
+    schedules_file = shipped_data / "schedules.csv"
+    before = schedules_file.read_bytes()
+
+    with pytest.raises(ValueError, match="schedule_id"):
+        CsvStorage(shipped_data).load_schedules()
+
+    manager = DataManager(shipped_data)
+    success, repriced, error = manager.reprice_schedules("Baker")
+    assert not success and "schedule_id" in error
+    success, _ = manager.compact_schedules()
+    assert not success
+    assert schedules_file.read_bytes() == before
+
+
+
+def test_migration_upgrades_shipped_schedules(shipped_data):
+    manager = DataManager(shipped_data)
+    success, changed, note = manager.migrate_legacy_dates()
+    assert success, note
+    assert "Gave schedule IDs to 1 " in note
+
+    expected = [['S001', 'E001', '01-01-2000', 4.0, 8.0, 8.0, 8.0, 8.0, 0.0, 6.0, 42.0, 690.0]]
+    assert [row.to_values() for row in CsvStorage(shipped_data).load_schedules()] == expected
+
+    # Running it again changes nothing, and the file now reads, compacts and saves as usual
+    schedules_file = shipped_data / "schedules.csv"
+    migrated = schedules_file.read_bytes()
+    success, changed, note = manager.migrate_legacy_dates()
+    assert success and changed == 0 and note == ""
+    success, _ = manager.compact_schedules()
+    assert success
+    storage = CsvStorage(shipped_data)
+    storage.save_schedules(storage.load_schedules())
+    assert schedules_file.read_bytes() == migrated
+
+    # New IDs follow on from the ones just given
+    assert manager.generate_schedule_id() == "S002"
+
+
+def test_legacy_schedules_are_only_upgraded_on_request(shipped_data):
+    manager = DataManager(shipped_data)
+    success, error = manager.check_data_layout()
+    assert not success and "migrate-dates" in error
+
+    # The server refuses the folder with the same advice, before opening a port
+    success, error = serve(str(shipped_data), port=0)
+    assert not success and "migrate-dates" in error
+    with pytest.raises(ValueError, match="migrate-dates"):
+        CsvStorage(shipped_data).load_schedules()
+
+    success, changed, note = manager.migrate_legacy_dates()
+    assert success, note
+    assert manager.check_data_layout() == (True, "")
+
+def test_legacy_column_names_are_mapped():
+    data = io.StringIO(
+        "schedule_id,employee_id,week_start_date,mon_hours,tue_hours,wed_hours,thu_hours,"
+        "fri_hours,sat_hours,sun_hours,total_hours,total_pay\r\n"
+        "S001,E001,01-01-2000,4.0,8.0,8.0,8.0,8.0,0.0,6.0,42.0,690.0\r\n"
+    )
+    (schedule,) = read_schedules(data)
+    assert schedule.to_values() == ['S001', 'E001', '01-01-2000', 4.0, 8.0, 8.0, 8.0, 8.0, 0.0, 6.0, 42.0, 690.0]
+
+
+def test_reordered_columns_load():
+    fields = list(reversed(SCHEDULE_FIELDS))
+    row = {field: '0' for field in fields}
+    row.update(schedule_id='S001', employee_id='E001', week_start='01-01-2000', mon='3', total_pay='48')
+    data = io.StringIO()
+    writer = csv.DictWriter(data, fieldnames=fields)
+    writer.writeheader()
+    writer.writerow(row)
+    data.seek(0)
+
+    (schedule,) = read_schedules(data)
+    assert (schedule.schedule_id, schedule.week_start_date, schedule['mon'], schedule.total_pay) == \
+        ('S001', '01-01-2000', 3.0, 48.0)
+
+
+@pytest.mark.parametrize("row", [
+    ",E001,01-01-2000,1,0,0,0,0,0,0,1,16",
+    "S001,E001",
+])
+def test_rows_missing_required_values_raise(row):
+    data = io.StringIO(','.join(SCHEDULE_FIELDS) + "\n" + row + "\n")
+    with pytest.raises(ValueError, match="Row 2"):
+        list(read_schedules(data))
+
+
+def test_reprice_skips_rows_without_a_readable_week(shipped_data):
+    schedules_file = shipped_data / "schedules.csv"
+    with schedules_file.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(SCHEDULE_FIELDS)
+        writer.writerow(["S001", "E001", "03-01-2000", 4, 8, 8, 8, 8, 0, 6, 42, 1])
+        writer.writerow(["S002", "E001", "2000-01-10", 4, 8, 8, 8, 8, 0, 6, 42, 1])
+
+    manager = DataManager(shipped_data)
+    success, repriced, note = manager.reprice_schedules("Baker")
+    assert success and repriced == 1
+    assert "Skipped 1 " in note
+
+    success, schedules, error = manager.get_schedules()
+    assert success, error
+    by_id = {schedule.schedule_id: schedule for schedule in schedules}
+    assert by_id["S001"].total_pay != 1
+    assert by_id["S002"].to_values() == ["S002", "E001", "2000-01-10", 4, 8, 8, 8, 8, 0, 6, 42, 1]
+
+
+def test_employee_changes_report_what_happened(shipped_data):
+    manager = DataManager(shipped_data)
+    assert manager.update_employee("E001", new_job="Manager") == (True, "Employee updated successfully")
+    assert manager.delete_employee("E001") == (True, "Employee deleted successfully")
+    assert manager.delete_employee("E001") == (False, "Employee with ID E001 not found")
@@ -0,0 +1,67 @@
+import pytest
+
+from data_manager import DataManager
+from storage import CsvStorage
+
+
+def stored_ids(folder):
+    storage = CsvStorage(folder)
+    return ([employee.staff_id for employee in storage.get_all_employees()],
+            [schedule.schedule_id for schedule in storage.load_schedules()])
+
+
+def test_changes_are_written_when_the_block_ends(data_folder):
+    manager = DataManager(data_folder)
+    with manager.transaction():
+        success, msg = manager.add_employee("Ann", "Lee", "Baker", "01-01-2020")
+        assert success, msg
+        success, msg = manager.save_schedule({'employee_id': 'E001', 'week_start': '06-01-2020', 'mon': 5})
+        assert success, msg
+
+        # Reads inside the block see the buffered changes, the files don't yet
+        success, employee, error = manager.get_employee("E001")
+        assert success and employee.fname == "Ann"
+        assert stored_ids(data_folder) == ([], [])
+
+    assert stored_ids(data_folder) == (["E001"], ["S001"])
+
+
+def test_rollback_writes_nothing(data_folder):
+    manager = DataManager(data_folder)
+    with manager.transaction() as txn:
+        manager.add_employee("Ann", "Lee", "Baker", "01-01-2020")
+        txn.rollback()
+    assert stored_ids(data_folder) == ([], [])
+    assert manager.get_all_employees() == (True, [], "")
+
+
+def test_an_exception_writes_nothing(data_folder):
+    manager = DataManager(data_folder)
+    with pytest.raises(RuntimeError):
+        with manager.transaction():
+            manager.add_employee("Ann", "Lee", "Baker", "01-01-2020")
+            raise RuntimeError("stop")
+    assert stored_ids(data_folder) == ([], [])
+
+
+def test_nested_blocks_join_the_outer_transaction(data_folder):
+    manager = DataManager(data_folder)
+    with manager.transaction() as outer:
+        with manager.transaction() as inner:
+            assert inner is outer
+            manager.add_employee("Ann", "Lee", "Baker", "01-01-2020")
+        # Leaving the inner block doesn't write anything on its own
+        assert stored_ids(data_folder) == ([], [])
+        manager.add_employee("Bob", "Ray", "Baker", "01-01-2020")
+
+    assert stored_ids(data_folder) == (["E001", "E002"], [])
+
+
+def test_rollback_in_a_nested_block_discards_the_whole_transaction(data_folder):
+    manager = DataManager(data_folder)
+    with manager.transaction():
+        manager.add_employee("Ann", "Lee", "Baker", "01-01-2020")
+        with manager.transaction() as inner:
+            manager.add_employee("Bob", "Ray", "Baker", "01-01-2020")
+            inner.rollback()
+    assert stored_ids(data_folder) == ([], [])